@@ -0,0 +1,90 @@
+"""
+Measures pure request building throughput (requests/sec) of
+`BaseClient.build_request` for a few representative operations, with the
+operation's request template reused as in normal use, and recompiled on every
+call, which approximates building each request from scratch.
+
+No network traffic is involved, only the construction of the request config.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_build_request.py [--requests 200000]
+"""
+
+import argparse
+import time
+import typing
+
+import httpx
+
+from local_api_16_py.core import AuthKey, SyncBaseClient
+
+OPERATIONS: typing.Dict[str, typing.Dict[str, typing.Any]] = {
+    "inventory list": {
+        "method": "GET",
+        "path": "/store/inventory",
+        "auth_names": ["api_key"],
+    },
+    "pet get": {
+        "method": "GET",
+        "path": "/pet/{petId}",
+        "path_params": {"petId": 123},
+        "auth_names": ["api_key"],
+    },
+    "pet find by status": {
+        "method": "GET",
+        "path": "/pet/findByStatus",
+        "auth_names": ["api_key"],
+        "query_params": {"status": "available"},
+    },
+    "pet create": {
+        "method": "POST",
+        "path": "/pet",
+        "auth_names": ["api_key"],
+        "json": {"id": 10, "name": "doggie", "photoUrls": []},
+        "content_type": "application/json",
+    },
+}
+
+
+def build_client() -> SyncBaseClient:
+    client = SyncBaseClient(
+        base_url="http://127.0.0.1:8082/v1/mock/local/local-api-16/0.1.0",
+        httpx_client=httpx.Client(),
+    )
+    client.register_auth(
+        "api_key", AuthKey(name="api_key", location="header", val="secret")
+    )
+    return client
+
+
+def bench(
+    client: SyncBaseClient,
+    operation: typing.Dict[str, typing.Any],
+    requests: int,
+    *,
+    recompile: bool,
+) -> float:
+    templates = client._templates
+    start = time.perf_counter()
+    for _ in range(requests):
+        if recompile:
+            templates.clear()
+        client.build_request(request_options={}, **operation)
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    client = build_client()
+    print(f"{'operation':>20} {'templated req/s':>16} {'recompiled req/s':>17}")
+    for name, operation in OPERATIONS.items():
+        templated = bench(client, operation, args.requests, recompile=False)
+        recompiled = bench(client, operation, args.requests, recompile=True)
+        print(f"{name:>20} {templated:>16,.0f} {recompiled:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
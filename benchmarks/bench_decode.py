@@ -0,0 +1,94 @@
+"""
+Compares decoding a large `find_by_status` style payload through the
+JSON-bytes path (`from_json`) against the previous dict-tree path
+(`response.json()` followed by `from_encodable`).
+
+Reports wall time and peak traced allocations for each path.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_decode.py [--pets 50000] [--rounds 3]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from local_api_16_py.core import from_encodable, from_json
+from local_api_16_py.types import models
+
+
+CAST_TO = typing.List[models.Pet]
+
+
+def build_payload(pets: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "name": f"pet-{i}",
+                "category": {"id": i % 7, "name": "Dogs"},
+                "photoUrls": [f"https://example.com/{i}.png"],
+                "tags": [{"id": i % 13, "name": "tag"}],
+                "status": "available",
+            }
+            for i in range(pets)
+        ]
+    ).encode()
+
+
+def decode_dict_tree(response: httpx.Response) -> typing.Any:
+    return from_encodable(data=response.json(), load_with=CAST_TO)
+
+
+def decode_json_bytes(response: httpx.Response) -> typing.Any:
+    return from_json(content=response.content, load_with=CAST_TO)
+
+
+def measure(
+    decode: typing.Callable[[httpx.Response], typing.Any], payload: bytes, rounds: int
+) -> typing.Tuple[float, int]:
+    response = httpx.Response(
+        200, content=payload, headers={"content-type": "application/json"}
+    )
+    decode(response)  # warm the decoder registry
+
+    best = float("inf")
+    peak = 0
+    for _ in range(rounds):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = decode(response)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del result
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = build_payload(args.pets)
+    print(f"payload: {args.pets} pets, {len(payload) / 1e6:.1f} MB")
+
+    results = {
+        "response.json() + from_encodable": measure(
+            decode_dict_tree, payload, args.rounds
+        ),
+        "from_json (validate_json)": measure(decode_json_bytes, payload, args.rounds),
+    }
+    for name, (seconds, peak) in results.items():
+        print(f"{name:<36} {seconds * 1e3:8.1f} ms  peak {peak / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures the latency percentiles of GET requests made by the asynchronous
+client with and without hedging, against a simulated upstream whose latency
+has a long tail: most requests answer within a few milliseconds, a small
+fraction stall. Also reports the extra upstream requests hedging costs.
+
+The upstream is an in-process mock transport, so the numbers only reflect
+the latency distribution it simulates, not a real network.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_hedge.py [--requests 2000] [--concurrency 20] [--slow-rate 0.02]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import typing
+
+import httpx
+
+from local_api_16_py import AsyncClient
+
+PET = {"id": 1, "name": "doggie", "photoUrls": []}
+
+
+class Upstream:
+    """Answers after `fast` seconds, or `slow` seconds for a `slow_rate` fraction"""
+
+    def __init__(self, fast: float, slow: float, slow_rate: float, seed: int) -> None:
+        self.fast = fast
+        self.slow = slow
+        self.slow_rate = slow_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        stall = self._random.random() < self.slow_rate
+        await asyncio.sleep(self.slow if stall else self.fast)
+        return httpx.Response(200, json=PET)
+
+
+async def run(
+    args: argparse.Namespace, hedging: typing.Optional[typing.Dict[str, typing.Any]]
+) -> typing.Tuple[typing.List[float], int]:
+    upstream = Upstream(args.fast, args.slow, args.slow_rate, args.seed)
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+        hedging=hedging,  # type: ignore[arg-type]
+    )
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: typing.List[float] = []
+
+    async def call(pet_id: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.pet.get(pet_id=pet_id)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(call(i) for i in range(args.requests)))
+    return latencies, upstream.calls
+
+
+def percentile(values: typing.List[float], q: float) -> float:
+    return statistics.quantiles(values, n=1000)[int(q * 1000) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--fast", type=float, default=0.005)
+    parser.add_argument("--slow", type=float, default=0.2)
+    parser.add_argument("--slow-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests} requests, {args.slow_rate:.0%} stalling for "
+        f"{args.slow * 1000:.0f} ms, others {args.fast * 1000:.0f} ms"
+    )
+    print(f"{'':>12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'extra requests':>15}")
+    for name, hedging in (
+        ("no hedging", None),
+        ("hedging", {"percentile": 0.95, "budget": 0.05, "min_samples": 20}),
+    ):
+        latencies, calls = asyncio.run(run(args, hedging))
+        p50, p95, p99 = (percentile(latencies, q) * 1000 for q in (0.5, 0.95, 0.99))
+        extra = calls / args.requests - 1
+        print(f"{name:>12} {p50:>8.1f} {p95:>8.1f} {p99:>8.1f} {extra:>15.1%}")
+
+
+if __name__ == "__main__":
+    main()
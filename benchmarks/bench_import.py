@@ -0,0 +1,114 @@
+"""
+Measures the cold start cost of the SDK: the time a fresh interpreter takes to
+import the package, to import and construct a client, and to reach a
+resource, along with the SDK modules each step loads. Every sample runs in a
+new interpreter so nothing is served from the module cache.
+
+With `--check` the run fails (exit code 1) when a step loads modules it
+should defer, e.g. importing the package loading HTTPX or constructing a
+client loading the resources and their pydantic models, or when a step's
+median exceeds its `--max-ms` budget. This guards the lazy loading against
+regressions.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_import.py [--runs 10] [--check] [--max-ms import_client=250]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import typing
+
+PACKAGE = "local_api_16_py"
+
+# statement timed in a fresh interpreter, and module prefixes it must not load
+STEPS: typing.Dict[str, typing.Tuple[str, typing.Tuple[str, ...]]] = {
+    "import_package": (
+        f"import {PACKAGE}",
+        ("httpx", "pydantic", "jsonpointer", f"{PACKAGE}."),
+    ),
+    "import_client": (
+        f"from {PACKAGE} import Client",
+        ("jsonpointer", f"{PACKAGE}.resources.", f"{PACKAGE}.types."),
+    ),
+    "construct_client": (
+        f"from {PACKAGE} import Client; Client(api_key='secret')",
+        ("jsonpointer", f"{PACKAGE}.resources.", f"{PACKAGE}.types."),
+    ),
+    "access_resource": (
+        f"from {PACKAGE} import Client; Client(api_key='secret').store.inventory",
+        (
+            "jsonpointer",
+            f"{PACKAGE}.resources.pet",
+            f"{PACKAGE}.resources.user",
+            f"{PACKAGE}.types.params.",
+            f"{PACKAGE}.types.models.pet",
+        ),
+    ),
+}
+
+SCRIPT = """
+import json, sys, time
+before = set(sys.modules)
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def sample(statement: str) -> typing.Dict[str, typing.Any]:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument(
+        "--max-ms",
+        action="append",
+        default=[],
+        metavar="STEP=MS",
+        help="budget for the median of a step, may be repeated",
+    )
+    args = parser.parse_args()
+    budgets = {
+        step: float(ms)
+        for step, ms in (budget.split("=", 1) for budget in args.max_ms)
+    }
+
+    failures: typing.List[str] = []
+    print(f"{'step':>16} {'median ms':>10} {'min ms':>8} {'SDK modules':>12}")
+    for step, (statement, forbidden) in STEPS.items():
+        samples = [sample(statement) for _ in range(args.runs)]
+        times = [s["ms"] for s in samples]
+        modules = samples[0]["modules"]
+        median = statistics.median(times)
+        own = [m for m in modules if m == PACKAGE or m.startswith(f"{PACKAGE}.")]
+        print(f"{step:>16} {median:>10.1f} {min(times):>8.1f} {len(own):>12}")
+
+        loaded = [m for m in modules for prefix in forbidden if m.startswith(prefix)]
+        if loaded:
+            failures.append(f"{step} loads {', '.join(sorted(set(loaded)))}")
+        if step in budgets and median > budgets[step]:
+            failures.append(f"{step} takes {median:.1f} ms > {budgets[step]:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
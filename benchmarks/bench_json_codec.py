@@ -0,0 +1,115 @@
+"""
+Compares the installed JSON backends on request payload throughput, both for
+encoding alone and end to end through `PetClient.create` and
+`UserClient.create_with_list` against an in-process mock transport (so no
+network traffic is involved).
+
+Backends which are not installed are skipped.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_json_codec.py [--users 1000] [--calls 200]
+"""
+
+import argparse
+import time
+import typing
+
+import httpx
+
+from local_api_16_py import Client
+from local_api_16_py.core import JsonCodec, get_json_codec, to_encodable
+from local_api_16_py.types import params
+
+BACKENDS = ("stdlib", "orjson", "msgspec")
+
+
+def build_users(users: int) -> typing.List[params.User]:
+    return [
+        {
+            "id": i,
+            "username": f"user-{i}",
+            "first_name": "Zoë",
+            "last_name": "Smith",
+            "email": f"user-{i}@example.com",
+            "password": "secret",
+            "phone": "555-0100",
+            "user_status": i % 3,
+        }
+        for i in range(users)
+    ]
+
+
+def build_pet() -> params.Pet:
+    return {
+        "id": 10,
+        "name": "doggie",
+        "category": {"id": 1, "name": "Dogs"},
+        "photo_urls": [f"https://example.com/{i}.png" for i in range(20)],
+        "tags": [{"id": i, "name": f"tag-{i}"} for i in range(20)],
+        "status": "available",
+    }
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    request.read()
+    return httpx.Response(200, json={"id": 10, "name": "doggie", "photoUrls": []})
+
+
+def build_client(codec: JsonCodec) -> Client:
+    return Client(
+        api_key="secret",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        json_codec=codec,
+    )
+
+
+def encode_mb_per_sec(codec: JsonCodec, payload: typing.Any, calls: int) -> float:
+    size = len(codec.dumps(payload))
+    start = time.perf_counter()
+    for _ in range(calls):
+        codec.dumps(payload)
+    return size * calls / (time.perf_counter() - start) / 1e6
+
+
+def calls_per_sec(fn: typing.Callable[[], typing.Any], calls: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    users = build_users(args.users)
+    pet = build_pet()
+    # the validated body, as handed to the codec by `create_with_list`
+    encoded_users = to_encodable(
+        item=users, dump_with=typing.List[params._SerializerUser]
+    )
+
+    print(
+        f"{'backend':>8} {'encode MB/s':>12} {'pet.create/s':>13} "
+        f"{'user.create_with_list/s':>24}"
+    )
+    for backend in BACKENDS:
+        try:
+            codec = get_json_codec(backend)  # type: ignore[arg-type]
+        except ImportError:
+            print(f"{backend:>8} {'not installed':>12}")
+            continue
+        client = build_client(codec)
+        encode = encode_mb_per_sec(codec, encoded_users, args.calls)
+        create = calls_per_sec(lambda: client.pet.create(**pet), args.calls * 10)
+        create_list = calls_per_sec(
+            lambda: client.user.create_with_list(data=users), args.calls
+        )
+        print(f"{backend:>8} {encode:>12,.1f} {create:>13,.0f} {create_list:>24,.1f}")
+
+
+if __name__ == "__main__":
+    main()
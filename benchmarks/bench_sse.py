@@ -0,0 +1,85 @@
+"""
+Measures Server-Sent Events throughput (events/sec) of the SSE tokenizer and
+of StreamResponse, which additionally decodes every event into a model,
+across a range of network chunk sizes.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_sse.py [--events 20000]
+"""
+
+import argparse
+import json
+import time
+import typing
+
+import httpx
+import pydantic
+
+from local_api_16_py.core import SSEDecoder, StreamResponse
+
+
+CHUNK_SIZES = [16, 256, 4096, 65536, 1048576]
+
+
+class Event(pydantic.BaseModel):
+    data: typing.Dict[str, typing.Any]
+    event: typing.Optional[str] = None
+    id: typing.Optional[str] = None
+
+
+class _NullContext:
+    def __exit__(self, *args: typing.Any) -> None:
+        pass
+
+
+def build_stream(events: int) -> bytes:
+    return b"".join(
+        (
+            f"event: pet\nid: {i}\n"
+            f"data: {json.dumps({'id': i, 'name': f'pet-{i}', 'status': 'available'})}"
+            "\n\n"
+        ).encode()
+        for i in range(events)
+    )
+
+
+def chunked(payload: bytes, size: int) -> typing.List[bytes]:
+    return [payload[i : i + size] for i in range(0, len(payload), size)]
+
+
+def bench_tokenizer(chunks: typing.List[bytes]) -> int:
+    decoder = SSEDecoder()
+    count = 0
+    for chunk in chunks:
+        count += len(decoder.feed(chunk))
+    return count + len(decoder.flush())
+
+
+def bench_stream_response(chunks: typing.List[bytes]) -> int:
+    response = httpx.Response(200, content=iter(chunks))
+    return sum(1 for _ in StreamResponse(response, _NullContext(), Event))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+
+    payload = build_stream(args.events)
+    print(f"stream: {args.events} events, {len(payload) / 1e6:.1f} MB")
+    print(f"{'chunk size':>12} {'tokenizer ev/s':>16} {'StreamResponse ev/s':>20}")
+
+    for size in CHUNK_SIZES:
+        chunks = chunked(payload, size)
+        rates = []
+        for bench in (bench_tokenizer, bench_stream_response):
+            start = time.perf_counter()
+            count = bench(chunks)
+            elapsed = time.perf_counter() - start
+            assert count == args.events, f"expected {args.events} events, got {count}"
+            rates.append(count / elapsed)
+        print(f"{size:>12} {rates[0]:>16,.0f} {rates[1]:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,57 @@
-from .client import AsyncClient, Client
-from .core import ApiError, BinaryResponse
-from .environment import Environment
+"""
+The package's exports are imported from their modules on first access, so
+importing the package alone loads neither HTTPX, pydantic nor the resources.
+"""
 
+import importlib
+import typing
 
-__all__ = ["ApiError", "AsyncClient", "BinaryResponse", "Client", "Environment"]
+if typing.TYPE_CHECKING:
+    from .client import AsyncClient, Client
+    from .core import (
+        ApiError,
+        BinaryResponse,
+        CircuitOpenError,
+        NotFoundError,
+        RateLimitedError,
+        ServerError,
+    )
+    from .environment import Environment
+
+_MODULES = {
+    "ApiError": ".core",
+    "AsyncClient": ".client",
+    "BinaryResponse": ".core",
+    "CircuitOpenError": ".core",
+    "Client": ".client",
+    "Environment": ".environment",
+    "NotFoundError": ".core",
+    "RateLimitedError": ".core",
+    "ServerError": ".core",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *__all__})
+
+
+__all__ = [
+    "ApiError",
+    "AsyncClient",
+    "BinaryResponse",
+    "CircuitOpenError",
+    "Client",
+    "Environment",
+    "NotFoundError",
+    "RateLimitedError",
+    "ServerError",
+]
@@ -1,11 +1,32 @@
+import functools
 import httpx
 import typing
 
-from local_api_16_py.core import AsyncBaseClient, AuthKey, SyncBaseClient
+from local_api_16_py.core import (
+    AsyncBaseClient,
+    DEFAULT_MAX_ERROR_BODY_SIZE,
+    AuthKey,
+    CircuitBreakerConfig,
+    HedgePolicy,
+    JsonBackend,
+    JsonCodec,
+    LoadBalancingConfig,
+    PoolStats,
+    RateLimitConfig,
+    RequestObserver,
+    ResponseCacheConfig,
+    RetryPolicy,
+    SyncBaseClient,
+    TelemetryConfig,
+)
 from local_api_16_py.environment import Environment, _get_base_url
-from local_api_16_py.resources.pet import AsyncPetClient, PetClient
-from local_api_16_py.resources.store import AsyncStoreClient, StoreClient
-from local_api_16_py.resources.user import AsyncUserClient, UserClient
+from local_api_16_py.invalidations import CACHE_INVALIDATIONS, CACHEABLE_PATHS
+from local_api_16_py.operations import OPERATION_NAMES
+
+if typing.TYPE_CHECKING:
+    from local_api_16_py.resources.pet import AsyncPetClient, PetClient
+    from local_api_16_py.resources.store import AsyncStoreClient, StoreClient
+    from local_api_16_py.resources.user import AsyncUserClient, UserClient
 
 
 class Client:
@@ -14,23 +35,143 @@ class Client:
         *,
         timeout: typing.Optional[float] = 60,
         httpx_client: typing.Optional[httpx.Client] = None,
-        base_url: typing.Optional[str] = None,
+        base_url: typing.Optional[typing.Union[str, typing.List[str]]] = None,
         environment: Environment = Environment.ENVIRONMENT,
         api_key: typing.Optional[str] = None,
+        max_connections: typing.Optional[int] = 100,
+        max_keepalive_connections: typing.Optional[int] = 20,
+        keepalive_expiry: typing.Optional[float] = 5.0,
+        http2: bool = False,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        response_cache: typing.Optional[ResponseCacheConfig] = None,
+        coalesce_requests: bool = False,
+        max_error_body_size: typing.Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        json_codec: typing.Union[JsonBackend, JsonCodec] = "stdlib",
+        rate_limit: typing.Optional[RateLimitConfig] = None,
+        circuit_breaker: typing.Optional[CircuitBreakerConfig] = None,
+        load_balancing: typing.Optional[LoadBalancingConfig] = None,
+        observers: typing.Optional[typing.List[RequestObserver]] = None,
+        telemetry: typing.Union[bool, TelemetryConfig] = False,
     ):
-        """Initialize root client"""
+        """Initialize root client
+
+        The connection pool options (`max_connections`, `max_keepalive_connections`,
+        `keepalive_expiry`) and `http2` configure the default HTTPX client and are
+        ignored when an `httpx_client` is provided. `http2` requires the `h2`
+        package (`pip install local_api_16_py[http2]`).
+
+        `retry_policy` overrides the defaults of `default_retry_policy()`, which
+        retries idempotent requests on 429/502/503/504 and transport errors.
+        Individual calls can override it through `request_options["retry"]`.
+
+        `response_cache` enables caching of GET responses (e.g. `{"ttl": 30}`),
+        honouring `Cache-Control` and revalidating stale entries with
+        `If-None-Match`/`If-Modified-Since`. Caching is disabled by default.
+        Mutating operations drop the cached reads they make stale, as declared
+        in `CACHE_INVALIDATIONS`, unless `response_cache["invalidations"]` is given.
+        Only the reads listed in `CACHEABLE_PATHS` are cached, which leaves out
+        `/user/login` and `/user/logout`, unless `response_cache["paths"]` is given.
+
+        `coalesce_requests` lets identical concurrent GET requests (same URL,
+        query and credentials) share a single upstream call and its result.
+
+        `max_error_body_size` caps the bytes of an error response body kept by
+        the raised `ApiError`, whole bodies are kept by default (None). A
+        truncated body is kept as `ApiError.content` with `truncated` set, but
+        `ApiError.body` is None unless the prefix is valid JSON. The body is
+        only decoded when `ApiError.body` is accessed.
+
+        `json_codec` selects the JSON backend encoding request bodies
+        ("stdlib" by default, "auto", "orjson" or "msgspec", or a `JsonCodec`).
+        "auto" uses orjson or msgspec when installed, falling back to the
+        standard library.
+
+        `rate_limit` paces requests client side with a client-wide budget
+        (e.g. `{"rate": 50, "burst": 10}`) and per-operation budgets keyed like
+        `"GET /pet/{petId}"`, shared by `pet`, `store` and `user`. The budgets
+        adapt to `X-RateLimit-*` and `Retry-After` response headers.
+
+        `circuit_breaker` fails requests fast with `CircuitOpenError` while
+        their upstream is degraded (e.g. `{"failure_rate": 0.5, "open_duration": 30}`).
+        Circuits are kept per service, or per operation with `per_operation`
+        or `operations`.
+
+        `base_url` may list several replicas of the API, between which
+        requests are spread according to `load_balancing` (e.g.
+        `{"strategy": "ewma"}`, round-robin by default). Endpoints failing
+        repeatedly are ejected for a while and then tried again.
+
+        `observers` are called with the phase timings of every request
+        (`RequestTiming`), tagged with the operation name (e.g.
+        `"pet.find_by_status"`), status code and payload sizes. Observers can
+        also be added later with `add_observer`. Timing is skipped entirely
+        while there are none.
+
+        `telemetry` (True, or a `TelemetryConfig` giving tracer and meter
+        providers) records an OpenTelemetry client span and HTTP client
+        metrics for every request and propagates the trace context in the
+        request headers. It is a no-op unless `opentelemetry-api` is installed.
+        """
         self._base_client = SyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.Client(timeout=timeout)
+            httpx_client=httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=http2,
+            )
             if httpx_client is None
             else httpx_client,
+            retry_policy=retry_policy,
+            response_cache=None
+            if response_cache is None
+            else {
+                "invalidations": CACHE_INVALIDATIONS,
+                "paths": CACHEABLE_PATHS,
+                **response_cache,
+            },
+            coalesce_requests=coalesce_requests,
+            max_error_body_size=max_error_body_size,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            load_balancing=load_balancing,
+            operation_names=OPERATION_NAMES,
+            observers=observers,
+            telemetry=telemetry,
         )
         self._base_client.register_auth(
             "api_key", AuthKey(name="api_key", location="header", val=api_key)
         )
-        self.pet = PetClient(base_client=self._base_client)
-        self.store = StoreClient(base_client=self._base_client)
-        self.user = UserClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def pet(self) -> "PetClient":
+        from local_api_16_py.resources.pet import PetClient
+
+        return PetClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def store(self) -> "StoreClient":
+        from local_api_16_py.resources.store import StoreClient
+
+        return StoreClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def user(self) -> "UserClient":
+        from local_api_16_py.resources.user import UserClient
+
+        return UserClient(base_client=self._base_client)
+
+    def pool_stats(self) -> PoolStats:
+        """Report the connections currently held by the HTTPX client's pool.
+
+        Returns:
+            Counts of open, in-use, idle and HTTP/2 connections
+        """
+        return self._base_client.pool_stats()
 
 
 class AsyncClient:
@@ -39,20 +180,149 @@ class AsyncClient:
         *,
         timeout: typing.Optional[float] = 60,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
-        base_url: typing.Optional[str] = None,
+        base_url: typing.Optional[typing.Union[str, typing.List[str]]] = None,
         environment: Environment = Environment.ENVIRONMENT,
         api_key: typing.Optional[str] = None,
+        max_connections: typing.Optional[int] = 100,
+        max_keepalive_connections: typing.Optional[int] = 20,
+        keepalive_expiry: typing.Optional[float] = 5.0,
+        http2: bool = False,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        response_cache: typing.Optional[ResponseCacheConfig] = None,
+        coalesce_requests: bool = False,
+        max_error_body_size: typing.Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        json_codec: typing.Union[JsonBackend, JsonCodec] = "stdlib",
+        rate_limit: typing.Optional[RateLimitConfig] = None,
+        circuit_breaker: typing.Optional[CircuitBreakerConfig] = None,
+        load_balancing: typing.Optional[LoadBalancingConfig] = None,
+        observers: typing.Optional[typing.List[RequestObserver]] = None,
+        telemetry: typing.Union[bool, TelemetryConfig] = False,
+        hedging: typing.Optional[HedgePolicy] = None,
     ):
-        """Initialize root client"""
+        """Initialize root client
+
+        The connection pool options (`max_connections`, `max_keepalive_connections`,
+        `keepalive_expiry`) and `http2` configure the default HTTPX client and are
+        ignored when an `httpx_client` is provided. `http2` requires the `h2`
+        package (`pip install local_api_16_py[http2]`).
+
+        `retry_policy` overrides the defaults of `default_retry_policy()`, which
+        retries idempotent requests on 429/502/503/504 and transport errors.
+        Individual calls can override it through `request_options["retry"]`.
+
+        `response_cache` enables caching of GET responses (e.g. `{"ttl": 30}`),
+        honouring `Cache-Control` and revalidating stale entries with
+        `If-None-Match`/`If-Modified-Since`. Caching is disabled by default.
+        Mutating operations drop the cached reads they make stale, as declared
+        in `CACHE_INVALIDATIONS`, unless `response_cache["invalidations"]` is given.
+        Only the reads listed in `CACHEABLE_PATHS` are cached, which leaves out
+        `/user/login` and `/user/logout`, unless `response_cache["paths"]` is given.
+
+        `coalesce_requests` lets identical concurrent GET requests (same URL,
+        query and credentials) share a single upstream call and its result.
+
+        `max_error_body_size` caps the bytes of an error response body kept by
+        the raised `ApiError`, whole bodies are kept by default (None). A
+        truncated body is kept as `ApiError.content` with `truncated` set, but
+        `ApiError.body` is None unless the prefix is valid JSON. The body is
+        only decoded when `ApiError.body` is accessed.
+
+        `json_codec` selects the JSON backend encoding request bodies
+        ("stdlib" by default, "auto", "orjson" or "msgspec", or a `JsonCodec`).
+        "auto" uses orjson or msgspec when installed, falling back to the
+        standard library.
+
+        `rate_limit` paces requests client side with a client-wide budget
+        (e.g. `{"rate": 50, "burst": 10}`) and per-operation budgets keyed like
+        `"GET /pet/{petId}"`, shared by `pet`, `store` and `user`. The budgets
+        adapt to `X-RateLimit-*` and `Retry-After` response headers.
+
+        `circuit_breaker` fails requests fast with `CircuitOpenError` while
+        their upstream is degraded (e.g. `{"failure_rate": 0.5, "open_duration": 30}`).
+        Circuits are kept per service, or per operation with `per_operation`
+        or `operations`.
+
+        `base_url` may list several replicas of the API, between which
+        requests are spread according to `load_balancing` (e.g.
+        `{"strategy": "ewma"}`, round-robin by default). Endpoints failing
+        repeatedly are ejected for a while and then tried again.
+
+        `observers` are called with the phase timings of every request
+        (`RequestTiming`), tagged with the operation name (e.g.
+        `"pet.find_by_status"`), status code and payload sizes. Observers can
+        also be added later with `add_observer`. Timing is skipped entirely
+        while there are none.
+
+        `telemetry` (True, or a `TelemetryConfig` giving tracer and meter
+        providers) records an OpenTelemetry client span and HTTP client
+        metrics for every request and propagates the trace context in the
+        request headers. It is a no-op unless `opentelemetry-api` is installed.
+
+        `hedging` enables hedged GET requests (e.g. `{"percentile": 0.95}`): a
+        request slower than the operation's latency percentile is duplicated,
+        the first response wins (a 5xx or retryable status only once the
+        other request failed too) and the other request is cancelled. Extra
+        load is capped by the policy's `budget`, and hedges go through
+        `rate_limit` and `circuit_breaker` like any request.
+        """
         self._base_client = AsyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.AsyncClient(timeout=timeout)
+            httpx_client=httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=http2,
+            )
             if httpx_client is None
             else httpx_client,
+            retry_policy=retry_policy,
+            response_cache=None
+            if response_cache is None
+            else {
+                "invalidations": CACHE_INVALIDATIONS,
+                "paths": CACHEABLE_PATHS,
+                **response_cache,
+            },
+            coalesce_requests=coalesce_requests,
+            max_error_body_size=max_error_body_size,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            load_balancing=load_balancing,
+            operation_names=OPERATION_NAMES,
+            observers=observers,
+            telemetry=telemetry,
+            hedging=hedging,
         )
         self._base_client.register_auth(
             "api_key", AuthKey(name="api_key", location="header", val=api_key)
         )
-        self.pet = AsyncPetClient(base_client=self._base_client)
-        self.store = AsyncStoreClient(base_client=self._base_client)
-        self.user = AsyncUserClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def pet(self) -> "AsyncPetClient":
+        from local_api_16_py.resources.pet import AsyncPetClient
+
+        return AsyncPetClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def store(self) -> "AsyncStoreClient":
+        from local_api_16_py.resources.store import AsyncStoreClient
+
+        return AsyncStoreClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def user(self) -> "AsyncUserClient":
+        from local_api_16_py.resources.user import AsyncUserClient
+
+        return AsyncUserClient(base_client=self._base_client)
+
+    def pool_stats(self) -> PoolStats:
+        """Report the connections currently held by the HTTPX client's pool.
+
+        Returns:
+            Counts of open, in-use, idle and HTTP/2 connections
+        """
+        return self._base_client.pool_stats()
@@ -1,4 +1,11 @@
-from .api_error import ApiError
+from .adapter_cache import AdapterCache, AdapterCacheStats
+from .api_error import (
+    DEFAULT_MAX_ERROR_BODY_SIZE,
+    ApiError,
+    NotFoundError,
+    RateLimitedError,
+    ServerError,
+)
 from .auth import (
     AuthKey,
     AuthBasic,
@@ -9,24 +16,116 @@ from .auth import (
     OAuth2ClientCredentials,
     OAuth2Password,
 )
+from .batch import (
+    BatchGet,
+    BatchResult,
+    ChunkCheckpoint,
+    ChunkInfo,
+    as_completed_bounded,
+    as_completed_threaded,
+    gather_bounded,
+    map_chunks_bounded,
+    map_chunks_threaded,
+    map_threaded,
+)
+from .cache import (
+    CacheBackend,
+    CacheEntry,
+    CacheInvalidation,
+    InvalidationMap,
+    MemoryCache,
+    ResponseCacheConfig,
+    ResponseCacheStats,
+    default_response_cache_config,
+)
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakers,
+    CircuitBreakerState,
+    CircuitBreakerThresholds,
+    CircuitOpenError,
+    CircuitState,
+    default_circuit_breaker_config,
+)
+from .coalesce import AsyncRequestCoalescer, CoalesceStats, RequestCoalescer
 from .base_client import AsyncBaseClient, BaseClient, SyncBaseClient
-from .binary_response import BinaryResponse
+from .binary_response import DEFAULT_SPILL_THRESHOLD, BinaryResponse, WriteTarget
+from .hedge import HedgePolicy, HedgeStats, Hedger, default_hedge_policy
+from .json_codec import (
+    JsonBackend,
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+)
+from .json_stream import (
+    AsyncJsonArrayStreamResponse,
+    JsonArrayParser,
+    JsonArrayStreamResponse,
+)
+from .load_balancer import (
+    BalancingStrategy,
+    EndpointStats,
+    LoadBalancer,
+    LoadBalancingConfig,
+    default_load_balancing_config,
+)
+from .observer import PhaseTimer, RequestObserver, RequestTiming
+from .pool import PoolStats, get_pool_stats
+from .rate_limit import (
+    Gcra,
+    RateLimit,
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitStats,
+    default_rate_limit_config,
+)
 from .query import encode_query_param, QueryParams
+from .retry import RetryPolicy, RetryStats, default_retry_policy
 from .request import (
     filter_not_given,
+    to_async_content,
     to_content,
     to_encodable,
     to_form_urlencoded,
     RequestOptions,
     default_request_options,
+    request_encoders,
+    set_primitive_fast_path,
+)
+from .request_template import RequestTemplate
+from .telemetry import Telemetry, TelemetryConfig, create_telemetry
+from .upload import (
+    AsyncFileStream,
+    AsyncUploadSource,
+    FileStream,
+    UploadProgress,
+    UploadSource,
+)
+from .sse import SSEDecoder, ServerSentEvent
+from .response import (
+    from_encodable,
+    from_json,
+    response_decoders,
+    AsyncStreamResponse,
+    StreamResponse,
 )
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
 
 __all__ = [
+    "AdapterCache",
+    "AdapterCacheStats",
     "ApiError",
+    "DEFAULT_MAX_ERROR_BODY_SIZE",
+    "NotFoundError",
+    "RateLimitedError",
+    "ServerError",
     "AsyncBaseClient",
     "BaseClient",
     "BinaryResponse",
+    "DEFAULT_SPILL_THRESHOLD",
+    "WriteTarget",
     "RequestOptions",
     "default_request_options",
     "SyncBaseClient",
@@ -40,11 +139,88 @@ __all__ = [
     "OAuth2Password",
     "to_encodable",
     "to_form_urlencoded",
+    "request_encoders",
+    "set_primitive_fast_path",
+    "RequestTemplate",
     "filter_not_given",
     "to_content",
+    "to_async_content",
+    "FileStream",
+    "AsyncFileStream",
+    "UploadProgress",
+    "UploadSource",
+    "AsyncUploadSource",
     "encode_query_param",
     "from_encodable",
+    "from_json",
+    "response_decoders",
     "AsyncStreamResponse",
     "StreamResponse",
+    "Telemetry",
+    "TelemetryConfig",
+    "create_telemetry",
+    "SSEDecoder",
+    "ServerSentEvent",
+    "AsyncJsonArrayStreamResponse",
+    "HedgePolicy",
+    "HedgeStats",
+    "Hedger",
+    "default_hedge_policy",
+    "JsonBackend",
+    "JsonCodec",
+    "MsgspecJsonCodec",
+    "OrjsonJsonCodec",
+    "StdlibJsonCodec",
+    "get_json_codec",
+    "JsonArrayParser",
+    "JsonArrayStreamResponse",
     "QueryParams",
+    "BalancingStrategy",
+    "EndpointStats",
+    "LoadBalancer",
+    "LoadBalancingConfig",
+    "default_load_balancing_config",
+    "PhaseTimer",
+    "RequestObserver",
+    "RequestTiming",
+    "PoolStats",
+    "get_pool_stats",
+    "RetryPolicy",
+    "RetryStats",
+    "default_retry_policy",
+    "Gcra",
+    "RateLimit",
+    "RateLimitConfig",
+    "RateLimiter",
+    "RateLimitStats",
+    "default_rate_limit_config",
+    "BatchGet",
+    "BatchResult",
+    "ChunkCheckpoint",
+    "ChunkInfo",
+    "as_completed_bounded",
+    "as_completed_threaded",
+    "gather_bounded",
+    "map_chunks_bounded",
+    "map_chunks_threaded",
+    "map_threaded",
+    "CacheBackend",
+    "CacheEntry",
+    "CacheInvalidation",
+    "InvalidationMap",
+    "MemoryCache",
+    "ResponseCacheConfig",
+    "ResponseCacheStats",
+    "default_response_cache_config",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitBreakers",
+    "CircuitBreakerState",
+    "CircuitBreakerThresholds",
+    "CircuitOpenError",
+    "CircuitState",
+    "default_circuit_breaker_config",
+    "AsyncRequestCoalescer",
+    "CoalesceStats",
+    "RequestCoalescer",
 ]
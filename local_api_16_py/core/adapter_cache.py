@@ -0,0 +1,99 @@
+"""
+Process-wide caching of pydantic TypeAdapters.
+
+Building a TypeAdapter compiles a pydantic-core validator/serializer for the
+target type, which is far more expensive than using it. Caches defined here
+let that cost be paid once per type rather than once per call.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+
+class AdapterCacheStats(TypedDict):
+    """
+    Snapshot of an AdapterCache's counters.
+
+    Attributes:
+        hits: Number of lookups served by an already built adapter
+        misses: Number of lookups that had to build a new adapter
+        size: Number of adapters currently held by the cache
+        maxsize: Upper bound on the number of held adapters, None if unbounded
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: Optional[int]
+
+
+class AdapterCache:
+    """
+    Thread-safe registry of TypeAdapters keyed by the type they adapt.
+
+    When `maxsize` is set the cache evicts its least recently used adapter
+    once full. Types which cannot be hashed (and therefore cannot be used as
+    a key) are still adapted, they are simply rebuilt on every lookup and
+    counted as a miss.
+    """
+
+    def __init__(self, *, maxsize: Optional[int] = None) -> None:
+        self._adapters: "OrderedDict[Any, TypeAdapter]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, type_: Any) -> TypeAdapter:
+        """
+        Returns the adapter for `type_`, building and storing it on first use.
+        """
+        try:
+            with self._lock:
+                adapter = self._adapters.get(type_)
+                if adapter is not None:
+                    self._hits += 1
+                    if self._maxsize is not None:
+                        self._adapters.move_to_end(type_)
+                    return adapter
+        except TypeError:
+            # unhashable type, cannot be cached
+            with self._lock:
+                self._misses += 1
+            return TypeAdapter(type_)
+
+        # build outside of the lock, schema generation can be slow and may
+        # recursively require other adapters
+        adapter = TypeAdapter(type_)
+        with self._lock:
+            self._misses += 1
+            adapter = self._adapters.setdefault(type_, adapter)
+            if self._maxsize is not None:
+                while len(self._adapters) > self._maxsize:
+                    self._adapters.popitem(last=False)
+            return adapter
+
+    def stats(self) -> AdapterCacheStats:
+        """
+        Returns the current hit/miss counters and size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._adapters),
+                "maxsize": self._maxsize,
+            }
+
+    def clear(self) -> None:
+        """
+        Drops all cached adapters and resets the counters
+        """
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
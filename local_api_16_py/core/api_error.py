@@ -2,10 +2,23 @@
 Generated by Sideko (sideko.dev)
 """
 
-from json import JSONDecodeError
 import typing
 import httpx
 
+from .json_codec import JsonCodec, get_json_codec
+from .retry import parse_retry_after
+
+DEFAULT_MAX_ERROR_BODY_SIZE: typing.Optional[int] = None
+"""
+Number of bytes of an error response body captured by default, None to
+capture whole bodies so `body` always holds the complete decoded error
+"""
+
+_NOT_DECODED = object()
+
+# headers describing the original body, which no longer apply to a captured prefix
+_BODY_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
 
 class ApiError(Exception):
     """
@@ -14,36 +27,108 @@ class ApiError(Exception):
     This class extends the base Exception class to provide additional context
     for API errors, including the HTTP status code and response body.
 
+    The body is captured up to a size limit and only decoded when `body` is
+    first accessed, so raising and handling errors stays cheap.
+
     Attributes:
         status_code: The HTTP status code associated with the error.
             None if no status code is applicable.
         body: The response body or error message content.
             Can be any type depending on the API response format.
+        content: The captured raw response body, at most `max_body_size` bytes
+        truncated: Whether the response body was larger than the captured content
         response: The raw httpx response object. See https://www.python-httpx.org/api/#response for object reference
     """
 
     status_code: typing.Optional[int]
-    body: typing.Any
+    content: bytes
+    truncated: bool
     response: httpx.Response
 
-    def __init__(self, *, response: httpx.Response) -> None:
+    def __init__(
+        self,
+        *,
+        response: httpx.Response,
+        max_body_size: typing.Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        content: typing.Optional[bytes] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+    ) -> None:
         """
-        Initialize the ApiError with optional status code and body.
+        Initialize the ApiError from an error response.
 
         Args:
-            status_code: The HTTP status code of the error.
-                Defaults to None.
+            response: The error response
+            max_body_size: Maximum number of body bytes to capture, None to
+                capture the whole body
+            content: The body already read from a streamed response, read
+                from `response` when omitted
+            json_codec: Codec decoding the body, the stdlib one by default
 
         Note:
             The asterisk (*) in the parameters forces keyword arguments,
             making the instantiation more explicit.
         """
-        try:
-            self.body = response.json()
-        except JSONDecodeError:
-            self.body = None
+        captured = response.content if content is None else content
+        self.truncated = max_body_size is not None and len(captured) > max_body_size
+        if self.truncated:
+            captured = captured[:max_body_size]
+        self.content = captured
         self.status_code = response.status_code
-        self.response = response
+        self.response = (
+            _captured_response(response, captured)
+            if self.truncated or content is not None
+            else response
+        )
+        self._json_codec = json_codec or get_json_codec("stdlib")
+        self._body: typing.Any = _NOT_DECODED
+
+    @classmethod
+    def from_response(
+        cls,
+        response: httpx.Response,
+        *,
+        max_body_size: typing.Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        content: typing.Optional[bytes] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+    ) -> "ApiError":
+        """
+        Build the error matching the status code of a response, e.g. a
+        `NotFoundError` for a 404, falling back to `ApiError`.
+
+        Args:
+            response: The error response
+            max_body_size: Maximum number of body bytes to capture, None to
+                capture the whole body
+            content: The body already read from a streamed response
+            json_codec: Codec decoding the body, the stdlib one by default
+        """
+        status = response.status_code
+        error_cls = _STATUS_ERRORS.get(status)
+        if error_cls is None:
+            error_cls = ServerError if status >= 500 else ApiError
+        return error_cls(
+            response=response,
+            max_body_size=max_body_size,
+            content=content,
+            json_codec=json_codec,
+        )
+
+    @property
+    def body(self) -> typing.Any:
+        """The JSON decoded body, None if it is not valid JSON"""
+        if self._body is _NOT_DECODED:
+            try:
+                self._body = (
+                    self._json_codec.loads(self.content) if self.content else None
+                )
+            except ValueError:
+                # invalid JSON, including undecodable text
+                self._body = None
+        return self._body
+
+    @body.setter
+    def body(self, value: typing.Any) -> None:
+        self._body = value
 
     def __str__(self) -> str:
         """
@@ -54,3 +139,81 @@ class ApiError(Exception):
                 Format: "status_code: {status_code}, body: {body}"
         """
         return f"status_code: {self.status_code}, body: {self.body}"
+
+
+class NotFoundError(ApiError):
+    """Raised for `404 Not Found` responses"""
+
+
+class RateLimitedError(ApiError):
+    """Raised for `429 Too Many Requests` responses"""
+
+    @property
+    def retry_after(self) -> typing.Optional[float]:
+        """Seconds to wait before retrying as given by `Retry-After`, if any"""
+        return parse_retry_after(self.response.headers.get("retry-after"))
+
+
+class ServerError(ApiError):
+    """Raised for `5xx` responses"""
+
+
+_STATUS_ERRORS: typing.Dict[int, typing.Type[ApiError]] = {
+    404: NotFoundError,
+    429: RateLimitedError,
+}
+
+
+def read_error_body(
+    response: httpx.Response, max_body_size: typing.Optional[int]
+) -> bytes:
+    """
+    Read the body of a streamed error response, stopping once more than
+    `max_body_size` bytes have been read.
+    """
+    if max_body_size is None:
+        return response.read()
+    content = bytearray()
+    for chunk in response.iter_bytes():
+        content += chunk
+        if len(content) > max_body_size:
+            break
+    return bytes(content)
+
+
+async def aread_error_body(
+    response: httpx.Response, max_body_size: typing.Optional[int]
+) -> bytes:
+    """Asynchronous version of `read_error_body`"""
+    if max_body_size is None:
+        return await response.aread()
+    content = bytearray()
+    async for chunk in response.aiter_bytes():
+        content += chunk
+        if len(content) > max_body_size:
+            break
+    return bytes(content)
+
+
+def _captured_response(response: httpx.Response, content: bytes) -> httpx.Response:
+    """
+    A copy of the response holding only the captured body, so the error does
+    not keep the whole body alive.
+    """
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in _BODY_HEADERS
+    ]
+    captured = httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=content,
+        extensions=response.extensions,
+    )
+    try:
+        captured.request = response.request
+    except RuntimeError:
+        # the response was built without a request
+        pass
+    return captured
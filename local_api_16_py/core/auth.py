@@ -1,13 +1,18 @@
 """Generated by Sideko (sideko.dev)"""
 
 import abc
+import asyncio
 import datetime
+import logging
+import threading
+import weakref
 from typing import Any, Dict, TypedDict, Optional, List, Tuple, Literal, Union, cast
 
-import jsonpointer  # type: ignore
 import httpx
 from .request import RequestConfig
 
+logger = logging.getLogger(__name__)
+
 
 class AuthProvider(abc.ABC):
     """
@@ -38,6 +43,33 @@ class AuthProvider(abc.ABC):
             val: Authentication value to set
         """
 
+    def credential(self) -> Optional[Tuple[Literal["query", "header", "cookie"], str]]:
+        """
+        Where the provider adds its credential to a request, as the location
+        and name of the parameter carrying it, None when it is not added as a
+        parameter (e.g. HTTP Basic authentication). Used to keep credentials
+        out of response cache keys.
+        """
+        return None
+
+    def prepare(self, client: httpx.Client) -> None:
+        """
+        Hook called by the synchronous client before a request is built, allowing
+        providers to fetch credentials ahead of `add_to_request`.
+
+        Args:
+            client: The client's HTTPX client, to reuse its connection pool
+        """
+
+    async def aprepare(self, client: httpx.AsyncClient) -> None:
+        """
+        Hook awaited by the asynchronous client before a request is built,
+        allowing providers to fetch credentials without blocking the event loop.
+
+        Args:
+            client: The client's HTTPX client, to reuse its connection pool
+        """
+
 
 class AuthBasic(AuthProvider):
     """
@@ -100,6 +132,9 @@ class AuthBearer(AuthProvider):
             cfg["headers"] = headers
         return cfg
 
+    def credential(self) -> Optional[Tuple[Literal["query", "header", "cookie"], str]]:
+        return ("header", "Authorization")
+
     def set_value(self, val: Optional[str]) -> None:
         """
         Sets value as the bearer token
@@ -151,6 +186,9 @@ class AuthKey(AuthProvider):
 
         return cfg
 
+    def credential(self) -> Optional[Tuple[Literal["query", "header", "cookie"], str]]:
+        return (self.location, self.name)
+
     def set_value(self, val: Optional[str]) -> None:
         """
         Sets value as the key
@@ -230,6 +268,10 @@ class OAuth2(AuthProvider):
     # access_token storage
     access_token: Optional[str]
     expires_at: Optional[datetime.datetime]
+    refresh_ahead: datetime.timedelta
+    """
+    How long before `expires_at` a new token is fetched in the background
+    """
 
     def __init__(
         self,
@@ -242,6 +284,7 @@ class OAuth2(AuthProvider):
         body_content: BodyContent,
         request_mutator: AuthProvider,
         form: Optional[Union[OAuth2Password, OAuth2ClientCredentials]] = None,
+        refresh_ahead_secs: float = 30,
     ):
         super().__init__()
 
@@ -271,8 +314,16 @@ class OAuth2(AuthProvider):
 
         self.access_token = None
         self.expires_at = None
+        self.refresh_ahead = datetime.timedelta(seconds=refresh_ahead_secs)
 
-    def _refresh(self) -> Tuple[str, datetime.datetime]:
+        # single-flight guards, ensuring concurrent requests share one refresh
+        self._lock = threading.Lock()
+        self._async_locks: "weakref.WeakKeyDictionary[Any, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._background_task: Optional["asyncio.Future[None]"] = None
+
+    def _token_request(self) -> Dict[str, Any]:
         # build token url using base_url if relative
         url = self.token_url
         if url.startswith("/"):
@@ -306,8 +357,12 @@ class OAuth2(AuthProvider):
             req_cfg["data"] = req_data
             req_cfg["headers"] = {"content-type": "application/x-www-form-urlencoded"}
 
-        # make access token request
-        token_res = httpx.post(**req_cfg)
+        return req_cfg
+
+    def _parse_token(self, token_res: httpx.Response) -> Tuple[str, datetime.datetime]:
+        # only OAuth2 clients need jsonpointer, keep it out of the package import
+        import jsonpointer  # type: ignore
+
         token_res.raise_for_status()
 
         # retrieve access token & optional expiry seconds
@@ -329,26 +384,141 @@ class OAuth2(AuthProvider):
 
         return (access_token, expires_at)
 
-    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
-        if (
+    def _refresh(
+        self, client: Optional[httpx.Client] = None
+    ) -> Tuple[str, datetime.datetime]:
+        # make access token request, reusing the client's connection pool if given
+        req_cfg = self._token_request()
+        if client is not None:
+            token_res = client.post(**req_cfg)
+        else:
+            token_res = httpx.post(**req_cfg)
+        return self._parse_token(token_res)
+
+    async def _arefresh(self, client: httpx.AsyncClient) -> Tuple[str, datetime.datetime]:
+        token_res = await client.post(**self._token_request())
+        return self._parse_token(token_res)
+
+    def _is_configured(self) -> bool:
+        return not (
             self.username is None
             and self.password is None
             and self.client_id is None
             and self.client_secret is None
+        )
+
+    def _token_expired(self) -> bool:
+        return self.access_token is None or (
+            self.expires_at is not None and self.expires_at <= datetime.datetime.now()
+        )
+
+    def _refresh_due(self) -> bool:
+        return (
+            self.access_token is not None
+            and self.expires_at is not None
+            and self.expires_at - self.refresh_ahead <= datetime.datetime.now()
+        )
+
+    def _store(self, token: Tuple[str, datetime.datetime]) -> None:
+        self.access_token, self.expires_at = token
+
+    def _ensure_token(self, client: Optional[httpx.Client] = None) -> None:
+        """
+        Refreshes an expired or missing token, only one caller performs the
+        refresh while the others wait for its result
+        """
+        if not self._token_expired():
+            return
+        with self._lock:
+            if self._token_expired():
+                self._store(self._refresh(client))
+
+    def _refresh_in_background(self, client: httpx.Client) -> None:
+        if not self._lock.acquire(blocking=False):
+            # a refresh is already in progress
+            return
+
+        def run() -> None:
+            try:
+                if self._refresh_due():
+                    self._store(self._refresh(client))
+            except Exception:
+                # the token is still valid, a failed early refresh is retried on
+                # a later request or surfaces once the token actually expires
+                logger.warning("background OAuth2 token refresh failed", exc_info=True)
+            finally:
+                self._lock.release()
+
+        try:
+            threading.Thread(target=run, daemon=True).start()
+        except Exception:
+            self._lock.release()
+            raise
+
+    async def _arefresh_in_background(self, client: httpx.AsyncClient) -> None:
+        async with self._get_async_lock():
+            try:
+                if self._refresh_due():
+                    self._store(await self._arefresh(client))
+            except Exception:
+                # see _refresh_in_background
+                logger.warning("background OAuth2 token refresh failed", exc_info=True)
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        # an asyncio.Lock is bound to one event loop, keep one per loop so the
+        # provider can be shared by clients running on different loops
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = self._async_locks[loop] = asyncio.Lock()
+        return lock
+
+    def prepare(self, client: httpx.Client) -> None:
+        """
+        Fetches a token through the client's connection pool when missing or
+        expired, and starts a background refresh when it is about to expire.
+        """
+        if not self._is_configured():
+            return
+        if self._token_expired():
+            self._ensure_token(client)
+        elif self._refresh_due():
+            self._refresh_in_background(client)
+
+    async def aprepare(self, client: httpx.AsyncClient) -> None:
+        """
+        Asynchronous version of `prepare`, concurrent coroutines finding the
+        token expired share a single refresh request.
+        """
+        if not self._is_configured():
+            return
+        if self._token_expired():
+            async with self._get_async_lock():
+                if self._token_expired():
+                    self._store(await self._arefresh(client))
+        elif self._refresh_due() and (
+            self._background_task is None
+            or self._background_task.done()
+            # a task left pending by a closed loop never completes
+            or self._background_task.get_loop() is not asyncio.get_running_loop()
         ):
+            self._background_task = asyncio.ensure_future(
+                self._arefresh_in_background(client)
+            )
+
+    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
+        if not self._is_configured():
             # provider is not configured to make an oauth token request
             return cfg
 
-        token_expired = (
-            self.expires_at is not None and self.expires_at <= datetime.datetime.now()
-        )
-        if self.access_token is None or token_expired:
-            access_token, expires_at = self._refresh()
-            self.expires_at = expires_at
-            self.access_token = access_token
+        # no-op when `prepare`/`aprepare` already fetched a token
+        self._ensure_token()
 
         self.request_mutator.set_value(self.access_token)
         return self.request_mutator.add_to_request(cfg)
 
+    def credential(self) -> Optional[Tuple[Literal["query", "header", "cookie"], str]]:
+        return self.request_mutator.credential()
+
     def set_value(self, _val: Optional[str]) -> None:
         raise NotImplementedError("an OAuth2 auth provider cannot be a request_mutator")
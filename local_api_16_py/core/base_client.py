@@ -1,24 +1,76 @@
+import asyncio
+import time
 from typing import (
     Any,
+    Awaitable,
     List,
     TypeVar,
     Dict,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     Union,
     cast,
+    get_args,
 )
-from typing_extensions import TypeGuard
+from typing_extensions import TypeGuard, TypedDict
 
 import httpx
 from pydantic import BaseModel
 
-from .api_error import ApiError
+from .api_error import (
+    DEFAULT_MAX_ERROR_BODY_SIZE,
+    ApiError,
+    aread_error_body,
+    read_error_body,
+)
 from .auth import AuthProvider
-from .request import RequestConfig, RequestOptions, default_request_options, QueryParams
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
-from .utils import get_response_type, filter_binary_response
-from .binary_response import BinaryResponse
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakers,
+    CircuitBreakerState,
+)
+from .hedge import Hedger, HedgePolicy, HedgeStats
+from .json_codec import JsonBackend, JsonCodec, get_json_codec
+from .json_stream import AsyncJsonArrayStreamResponse, JsonArrayStreamResponse
+from .load_balancer import EndpointStats, LoadBalancer, LoadBalancingConfig
+from .observer import PhaseTimer, RequestObserver
+from .telemetry import TelemetryConfig, create_telemetry
+from .pool import PoolStats, get_pool_stats
+from .rate_limit import RateLimitConfig, RateLimiter, RateLimitStats
+from .retry import (
+    Retrier,
+    RetryMetrics,
+    RetryPolicy,
+    RetryStats,
+    default_retry_policy,
+)
+from .request import (
+    RequestConfig,
+    RequestOptions,
+    default_request_options,
+    is_replayable,
+    QueryParams,
+)
+from .request_template import RequestTemplate
+from .response import from_encodable, from_json, AsyncStreamResponse, StreamResponse
+from .utils import (
+    get_response_type,
+    filter_binary_response,
+    is_union_type,
+    is_utf8_json,
+    load_json,
+)
+from .binary_response import DEFAULT_SPILL_THRESHOLD, BinaryResponse
+from .cache import ResponseCache, ResponseCacheConfig, ResponseCacheStats
+from .coalesce import (
+    AsyncRequestCoalescer,
+    CoalesceStats,
+    RequestCoalescer,
+    coalesce_key,
+)
 
 NoneType = type(None)
 T = TypeVar(
@@ -26,6 +78,27 @@ T = TypeVar(
     bound=Union[object, None, str, "BaseModel", List[Any], Dict[str, Any], Any],
 )
 _DEFAULT_SERVICE_NAME = "__default_service__"
+_MAX_TEMPLATES = 256
+_TemplateKey = Tuple[str, str, Optional[str], Tuple[str, ...], Optional[str]]
+BaseUrls = Union[str, Sequence[str]]
+
+
+class _SendKwargs(TypedDict, total=False):
+    """Keyword arguments of `httpx.Client.send` taken from a request config"""
+
+    auth: httpx._types.AuthTypes
+    follow_redirects: bool
+
+
+def _split_send_kwargs(cfg: RequestConfig) -> Tuple[Dict[str, Any], _SendKwargs]:
+    """Split a request config into `build_request` and `send` keyword arguments"""
+    build: Dict[str, Any] = dict(cfg)
+    send: _SendKwargs = {}
+    if "auth" in build:
+        send["auth"] = build.pop("auth")
+    if "follow_redirects" in build:
+        send["follow_redirects"] = build.pop("follow_redirects")
+    return build, send
 
 
 class BaseClient:
@@ -36,16 +109,75 @@ class BaseClient:
 
     Attributes:
         _auths: Dictionary mapping auth provider IDs to AuthProvider instances
+        _retry_policy: Retry policy applied to requests unless overridden per call
+        _retry_metrics: Counters of the retries performed by this client
+        _templates: Request templates compiled by this client, keyed by operation
+        _response_cache: Cache of GET responses, None unless enabled
+        _max_error_body_size: Error response body bytes captured by `ApiError`
+        _json_codec: Codec encoding request bodies and decoding untyped responses
+        _rate_limiter: Paces upstream requests, None unless enabled
+        _circuit_breakers: Fail requests fast while their upstream is
+            degraded, None unless enabled
+        _balancers: Spread the requests of services with several base URLs
+            across them, keyed by service name
+        _operation_names: Names of the API's operations reported to
+            observers, keyed by method and path pattern
+        _observers: Called with the phase timings of every request
+        _telemetry: Records OpenTelemetry spans and metrics, None unless
+            enabled and installed
     """
 
-    def __init__(self, base_url: Union[str, Dict[str, str]]):
+    def __init__(
+        self,
+        base_url: Union[BaseUrls, Dict[str, BaseUrls]],
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCacheConfig] = None,
+        max_error_body_size: Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        json_codec: Union[JsonBackend, JsonCodec] = "stdlib",
+        rate_limit: Optional[RateLimitConfig] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        load_balancing: Optional[LoadBalancingConfig] = None,
+        operation_names: Optional[Dict[str, str]] = None,
+        observers: Optional[Sequence[RequestObserver]] = None,
+        telemetry: Union[bool, TelemetryConfig] = False,
+    ):
         """Initialize the base client"""
-        self._base_url = (
+        base_urls = (
             base_url
             if isinstance(base_url, dict)
             else {_DEFAULT_SERVICE_NAME: base_url}
         )
+        # requests are built against a service's first base URL
+        self._base_url: Dict[str, str] = {}
+        self._balancers: Dict[str, LoadBalancer] = {}
+        for service, urls in base_urls.items():
+            if isinstance(urls, str):
+                self._base_url[service] = urls
+                continue
+            if not urls:
+                raise ValueError(f"no base URL given for service {service!r}")
+            self._base_url[service] = urls[0]
+            if len(urls) > 1:
+                self._balancers[service] = LoadBalancer(urls, load_balancing or {})
+        self._operation_names = dict(operation_names or {})
+        self._observers: List[RequestObserver] = list(observers or [])
+        self._telemetry = create_telemetry(telemetry)
         self._auths: Dict[str, AuthProvider] = {}
+        self._retry_policy: RetryPolicy = {
+            **default_retry_policy(),
+            **(retry_policy or {}),
+        }
+        self._retry_metrics = RetryMetrics()
+        self._templates: Dict[_TemplateKey, RequestTemplate] = {}
+        self._response_cache = (
+            ResponseCache(response_cache) if response_cache is not None else None
+        )
+        self._max_error_body_size = max_error_body_size
+        self._json_codec = get_json_codec(json_codec)
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+        self._circuit_breakers = (
+            CircuitBreakers(circuit_breaker) if circuit_breaker is not None else None
+        )
 
     def register_auth(self, auth_id: str, provider: AuthProvider):
         """Register an authentication provider.
@@ -56,192 +188,455 @@ class BaseClient:
         """
         self._auths[auth_id] = provider
 
-    def default_headers(self) -> Dict[str, str]:
-        """Get default headers for requests.
+    def add_observer(self, observer: RequestObserver) -> None:
+        """Register an observer called with the phase timings of every request.
+
+        Observers are called on the thread (or event loop) which made the
+        request, once it completed or failed, and should return quickly.
+        Exceptions raised by an observer are logged and otherwise ignored.
+
+        Args:
+            observer: Callable receiving a `RequestTiming`
+        """
+        self._observers = [*self._observers, observer]
+
+    def remove_observer(self, observer: RequestObserver) -> None:
+        """Unregister an observer.
+
+        Args:
+            observer: An observer registered with `add_observer`
+        """
+        self._observers = [obs for obs in self._observers if obs != observer]
+
+    def _phase_timer(self, *, method: str, path: str) -> Optional[PhaseTimer]:
+        """Start timing a request.
+
+        Args:
+            method: HTTP method of the request
+            path: API endpoint path pattern
 
         Returns:
-            Dictionary of default headers
+            The request's timer, None if the client has neither observers
+            nor telemetry
         """
-        headers: Dict[str, str] = {
-            "x-sideko-sdk-language": "Python",
+        if not self._observers and self._telemetry is None:
+            return None
+        key = f"{method.upper()} {path}"
+        timer = PhaseTimer(
+            operation=self._operation_names.get(key, key),
+            method=method.upper(),
+            path=path,
+        )
+        if self._telemetry is not None:
+            self._telemetry.start(timer)
+        return timer
+
+    def retry_stats(self) -> RetryStats:
+        """Get the retry counters accumulated by this client.
+
+        Returns:
+            Counts of retries made, and of requests which recovered or exhausted them
+        """
+        return self._retry_metrics.stats()
+
+    def rate_limit_stats(self) -> Optional[RateLimitStats]:
+        """Get the rate limiting counters of this client.
+
+        Returns:
+            Counts of paced and delayed requests and the time spent waiting,
+            None if rate limiting is disabled
+        """
+        if self._rate_limiter is None:
+            return None
+        return self._rate_limiter.stats()
+
+    def circuit_breaker_states(self) -> Optional[Dict[str, CircuitBreakerState]]:
+        """Get the state of every circuit used so far by this client.
+
+        Returns:
+            Snapshots of the circuits keyed by circuit name, None if circuit
+            breaking is disabled
+        """
+        if self._circuit_breakers is None:
+            return None
+        return self._circuit_breakers.states()
+
+    def load_balancer_stats(self) -> Optional[Dict[str, List[EndpointStats]]]:
+        """Get the state of the endpoints of every load balanced service.
+
+        Returns:
+            Snapshots of each service's endpoints keyed by service name
+            ("default" for the API's default service), None if no service
+            has several base URLs
+        """
+        if not self._balancers:
+            return None
+        return {
+            "default" if service == _DEFAULT_SERVICE_NAME else service: balancer.stats()
+            for service, balancer in self._balancers.items()
         }
-        return headers
 
-    def build_url(self, path: str, service_name: Optional[str] = None) -> str:
-        """Build a complete URL by combining base URL and path.
+    def cache_stats(self) -> Optional[ResponseCacheStats]:
+        """Get the response cache counters of this client.
+
+        Returns:
+            Counts of cache hits, revalidations and misses, None if caching is disabled
+        """
+        if self._response_cache is None:
+            return None
+        return self._response_cache.stats()
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses and reset the cache counters."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
+
+    def _cache_for(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Union[Type[T], Any],
+        request_options: Optional[RequestOptions] = None,
+    ) -> Optional[ResponseCache]:
+        """Get the response cache applicable to a request.
+
+        Only GET requests of the cached endpoints decoded into a type are
+        cached, raw httpx responses and lazily streamed binary responses are
+        always fetched.
 
         Args:
+            method: HTTP method of the request
             path: API endpoint path
+            cast_to: Type the response is cast to
+            request_options: Additional request options
 
         Returns:
-            Complete URL string
+            The client's response cache, None if the request is not cacheable
         """
-        base_url = self._base_url.get(service_name or _DEFAULT_SERVICE_NAME, "")
-        if base_url.endswith("/"):
-            base_url = base_url[:-1]
-        if path.startswith("/"):
-            path = path[1:]
-
-        return f"{base_url}/{path}"
+        if (
+            self._response_cache is None
+            or method.upper() != "GET"
+            or not self._response_cache.caches(path)
+            or cast_to is httpx.Response
+            or self._streams_binary(cast_to=cast_to, opts=request_options)
+        ):
+            return None
+        return self._response_cache
+
+    def _credentials(self) -> List[Tuple[str, str]]:
+        """Get the location and name of the parameters carrying credentials.
 
-    def _cast_to_raw_response(
-        self, res: httpx.Response, cast_to: Union[Type[T], Any]
-    ) -> TypeGuard[T]:
-        """Determines if the provided cast_to is an httpx.Response"""
-        try:
-            return issubclass(cast_to, httpx.Response)
-        except TypeError:
-            return False
+        Returns:
+            The parameters set by the registered auth providers
+        """
+        credentials: List[Tuple[str, str]] = []
+        for provider in self._auths.values():
+            credential = provider.credential()
+            if credential is not None:
+                credentials.append(credential)
+        return credentials
 
-    def _apply_auth(
-        self, *, cfg: RequestConfig, auth_names: List[str]
-    ) -> RequestConfig:
-        """Apply authentication to the request configuration.
+    def _rate_limit_delay(self, *, method: str, path: str) -> float:
+        """Reserve the rate limiter slot of an upstream request.
 
         Args:
-            cfg: Request configuration to modify
-            auth_names: List of auth provider IDs to apply
+            method: HTTP method of the request
+            path: API endpoint path pattern
 
         Returns:
-            Modified request configuration
+            Seconds to wait before sending the request
         """
-        for auth_name in auth_names:
-            auth_provider = self._auths.get(auth_name)
-            if auth_provider is not None:
-                cfg = auth_provider.add_to_request(cfg)
+        if self._rate_limiter is None:
+            return 0.0
+        return self._rate_limiter.reserve(f"{method.upper()} {path}")
 
-        return cfg
+    def _circuit_for(
+        self, *, method: str, path: str, service_name: Optional[str]
+    ) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker guarding a request.
 
-    def _apply_headers(
-        self,
-        *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-        content_type: Optional[str] = None,
-        explicit_headers: Optional[Dict[str, str]] = None,
-    ) -> RequestConfig:
-        """Apply headers to the request configuration.
+        Args:
+            method: HTTP method of the request
+            path: API endpoint path pattern
+            service_name: The name of the API service the request is made to
+
+        Returns:
+            The circuit of the operation or service, None if circuit breaking
+            is disabled
+        """
+        if self._circuit_breakers is None:
+            return None
+        return self._circuit_breakers.get(service_name, f"{method.upper()} {path}")
+
+    def _balancer_for(self, service_name: Optional[str]) -> Optional[LoadBalancer]:
+        """Get the load balancer of a service.
 
         Args:
-            cfg: Request configuration to modify
-            opts: Request options containing additional headers
-            content_type: Optional content type header
-            explicit_headers: Optional explicitly specified headers
+            service_name: The name of the API service the request is made to
 
         Returns:
-            Modified request configuration
+            The service's load balancer, None if it has a single base URL
         """
-        headers = cfg.get("headers", {})
-        headers.update(self.default_headers())
+        if not self._balancers:
+            return None
+        return self._balancers.get(service_name or _DEFAULT_SERVICE_NAME)
 
-        if content_type is not None:
-            headers["content-type"] = content_type
+    def _observe_rate_limit(
+        self, *, method: str, path: str, response: httpx.Response
+    ) -> None:
+        """Adapt the rate limiter to the rate limit headers of a response.
 
-        if explicit_headers is not None:
-            headers.update(explicit_headers)
+        Args:
+            method: HTTP method of the request
+            path: API endpoint path pattern
+            response: Response to the request
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(f"{method.upper()} {path}", response)
 
-        additional_headers = opts.get("additional_headers", None)
-        if additional_headers is not None:
-            headers.update(additional_headers)
+    def encode_json(self, data: Any) -> bytes:
+        """Serialise data with the client's JSON codec.
 
-        if len(headers) > 0:
-            cfg["headers"] = headers
+        Args:
+            data: JSON-compatible data, e.g. as returned by `to_encodable`
 
-        return cfg
+        Returns:
+            The UTF-8 encoded JSON document
+        """
+        return self._json_codec.dumps(data)
 
-    def _apply_query_params(
-        self,
-        *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-        query_params: Optional[QueryParams] = None,
-    ) -> RequestConfig:
-        """Apply query parameters to the request configuration.
+    def _api_error(
+        self, response: httpx.Response, content: Optional[bytes] = None
+    ) -> ApiError:
+        """Build the error raised for a failed response.
 
         Args:
-            cfg: Request configuration to modify
-            opts: Request options containing additional parameters
-            query_params: Optional query parameters to add
+            response: The error response
+            content: The body already read from a streamed response
 
         Returns:
-            Modified request configuration
+            The `ApiError` subclass matching the response status
         """
-        params = cfg.get("params", {})
+        return ApiError.from_response(
+            response,
+            max_body_size=self._max_error_body_size,
+            content=content,
+            json_codec=self._json_codec,
+        )
 
-        if query_params is not None:
-            params.update(query_params)
+    def _streams_binary(
+        self, *, cast_to: Union[Type[T], Any], opts: Optional[RequestOptions]
+    ) -> bool:
+        """Check whether a request returns binary responses lazily.
 
-        additional_params = opts.get("additional_params", None)
-        if additional_params is not None:
-            params.update(additional_params)
+        Args:
+            cast_to: Type the response is cast to
+            opts: Additional request options
 
-        if len(params) > 0:
-            cfg["params"] = params
+        Returns:
+            True if `stream_binary` is set and the response may be binary
+        """
+        if not (opts or {}).get("stream_binary"):
+            return False
+        if cast_to == BinaryResponse:
+            return True
+        return is_union_type(cast_to) and BinaryResponse in get_args(cast_to)
 
-        return cfg
+    def _lazy_binary(
+        self,
+        *,
+        response: httpx.Response,
+        cast_to: Union[Type[T], Any],
+        opts: Optional[RequestOptions],
+    ) -> Optional[BinaryResponse]:
+        """Wrap a successful, still unread binary response without reading it.
 
-    def _apply_timeout(
+        Args:
+            response: HTTP response sent with `stream=True`
+            cast_to: Type the response is cast to
+            opts: Additional request options
+
+        Returns:
+            The lazy binary response, None if the response is not binary and
+            must be read and processed as usual
+        """
+        if not response.is_success or response.status_code == 204:
+            return None
+        if (
+            cast_to != BinaryResponse
+            and get_response_type(response.headers) != "binary"
+        ):
+            return None
+        threshold = (opts or {}).get("spill_threshold", DEFAULT_SPILL_THRESHOLD)
+        return BinaryResponse.from_stream(response, spill_threshold=threshold)
+
+    def _invalidate_cache(
         self,
         *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-    ) -> RequestConfig:
-        """Apply timeout settings to the request configuration.
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, Any]],
+        service_name: Optional[str],
+        json: Optional[Any],
+    ) -> None:
+        """Drop the cached reads made stale by a mutating request.
 
         Args:
-            cfg: Request configuration to modify
-            opts: Request options containing timeout settings
+            method: HTTP method of the request
+            path: API endpoint path pattern of the request
+            path_params: Path parameters of the request
+            service_name: The name of the API service the request was made to
+            json: JSON body of the request
+        """
+        cache = self._response_cache
+        if cache is None or method.upper() == "GET":
+            return
+
+        body = json if isinstance(json, dict) else {}
+        for invalidation in cache.invalidations(method=method, path=path):
+            params: Dict[str, Any] = {}
+            for placeholder, name in invalidation.get("path_params", {}).items():
+                if path_params is not None and path_params.get(name) is not None:
+                    params[placeholder] = path_params[name]
+            for placeholder, name in invalidation.get("body_params", {}).items():
+                if body.get(name) is not None:
+                    params[placeholder] = body[name]
+
+            template = self.request_template(
+                method="GET", path=invalidation["path"], service_name=service_name
+            )
+            try:
+                cache.invalidate(template.url(params))
+            except KeyError:
+                # unresolved placeholder, drop every URL of the endpoint
+                prefix = invalidation["path"].split("{", 1)[0]
+                cache.invalidate_prefix(self.build_url(prefix, service_name))
+
+    def _retrier(
+        self, *, req_cfg: RequestConfig, opts: Optional[RequestOptions]
+    ) -> Retrier:
+        """Create the retry state for a single request.
+
+        Args:
+            req_cfg: Request configuration of the request
+            opts: Request options which may override the client's retry policy
 
         Returns:
-            Modified request configuration
+            Retrier tracking the attempts of the request
         """
-        timeout = opts.get("timeout", None)
+        policy = self._retry_policy
+        overrides = (opts or {}).get("retry")
+        if overrides:
+            policy = {**policy, **overrides}
+        return Retrier(
+            policy=policy,
+            method=req_cfg["method"],
+            metrics=self._retry_metrics,
+            replayable=is_replayable(req_cfg),
+        )
+
+    def default_headers(self) -> Dict[str, str]:
+        """Get default headers for requests.
 
-        if timeout is not None:
-            cfg["timeout"] = timeout
+        Returns:
+            Dictionary of default headers
+        """
+        headers: Dict[str, str] = {
+            "x-sideko-sdk-language": "Python",
+        }
+        return headers
 
-        return cfg
+    def build_url(self, path: str, service_name: Optional[str] = None) -> str:
+        """Build a complete URL by combining base URL and path.
+
+        Args:
+            path: API endpoint path
+
+        Returns:
+            Complete URL string
+        """
+        base_url = self._base_url.get(service_name or _DEFAULT_SERVICE_NAME, "")
+        if base_url.endswith("/"):
+            base_url = base_url[:-1]
+        if path.startswith("/"):
+            path = path[1:]
+
+        return f"{base_url}/{path}"
 
-    def _apply_body(
+    def request_template(
         self,
         *,
-        cfg: RequestConfig,
-        data: Optional[httpx._types.RequestData] = None,
-        files: Optional[httpx._types.RequestFiles] = None,
-        json: Optional[Any] = None,
-        content: Optional[httpx._types.RequestContent] = None,
-    ) -> RequestConfig:
-        """Apply request body content to the request configuration.
+        method: str,
+        path: str,
+        service_name: Optional[str] = None,
+        auth_names: Optional[List[str]] = None,
+        content_type: Optional[str] = None,
+    ) -> RequestTemplate:
+        """Get the precompiled template of an operation, compiling it on first use.
+
+        The base URL and default headers are looked up on every request, and
+        the template is recompiled whenever they changed since it was compiled.
+        Auth providers are looked up on every request.
 
         Args:
-            cfg: Request configuration to modify
-            data: Optional form data
-            files: Optional files to upload
-            json: Optional JSON data
-            content: Optional raw content
+            method: HTTP method
+            path: API endpoint path, optionally with `{placeholder}` segments
+            service_name: The name of the API service the operation belongs to
+            auth_names: List of auth provider IDs
+            content_type: Content type header
 
         Returns:
-            Modified request configuration
+            Template for building the operation's requests
         """
-        if data is not None:
-            cfg["data"] = data
-
-        if files is not None:
-            cfg["files"] = files
+        key = (
+            method,
+            path,
+            service_name,
+            tuple(auth_names) if auth_names else (),
+            content_type,
+        )
+        base_url = self._base_url.get(service_name or _DEFAULT_SERVICE_NAME, "")
+        headers = self.default_headers()
+        if content_type is not None:
+            headers["content-type"] = content_type
 
-        if json is not None:
-            cfg["json"] = json
+        template = self._templates.get(key)
+        if (
+            template is not None
+            and template.base_url == base_url
+            and template.headers == headers
+        ):
+            return template
 
-        if content is not None:
-            cfg["content"] = content
+        template = RequestTemplate(
+            method=method,
+            path=path,
+            base_url=base_url,
+            auth_names=key[3],
+            headers=headers,
+        )
+        # paths formatted by callers rather than passed as a pattern would
+        # otherwise grow the cache without bound
+        if key in self._templates or len(self._templates) < _MAX_TEMPLATES:
+            self._templates[key] = template
+        return template
 
-        return cfg
+    def _cast_to_raw_response(
+        self, res: httpx.Response, cast_to: Union[Type[T], Any]
+    ) -> TypeGuard[T]:
+        """Determines if the provided cast_to is an httpx.Response"""
+        try:
+            return issubclass(cast_to, httpx.Response)
+        except TypeError:
+            return False
 
     def build_request(
         self,
         *,
         method: str,
         path: str,
+        path_params: Optional[Dict[str, Any]] = None,
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
@@ -258,6 +653,7 @@ class BaseClient:
         Args:
             method: HTTP method
             path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
             auth_names: List of auth provider IDs
             query_params: Query parameters
             headers: Request headers
@@ -271,24 +667,25 @@ class BaseClient:
         Returns:
             Complete request configuration
         """
-        opts = request_options or default_request_options()
-        req_cfg: RequestConfig = {
-            "method": method,
-            "url": self.build_url(path, service_name=service_name),
-        }
-        req_cfg = self._apply_auth(cfg=req_cfg, auth_names=auth_names or [])
-        req_cfg = self._apply_headers(
-            cfg=req_cfg, opts=opts, content_type=content_type, explicit_headers=headers
-        )
-        req_cfg = self._apply_query_params(
-            cfg=req_cfg, opts=opts, query_params=query_params
+        template = self.request_template(
+            method=method,
+            path=path,
+            service_name=service_name,
+            auth_names=auth_names,
+            content_type=content_type,
         )
-        req_cfg = self._apply_body(
-            cfg=req_cfg, data=data, files=files, json=json, content=content
+        return template.build(
+            auths=self._auths,
+            opts=request_options or default_request_options(),
+            path_params=path_params,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content=content,
+            json_codec=self._json_codec,
         )
-        req_cfg = self._apply_timeout(cfg=req_cfg, opts=opts)
-
-        return req_cfg
 
     def process_response(
         self,
@@ -321,10 +718,15 @@ class BaseClient:
 
         if response_type == "json":
             if cast_to is type(Any):
-                return response.json()
-            return from_encodable(
-                data=response.json(), load_with=filter_binary_response(cast_to=cast_to)
-            )
+                if is_utf8_json(response):
+                    return self._json_codec.loads(response.content)
+                return load_json(response)
+            load_with = filter_binary_response(cast_to=cast_to)
+            if is_utf8_json(response):
+                # validate the raw bytes directly, avoiding a second pass over
+                # an intermediate dict tree
+                return from_json(content=response.content, load_with=load_with)
+            return from_encodable(data=load_json(response), load_with=load_with)
         elif response_type == "text":
             return cast(T, response.text)
         else:
@@ -343,22 +745,179 @@ class SyncBaseClient(BaseClient):
     def __init__(
         self,
         *,
-        base_url: Union[str, Dict[str, str]],
+        base_url: Union[BaseUrls, Dict[str, BaseUrls]],
         httpx_client: httpx.Client,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCacheConfig] = None,
+        coalesce_requests: bool = False,
+        max_error_body_size: Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        json_codec: Union[JsonBackend, JsonCodec] = "stdlib",
+        rate_limit: Optional[RateLimitConfig] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        load_balancing: Optional[LoadBalancingConfig] = None,
+        operation_names: Optional[Dict[str, str]] = None,
+        observers: Optional[Sequence[RequestObserver]] = None,
+        telemetry: Union[bool, TelemetryConfig] = False,
     ):
         """Initialize the synchronous client.
 
         Args:
             httpx_client: Synchronous HTTPX client instance
+            retry_policy: Overrides of the default retry policy
+            response_cache: Enables caching of GET responses
+            coalesce_requests: Share one upstream call between identical
+                concurrent GET requests
+            max_error_body_size: Bytes of an error response body captured by
+                `ApiError`, None to capture whole bodies
+            json_codec: JSON backend (or codec) used for request bodies and
+                untyped responses, the standard library's by default
+            rate_limit: Enables client-side pacing of upstream requests
+            circuit_breaker: Enables failing fast while an upstream is degraded
+            load_balancing: Configures how requests are spread across the
+                base URLs of services given several
+            operation_names: Names of the API's operations reported to
+                observers, keyed by method and path pattern
+            observers: Called with the phase timings of every request
+            telemetry: Enables OpenTelemetry spans and metrics, if installed
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            max_error_body_size=max_error_body_size,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            load_balancing=load_balancing,
+            operation_names=operation_names,
+            observers=observers,
+            telemetry=telemetry,
+        )
         self.httpx_client = httpx_client
+        self._coalescer = RequestCoalescer() if coalesce_requests else None
+
+    def pool_stats(self) -> PoolStats:
+        """Report the connections currently held by the HTTPX client's pool.
+
+        Returns:
+            Counts of open, in-use, idle and HTTP/2 connections
+        """
+        return get_pool_stats(self.httpx_client)
+
+    def coalesce_stats(self) -> Optional[CoalesceStats]:
+        """Get the request coalescing counters of this client.
+
+        Returns:
+            Counts of executed and coalesced calls, None if coalescing is disabled
+        """
+        if self._coalescer is None:
+            return None
+        return self._coalescer.stats()
+
+    def _coalescer_for(
+        self, *, method: str, cast_to: Union[Type[T], Any]
+    ) -> Optional[RequestCoalescer]:
+        """Get the single-flight group applicable to a request.
+
+        Only GET requests decoded into a type are coalesced, raw httpx
+        responses cannot be shared.
+
+        Args:
+            method: HTTP method of the request
+            cast_to: Type the response is cast to
+
+        Returns:
+            The client's single-flight group, None if the request is not coalesced
+        """
+        if method.upper() != "GET" or cast_to is httpx.Response:
+            return None
+        return self._coalescer
+
+    def _prepare_auth(self, auth_names: Optional[List[str]]) -> None:
+        """Let auth providers fetch credentials ahead of building a request.
+
+        Args:
+            auth_names: List of auth provider IDs the request will apply
+        """
+        for auth_name in auth_names or []:
+            auth_provider = self._auths.get(auth_name)
+            if auth_provider is not None:
+                auth_provider.prepare(self.httpx_client)
+
+    def _open_stream(
+        self,
+        req_cfg: RequestConfig,
+        *,
+        method: str,
+        path: str,
+        service_name: Optional[str],
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[httpx.Response, Any]:
+        """Open a streamed request on one of the service's endpoints.
+
+        Like any other request, each attempt is admitted by the circuit
+        breaker and paced by the rate limiter. Transient failures are retried
+        until the response headers arrived, a stream failing once its body is
+        being consumed is not retried.
+
+        Args:
+            req_cfg: Request configuration built by `build_request`
+            method: HTTP method
+            path: API endpoint path pattern
+            service_name: The name of the API service to make the request to
+            request_options: Additional request options
+
+        Returns:
+            The response, its headers read, and the stream context to exit
+            once it is consumed
+        """
+        contexts = []
+
+        def enter(cfg: RequestConfig) -> httpx.Response:
+            context = self.httpx_client.stream(**cfg)
+            response = context.__enter__()
+            contexts.append(context)
+            return response
+
+        retrier = self._retrier(req_cfg=req_cfg, opts=request_options)
+        circuit = self._circuit_for(
+            method=method, path=path, service_name=service_name
+        )
+        balancer = self._balancer_for(service_name)
+        while True:
+            if circuit is not None:
+                circuit.acquire()
+            paced = self._rate_limit_delay(method=method, path=path)
+            if paced:
+                time.sleep(paced)
+            started = time.monotonic()
+            try:
+                if balancer is None:
+                    response = enter(req_cfg)
+                else:
+                    response = balancer.call(req_cfg, enter)
+            except Exception as exc:
+                if circuit is not None:
+                    circuit.record_exception(exc, time.monotonic() - started)
+                delay = retrier.exception_delay(exc)
+                if delay is None:
+                    raise
+            else:
+                if circuit is not None:
+                    circuit.record_response(response, time.monotonic() - started)
+                self._observe_rate_limit(method=method, path=path, response=response)
+                delay = retrier.response_delay(response)
+                if delay is None:
+                    return response, contexts[-1]
+                contexts.pop().__exit__(None, None, None)
+            time.sleep(delay)
 
     def request(
         self,
         *,
         method: str,
         path: str,
+        path_params: Optional[Dict[str, Any]] = None,
         cast_to: Union[Type[T], Any],
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
@@ -373,9 +932,14 @@ class SyncBaseClient(BaseClient):
     ) -> T:
         """Make a synchronous HTTP request.
 
+        Transient failures are retried according to the client's retry policy,
+        merged with any `retry` overrides in the request options. Identical
+        concurrent GET requests share one call when coalescing is enabled.
+
         Args:
             method: HTTP method
             path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -393,25 +957,229 @@ class SyncBaseClient(BaseClient):
 
         Raises:
             ApiError: If the request fails
+            CircuitOpenError: If the request's circuit is open
         """
-        req_cfg = self.build_request(
+        timer = self._phase_timer(method=method, path=path)
+        try:
+            self._prepare_auth(auth_names)
+            if timer is not None:
+                timer.lap("auth")
+            req_cfg = self.build_request(
+                method=method,
+                path=path,
+                path_params=path_params,
+                service_name=service_name,
+                auth_names=auth_names,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content_type=content_type,
+                content=content,
+                request_options=request_options,
+            )
+            if timer is not None:
+                timer.lap("build")
+            coalescer = self._coalescer_for(method=method, cast_to=cast_to)
+            if self._streams_binary(cast_to=cast_to, opts=request_options):
+                # a stream can only be consumed by one caller
+                coalescer = None
+            key = coalesce_key(req_cfg, cast_to) if coalescer is not None else None
+            if coalescer is None or key is None:
+                result = self._send(
+                    req_cfg=req_cfg,
+                    method=method,
+                    path=path,
+                    path_params=path_params,
+                    service_name=service_name,
+                    json=json,
+                    cast_to=cast_to,
+                    request_options=request_options,
+                    timer=timer,
+                )
+            else:
+                result = coalescer.do(
+                    key,
+                    lambda: self._send(
+                        req_cfg=req_cfg,
+                        method=method,
+                        path=path,
+                        path_params=path_params,
+                        service_name=service_name,
+                        json=json,
+                        cast_to=cast_to,
+                        request_options=request_options,
+                        timer=timer,
+                    ),
+                )
+        except BaseException as exc:
+            if timer is not None:
+                timer.finish(self._observers, exc)
+            raise
+        if timer is not None:
+            timer.lap("decode")
+            timer.finish(self._observers)
+        return result
+
+    def _send(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, Any]],
+        service_name: Optional[str],
+        json: Optional[Any],
+        cast_to: Union[Type[T], Any],
+        request_options: Optional[RequestOptions],
+        timer: Optional[PhaseTimer] = None,
+    ) -> T:
+        """Send a built request through the cache and retry layers and decode
+        its response.
+
+        Args:
+            req_cfg: Request configuration built by `build_request`
+            method: HTTP method
+            path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
+            service_name: The name of the API service to make the request to
+            json: JSON data
+            cast_to: Type to cast the response to
+            request_options: Additional request options
+            timer: Collects the phase timings of the request, None unless
+                the client has observers
+
+        Returns:
+            Response data of the specified type
+
+        Raises:
+            ApiError: If the request fails
+            CircuitOpenError: If the request's circuit is open
+        """
+        cache = self._cache_for(
             method=method,
             path=path,
-            service_name=service_name,
-            auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
-            content_type=content_type,
-            content=content,
+            cast_to=cast_to,
             request_options=request_options,
         )
-        response = self.httpx_client.request(**req_cfg)
+        cache_key, cached = None, None
+        if cache is not None:
+            cache_key = cache.key(req_cfg, credentials=self._credentials())
+            cached = cache.lookup(cache_key, req_cfg)
+            if cached is not None:
+                if cached.is_fresh():
+                    return cache.hit(cached, cast_to, self.process_response)
+                cache.add_validators(cached, req_cfg)
+            if timer is not None:
+                timer.lap("cache")
+
+        lazy = self._streams_binary(cast_to=cast_to, opts=request_options)
+        retrier = self._retrier(req_cfg=req_cfg, opts=request_options)
+        circuit = self._circuit_for(
+            method=method, path=path, service_name=service_name
+        )
+        balancer = self._balancer_for(service_name)
+        attempt_cfg = req_cfg
+        if timer is not None:
+            attempt_cfg = timer.traced(req_cfg, is_async=False)
+
+        def send_once(cfg: RequestConfig) -> httpx.Response:
+            if lazy:
+                build, send = _split_send_kwargs(cfg)
+                return self.httpx_client.send(
+                    self.httpx_client.build_request(**build), stream=True, **send
+                )
+            return self.httpx_client.request(**cfg)
+
+        sent = False
+        try:
+            while True:
+                if circuit is not None:
+                    circuit.acquire()
+                paced = self._rate_limit_delay(method=method, path=path)
+                if paced:
+                    time.sleep(paced)
+                    if timer is not None:
+                        timer.lap("rate_limit")
+                started = time.monotonic()
+                sent = True
+                try:
+                    if balancer is not None:
+                        response = balancer.call(attempt_cfg, send_once)
+                    else:
+                        response = send_once(attempt_cfg)
+                except Exception as exc:
+                    if timer is not None:
+                        timer.attempt(None)
+                    if circuit is not None:
+                        circuit.record_exception(exc, time.monotonic() - started)
+                    delay = retrier.exception_delay(exc)
+                    if delay is None:
+                        raise
+                else:
+                    if timer is not None:
+                        timer.attempt(response)
+                    if circuit is not None:
+                        circuit.record_response(response, time.monotonic() - started)
+                    self._observe_rate_limit(
+                        method=method, path=path, response=response
+                    )
+                    delay = retrier.response_delay(response)
+                    if delay is None:
+                        break
+                    response.close()
+                time.sleep(delay)
+                if timer is not None:
+                    timer.lap("backoff")
+        finally:
+            # whatever the outcome, a mutation which was sent may have been
+            # applied, unlike one rejected (e.g. by an open circuit) up front
+            if sent:
+                self._invalidate_cache(
+                    method=method,
+                    path=path,
+                    path_params=path_params,
+                    service_name=service_name,
+                    json=json,
+                )
+
+        if lazy:
+            if not response.is_success:
+                try:
+                    content = read_error_body(response, self._max_error_body_size)
+                finally:
+                    response.close()
+                raise self._api_error(response, content)
+            binary = self._lazy_binary(
+                response=response, cast_to=cast_to, opts=request_options
+            )
+            if binary is not None:
+                return cast(T, binary)
+            response.read()
+
+        if cache is not None and cache_key is not None:
+            if cached is not None and response.status_code == 304:
+                return cache.revalidate(
+                    key=cache_key,
+                    entry=cached,
+                    response=response,
+                    path=path,
+                    cast_to=cast_to,
+                    decode=self.process_response,
+                )
+            if response.is_success:
+                return cache.store(
+                    key=cache_key,
+                    cfg=req_cfg,
+                    response=response,
+                    path=path,
+                    cast_to=cast_to,
+                    decode=self.process_response,
+                )
 
         if not response.is_success:
-            raise ApiError(response=response)
+            raise self._api_error(response)
 
         if self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
@@ -423,6 +1191,7 @@ class SyncBaseClient(BaseClient):
         *,
         method: str,
         path: str,
+        path_params: Optional[Dict[str, Any]] = None,
         cast_to: Union[Type[T], Any],
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
@@ -440,6 +1209,7 @@ class SyncBaseClient(BaseClient):
         Args:
             method: HTTP method
             path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -458,9 +1228,11 @@ class SyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
+        self._prepare_auth(auth_names)
         req_cfg = self.build_request(
             method=method,
             path=path,
+            path_params=path_params,
             service_name=service_name,
             auth_names=auth_names,
             query_params=query_params,
@@ -472,10 +1244,91 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = context.__enter__()
+        response, context = self._open_stream(
+            req_cfg,
+            method=method,
+            path=path,
+            service_name=service_name,
+            request_options=request_options,
+        )
         return StreamResponse(response, context, cast_to)
 
+    def stream_json_array(
+        self,
+        *,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        cast_to: Union[Type[T], Any],
+        service_name: Optional[str] = None,
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content_type: Optional[str] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> JsonArrayStreamResponse[T]:
+        """Make a synchronous HTTP request whose JSON array response is decoded
+        incrementally.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
+            cast_to: Type to cast each item of the array to
+            auth_names: List of auth provider IDs
+            service_name: The name of the API service to make the request to
+            query_params: Query parameters
+            headers: Request headers
+            data: Form data
+            files: Files to upload
+            json: JSON data
+            content_type: Content type header
+            content: Raw content
+            request_options: Additional request options
+
+        Returns:
+            JsonArrayStreamResponse yielding each item of the array
+
+        Raises:
+            ApiError: If the request fails
+        """
+        self._prepare_auth(auth_names)
+        req_cfg = self.build_request(
+            method=method,
+            path=path,
+            path_params=path_params,
+            service_name=service_name,
+            auth_names=auth_names,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+        response, context = self._open_stream(
+            req_cfg,
+            method=method,
+            path=path,
+            service_name=service_name,
+            request_options=request_options,
+        )
+
+        if not response.is_success:
+            try:
+                content = read_error_body(response, self._max_error_body_size)
+            finally:
+                context.__exit__(None, None, None)
+            raise self._api_error(response, content)
+
+        return JsonArrayStreamResponse(response, context, cast_to)
+
 
 class AsyncBaseClient(BaseClient):
     """Asynchronous HTTP client implementation.
@@ -486,22 +1339,213 @@ class AsyncBaseClient(BaseClient):
     def __init__(
         self,
         *,
-        base_url: Union[str, Dict[str, str]],
+        base_url: Union[BaseUrls, Dict[str, BaseUrls]],
         httpx_client: httpx.AsyncClient,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCacheConfig] = None,
+        coalesce_requests: bool = False,
+        max_error_body_size: Optional[int] = DEFAULT_MAX_ERROR_BODY_SIZE,
+        json_codec: Union[JsonBackend, JsonCodec] = "stdlib",
+        rate_limit: Optional[RateLimitConfig] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        load_balancing: Optional[LoadBalancingConfig] = None,
+        operation_names: Optional[Dict[str, str]] = None,
+        observers: Optional[Sequence[RequestObserver]] = None,
+        telemetry: Union[bool, TelemetryConfig] = False,
+        hedging: Optional[HedgePolicy] = None,
     ):
         """Initialize the asynchronous client.
 
         Args:
             httpx_client: Asynchronous HTTPX client instance
+            retry_policy: Overrides of the default retry policy
+            response_cache: Enables caching of GET responses
+            coalesce_requests: Share one upstream call between identical
+                concurrent GET requests
+            max_error_body_size: Bytes of an error response body captured by
+                `ApiError`, None to capture whole bodies
+            json_codec: JSON backend (or codec) used for request bodies and
+                untyped responses, the standard library's by default
+            rate_limit: Enables client-side pacing of upstream requests
+            circuit_breaker: Enables failing fast while an upstream is degraded
+            load_balancing: Configures how requests are spread across the
+                base URLs of services given several
+            operation_names: Names of the API's operations reported to
+                observers, keyed by method and path pattern
+            observers: Called with the phase timings of every request
+            telemetry: Enables OpenTelemetry spans and metrics, if installed
+            hedging: Enables hedging of slow GET requests
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            max_error_body_size=max_error_body_size,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            load_balancing=load_balancing,
+            operation_names=operation_names,
+            observers=observers,
+            telemetry=telemetry,
+        )
         self.httpx_client = httpx_client
+        self._coalescer = AsyncRequestCoalescer() if coalesce_requests else None
+        self._hedger = Hedger(hedging) if hedging is not None else None
+
+    def pool_stats(self) -> PoolStats:
+        """Report the connections currently held by the HTTPX client's pool.
+
+        Returns:
+            Counts of open, in-use, idle and HTTP/2 connections
+        """
+        return get_pool_stats(self.httpx_client)
+
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        """Get the hedging counters of this client.
+
+        Returns:
+            Counts of hedgeable requests, hedges sent and won, and hedges
+            skipped for lack of budget, None if hedging is disabled
+        """
+        if self._hedger is None:
+            return None
+        return self._hedger.stats()
+
+    def _hedger_for(
+        self, *, method: str, opts: Optional[RequestOptions]
+    ) -> Optional[Hedger]:
+        """Get the hedger applicable to a request.
+
+        Only GET requests are hedged, unless disabled through the `hedge`
+        request option.
+
+        Args:
+            method: HTTP method of the request
+            opts: Additional request options
+
+        Returns:
+            The client's hedger, None if the request is not hedged
+        """
+        if method.upper() != "GET" or not (opts or {}).get("hedge", True):
+            return None
+        return self._hedger
+
+    def coalesce_stats(self) -> Optional[CoalesceStats]:
+        """Get the request coalescing counters of this client.
+
+        Returns:
+            Counts of executed and coalesced calls, None if coalescing is disabled
+        """
+        if self._coalescer is None:
+            return None
+        return self._coalescer.stats()
+
+    def _coalescer_for(
+        self, *, method: str, cast_to: Union[Type[T], Any]
+    ) -> Optional[AsyncRequestCoalescer]:
+        """Get the single-flight group applicable to a request.
+
+        Only GET requests decoded into a type are coalesced, raw httpx
+        responses cannot be shared.
+
+        Args:
+            method: HTTP method of the request
+            cast_to: Type the response is cast to
+
+        Returns:
+            The client's single-flight group, None if the request is not coalesced
+        """
+        if method.upper() != "GET" or cast_to is httpx.Response:
+            return None
+        return self._coalescer
+
+    async def _prepare_auth(self, auth_names: Optional[List[str]]) -> None:
+        """Let auth providers fetch credentials ahead of building a request,
+        without blocking the event loop.
+
+        Args:
+            auth_names: List of auth provider IDs the request will apply
+        """
+        for auth_name in auth_names or []:
+            auth_provider = self._auths.get(auth_name)
+            if auth_provider is not None:
+                await auth_provider.aprepare(self.httpx_client)
+
+    async def _open_stream(
+        self,
+        req_cfg: RequestConfig,
+        *,
+        method: str,
+        path: str,
+        service_name: Optional[str],
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[httpx.Response, Any]:
+        """Open a streamed request on one of the service's endpoints.
+
+        Like any other request, each attempt is admitted by the circuit
+        breaker and paced by the rate limiter. Transient failures are retried
+        until the response headers arrived, a stream failing once its body is
+        being consumed is not retried.
+
+        Args:
+            req_cfg: Request configuration built by `build_request`
+            method: HTTP method
+            path: API endpoint path pattern
+            service_name: The name of the API service to make the request to
+            request_options: Additional request options
+
+        Returns:
+            The response, its headers read, and the stream context to exit
+            once it is consumed
+        """
+        contexts = []
+
+        async def enter(cfg: RequestConfig) -> httpx.Response:
+            context = self.httpx_client.stream(**cfg)
+            response = await context.__aenter__()
+            contexts.append(context)
+            return response
+
+        retrier = self._retrier(req_cfg=req_cfg, opts=request_options)
+        circuit = self._circuit_for(
+            method=method, path=path, service_name=service_name
+        )
+        balancer = self._balancer_for(service_name)
+        while True:
+            if circuit is not None:
+                circuit.acquire()
+            paced = self._rate_limit_delay(method=method, path=path)
+            if paced:
+                await asyncio.sleep(paced)
+            started = time.monotonic()
+            try:
+                if balancer is None:
+                    response = await enter(req_cfg)
+                else:
+                    response = await balancer.acall(req_cfg, enter)
+            except Exception as exc:
+                if circuit is not None:
+                    circuit.record_exception(exc, time.monotonic() - started)
+                delay = retrier.exception_delay(exc)
+                if delay is None:
+                    raise
+            else:
+                if circuit is not None:
+                    circuit.record_response(response, time.monotonic() - started)
+                self._observe_rate_limit(method=method, path=path, response=response)
+                delay = retrier.response_delay(response)
+                if delay is None:
+                    return response, contexts[-1]
+                await contexts.pop().__aexit__(None, None, None)
+            await asyncio.sleep(delay)
 
     async def request(
         self,
         *,
         method: str,
         path: str,
+        path_params: Optional[Dict[str, Any]] = None,
         cast_to: Union[Type[T], Any],
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
@@ -516,9 +1560,14 @@ class AsyncBaseClient(BaseClient):
     ) -> T:
         """Make an asynchronous HTTP request.
 
+        Transient failures are retried according to the client's retry policy,
+        merged with any `retry` overrides in the request options. Identical
+        concurrent GET requests share one call when coalescing is enabled.
+
         Args:
             method: HTTP method
             path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -536,25 +1585,265 @@ class AsyncBaseClient(BaseClient):
 
         Raises:
             ApiError: If the request fails
+            CircuitOpenError: If the request's circuit is open
         """
-        req_cfg = self.build_request(
+        timer = self._phase_timer(method=method, path=path)
+        try:
+            await self._prepare_auth(auth_names)
+            if timer is not None:
+                timer.lap("auth")
+            req_cfg = self.build_request(
+                method=method,
+                path=path,
+                path_params=path_params,
+                service_name=service_name,
+                auth_names=auth_names,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content_type=content_type,
+                content=content,
+                request_options=request_options,
+            )
+            if timer is not None:
+                timer.lap("build")
+            coalescer = self._coalescer_for(method=method, cast_to=cast_to)
+            if self._streams_binary(cast_to=cast_to, opts=request_options):
+                # a stream can only be consumed by one caller
+                coalescer = None
+            key = coalesce_key(req_cfg, cast_to) if coalescer is not None else None
+            if coalescer is None or key is None:
+                result = await self._send(
+                    req_cfg=req_cfg,
+                    method=method,
+                    path=path,
+                    path_params=path_params,
+                    service_name=service_name,
+                    json=json,
+                    cast_to=cast_to,
+                    request_options=request_options,
+                    timer=timer,
+                )
+            else:
+                result = await coalescer.do(
+                    key,
+                    lambda: self._send(
+                        req_cfg=req_cfg,
+                        method=method,
+                        path=path,
+                        path_params=path_params,
+                        service_name=service_name,
+                        json=json,
+                        cast_to=cast_to,
+                        request_options=request_options,
+                        timer=timer,
+                    ),
+                )
+        except BaseException as exc:
+            if timer is not None:
+                timer.finish(self._observers, exc)
+            raise
+        if timer is not None:
+            timer.lap("decode")
+            timer.finish(self._observers)
+        return result
+
+    async def _send(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, Any]],
+        service_name: Optional[str],
+        json: Optional[Any],
+        cast_to: Union[Type[T], Any],
+        request_options: Optional[RequestOptions],
+        timer: Optional[PhaseTimer] = None,
+    ) -> T:
+        """Send a built request through the cache and retry layers and decode
+        its response.
+
+        Args:
+            req_cfg: Request configuration built by `build_request`
+            method: HTTP method
+            path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
+            service_name: The name of the API service to make the request to
+            json: JSON data
+            cast_to: Type to cast the response to
+            request_options: Additional request options
+            timer: Collects the phase timings of the request, None unless
+                the client has observers
+
+        Returns:
+            Response data of the specified type
+
+        Raises:
+            ApiError: If the request fails
+            CircuitOpenError: If the request's circuit is open
+        """
+        cache = self._cache_for(
             method=method,
             path=path,
-            service_name=service_name,
-            auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
-            content_type=content_type,
-            content=content,
+            cast_to=cast_to,
             request_options=request_options,
         )
-        response = await self.httpx_client.request(**req_cfg)
+        cache_key, cached = None, None
+        if cache is not None:
+            cache_key = cache.key(req_cfg, credentials=self._credentials())
+            cached = cache.lookup(cache_key, req_cfg)
+            if cached is not None:
+                if cached.is_fresh():
+                    return cache.hit(cached, cast_to, self.process_response)
+                cache.add_validators(cached, req_cfg)
+            if timer is not None:
+                timer.lap("cache")
+
+        lazy = self._streams_binary(cast_to=cast_to, opts=request_options)
+        # a stream can only be consumed once, so it is never hedged
+        hedger = None if lazy else self._hedger_for(method=method, opts=request_options)
+        retrier = self._retrier(req_cfg=req_cfg, opts=request_options)
+        circuit = self._circuit_for(
+            method=method, path=path, service_name=service_name
+        )
+        balancer = self._balancer_for(service_name)
+        attempt_cfg = req_cfg
+        if timer is not None:
+            attempt_cfg = timer.traced(req_cfg, is_async=True)
+
+        async def send_once(cfg: RequestConfig) -> httpx.Response:
+            if lazy:
+                build, send = _split_send_kwargs(cfg)
+                return await self.httpx_client.send(
+                    self.httpx_client.build_request(**build), stream=True, **send
+                )
+            return await self.httpx_client.request(**cfg)
+
+        sent = False
+
+        async def send_attempt() -> httpx.Response:
+            # every upstream request, hedges included, is accounted for by
+            # the circuit and the rate limiter on its own
+            nonlocal sent
+            sent = True
+            started = time.monotonic()
+            try:
+                # hedges pick their own endpoint
+                if balancer is not None:
+                    response = await balancer.acall(attempt_cfg, send_once)
+                else:
+                    response = await send_once(attempt_cfg)
+            except Exception as exc:
+                if circuit is not None:
+                    circuit.record_exception(exc, time.monotonic() - started)
+                raise
+            if circuit is not None:
+                circuit.record_response(response, time.monotonic() - started)
+            self._observe_rate_limit(method=method, path=path, response=response)
+            return response
+
+        async def send_hedge() -> httpx.Response:
+            # a hedge is an extra upstream request, admitted and paced as such
+            if circuit is not None:
+                circuit.acquire()
+            paced = self._rate_limit_delay(method=method, path=path)
+            if paced:
+                await asyncio.sleep(paced)
+            return await send_attempt()
+
+        def retryable(response: httpx.Response) -> bool:
+            return response.status_code >= 500 or response.status_code in (
+                retrier.policy.get("retry_status_codes", ())
+            )
+
+        try:
+            while True:
+                if circuit is not None:
+                    circuit.acquire()
+                paced = self._rate_limit_delay(method=method, path=path)
+                if paced:
+                    await asyncio.sleep(paced)
+                    if timer is not None:
+                        timer.lap("rate_limit")
+                try:
+                    if hedger is not None:
+                        response = await hedger.run(
+                            f"{method.upper()} {path}",
+                            send_attempt,
+                            hedge=send_hedge,
+                            retryable=retryable,
+                        )
+                    else:
+                        response = await send_attempt()
+                except Exception as exc:
+                    if timer is not None:
+                        timer.attempt(None)
+                    delay = retrier.exception_delay(exc)
+                    if delay is None:
+                        raise
+                else:
+                    if timer is not None:
+                        timer.attempt(response)
+                    delay = retrier.response_delay(response)
+                    if delay is None:
+                        break
+                    await response.aclose()
+                await asyncio.sleep(delay)
+                if timer is not None:
+                    timer.lap("backoff")
+        finally:
+            # whatever the outcome, a mutation which was sent may have been
+            # applied, unlike one rejected (e.g. by an open circuit) up front
+            if sent:
+                self._invalidate_cache(
+                    method=method,
+                    path=path,
+                    path_params=path_params,
+                    service_name=service_name,
+                    json=json,
+                )
+
+        if lazy:
+            if not response.is_success:
+                try:
+                    content = await aread_error_body(
+                        response, self._max_error_body_size
+                    )
+                finally:
+                    await response.aclose()
+                raise self._api_error(response, content)
+            binary = self._lazy_binary(
+                response=response, cast_to=cast_to, opts=request_options
+            )
+            if binary is not None:
+                return cast(T, binary)
+            await response.aread()
+
+        if cache is not None and cache_key is not None:
+            if cached is not None and response.status_code == 304:
+                return cache.revalidate(
+                    key=cache_key,
+                    entry=cached,
+                    response=response,
+                    path=path,
+                    cast_to=cast_to,
+                    decode=self.process_response,
+                )
+            if response.is_success:
+                return cache.store(
+                    key=cache_key,
+                    cfg=req_cfg,
+                    response=response,
+                    path=path,
+                    cast_to=cast_to,
+                    decode=self.process_response,
+                )
 
         if not response.is_success:
-            raise ApiError(response=response)
+            raise self._api_error(response)
 
         if self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
@@ -566,6 +1855,7 @@ class AsyncBaseClient(BaseClient):
         *,
         method: str,
         path: str,
+        path_params: Optional[Dict[str, Any]] = None,
         cast_to: Union[Type[T], Any],
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
@@ -583,6 +1873,7 @@ class AsyncBaseClient(BaseClient):
         Args:
             method: HTTP method
             path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -601,9 +1892,11 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
+        await self._prepare_auth(auth_names)
         req_cfg = self.build_request(
             method=method,
             path=path,
+            path_params=path_params,
             service_name=service_name,
             auth_names=auth_names,
             query_params=query_params,
@@ -615,6 +1908,87 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = await context.__aenter__()
+        response, context = await self._open_stream(
+            req_cfg,
+            method=method,
+            path=path,
+            service_name=service_name,
+            request_options=request_options,
+        )
         return AsyncStreamResponse(response, context, cast_to)
+
+    async def stream_json_array(
+        self,
+        *,
+        method: str,
+        path: str,
+        path_params: Optional[Dict[str, Any]] = None,
+        cast_to: Union[Type[T], Any],
+        service_name: Optional[str] = None,
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content_type: Optional[str] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncJsonArrayStreamResponse[T]:
+        """Make an asynchronous HTTP request whose JSON array response is decoded
+        incrementally.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            path_params: Values of the path's `{placeholder}` segments
+            cast_to: Type to cast each item of the array to
+            auth_names: List of auth provider IDs
+            service_name: The name of the API service to make the request to
+            query_params: Query parameters
+            headers: Request headers
+            data: Form data
+            files: Files to upload
+            json: JSON data
+            content_type: Content type header
+            content: Raw content
+            request_options: Additional request options
+
+        Returns:
+            AsyncJsonArrayStreamResponse yielding each item of the array
+
+        Raises:
+            ApiError: If the request fails
+        """
+        await self._prepare_auth(auth_names)
+        req_cfg = self.build_request(
+            method=method,
+            path=path,
+            path_params=path_params,
+            service_name=service_name,
+            auth_names=auth_names,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+        response, context = await self._open_stream(
+            req_cfg,
+            method=method,
+            path=path,
+            service_name=service_name,
+            request_options=request_options,
+        )
+
+        if not response.is_success:
+            try:
+                content = await aread_error_body(response, self._max_error_body_size)
+            finally:
+                await context.__aexit__(None, None, None)
+            raise self._api_error(response, content)
+
+        return AsyncJsonArrayStreamResponse(response, context, cast_to)
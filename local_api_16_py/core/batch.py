@@ -0,0 +1,477 @@
+"""
+Bounded concurrent fan-out of a single operation over many inputs.
+
+Every input produces a BatchResult holding either the operation's return value
+or the exception it raised, so one failure never aborts the rest of the batch.
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import TypedDict
+
+K = TypeVar("K")
+T = TypeVar("T")
+I = TypeVar("I")
+E = TypeVar("E")
+
+
+class BatchResult(Generic[K, T]):
+    """
+    Outcome of a single item of a batch operation.
+
+    Attributes:
+        key: The input the operation was called with
+        value: The operation's return value, None if it failed
+        error: The exception raised by the operation, None if it succeeded
+    """
+
+    key: K
+    value: Optional[T]
+    error: Optional[Exception]
+
+    def __init__(
+        self, *, key: K, value: Optional[T] = None, error: Optional[Exception] = None
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for this item"""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        Returns the value of a successful item, raising the captured exception
+        otherwise
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult(key={self.key!r}, error={self.error!r})"
+        return f"BatchResult(key={self.key!r}, value={self.value!r})"
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+async def _run_one(key: K, fn: Callable[[K], Awaitable[T]]) -> BatchResult[K, T]:
+    try:
+        return BatchResult(key=key, value=await fn(key))
+    except Exception as exc:
+        return BatchResult(key=key, error=exc)
+
+
+async def gather_bounded(
+    keys: Iterable[K], fn: Callable[[K], Awaitable[T]], *, concurrency: int
+) -> List[BatchResult[K, T]]:
+    """
+    Awaits `fn` for every key with at most `concurrency` calls in flight,
+    returning the results in the same order as `keys`.
+    """
+    _check_concurrency(concurrency)
+    indexed: List[Tuple[int, K]] = list(enumerate(keys))
+    results: List[Optional[BatchResult[K, T]]] = [None] * len(indexed)
+    pending = iter(indexed)
+
+    async def worker() -> None:
+        for index, key in pending:
+            results[index] = await _run_one(key, fn)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(indexed)))))
+    return results  # type: ignore[return-value]
+
+
+async def as_completed_bounded(
+    keys: Iterable[K], fn: Callable[[K], Awaitable[T]], *, concurrency: int
+) -> AsyncIterator[BatchResult[K, T]]:
+    """
+    Awaits `fn` for every key with at most `concurrency` calls in flight,
+    yielding each result as soon as it completes.
+
+    Closing the iterator early cancels the calls still in flight.
+    """
+    _check_concurrency(concurrency)
+    pending = iter(keys)
+    done: "asyncio.Queue[Optional[BatchResult[K, T]]]" = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for key in pending:
+                await done.put(await _run_one(key, fn))
+        finally:
+            await done.put(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await done.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _call_one(key: K, fn: Callable[[K], T]) -> BatchResult[K, T]:
+    try:
+        return BatchResult(key=key, value=fn(key))
+    except Exception as exc:
+        return BatchResult(key=key, error=exc)
+
+
+def map_threaded(
+    keys: Iterable[K], fn: Callable[[K], T], *, max_workers: int
+) -> List[BatchResult[K, T]]:
+    """
+    Calls `fn` for every key on a pool of at most `max_workers` threads,
+    returning the results in the same order as `keys`.
+    """
+    _check_concurrency(max_workers)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda key: _call_one(key, fn), keys))
+
+
+def as_completed_threaded(
+    keys: Iterable[K], fn: Callable[[K], T], *, max_workers: int
+) -> Iterator[BatchResult[K, T]]:
+    """
+    Calls `fn` for every key on a pool of at most `max_workers` threads,
+    yielding each result as soon as it completes.
+
+    Keys are consumed lazily, only enough of them to keep every worker busy
+    are submitted at a time, so `keys` may be a lazy iterable of any length.
+    Closing the iterator early cancels the calls which have not started yet.
+    """
+    _check_concurrency(max_workers)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending: Set["concurrent.futures.Future[BatchResult[K, T]]"] = set()
+    try:
+        for key in keys:
+            if len(pending) >= 2 * max_workers:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(_call_one, key, fn))
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+class BatchGet(Generic[K, T]):
+    """
+    Fans an operation fetching a single item (e.g. `pet.get`) out over many
+    keys, backing the `get_many` and `get_many_as_completed` methods of the
+    resources.
+
+    The operation is called with keyword arguments, so neither type parameter
+    can be inferred from it and callers parametrize the class explicitly, e.g.
+    `BatchGet[int, models.Pet](client.pet.get, key_param="pet_id")`.
+    """
+
+    def __init__(
+        self,
+        get: Callable[..., Any],
+        *,
+        key_param: str,
+        request_options: Optional[Any] = None,
+    ) -> None:
+        """
+        Args:
+            get: The operation, sync or async
+            key_param: Name of the operation's parameter receiving each key
+            request_options: Request options of every call
+        """
+        self._get = get
+        self._key_param = key_param
+        self._request_options = request_options
+
+    def _call(self, key: K) -> Any:
+        return self._get(
+            **{self._key_param: key}, request_options=self._request_options
+        )
+
+    def map(self, keys: Iterable[K], *, max_workers: int) -> List[BatchResult[K, T]]:
+        """Calls a sync operation for every key with `map_threaded`"""
+        return map_threaded(keys, self._call, max_workers=max_workers)
+
+    def as_completed(
+        self, keys: Iterable[K], *, max_workers: int
+    ) -> Iterator[BatchResult[K, T]]:
+        """Calls a sync operation for every key with `as_completed_threaded`"""
+        return as_completed_threaded(keys, self._call, max_workers=max_workers)
+
+    async def gather(
+        self, keys: Iterable[K], *, concurrency: int
+    ) -> List[BatchResult[K, T]]:
+        """Awaits an async operation for every key with `gather_bounded`"""
+        return await gather_bounded(keys, self._call, concurrency=concurrency)
+
+    def aas_completed(
+        self, keys: Iterable[K], *, concurrency: int
+    ) -> AsyncIterator[BatchResult[K, T]]:
+        """Awaits an async operation for every key with `as_completed_bounded`"""
+        return as_completed_bounded(keys, self._call, concurrency=concurrency)
+
+
+class ChunkInfo(TypedDict):
+    """
+    Identifies a chunk of a chunked batch operation.
+
+    Attributes:
+        index: Position of the chunk, counting from 0
+        start: Position of the chunk's first item in the input
+        size: Number of items in the chunk
+    """
+
+    index: int
+    start: int
+    size: int
+
+
+class ChunkCheckpoint(TypedDict):
+    """
+    Progress of a chunked batch operation, JSON serialisable so it can be
+    persisted and given back to resume the operation.
+
+    Attributes:
+        chunk_size: Number of items per chunk the operation was started with
+        completed: Indices of the chunks which succeeded, in ascending order
+    """
+
+    chunk_size: int
+    completed: List[int]
+
+
+class _Progress:
+    """Tracks the completed chunks of a chunked batch operation"""
+
+    def __init__(
+        self,
+        chunk_size: int,
+        checkpoint: Optional[ChunkCheckpoint],
+        on_checkpoint: Optional[Callable[[ChunkCheckpoint], None]],
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if checkpoint is not None and checkpoint["chunk_size"] != chunk_size:
+            raise ValueError(
+                f"checkpoint was made with chunk_size {checkpoint['chunk_size']}, "
+                f"not {chunk_size}"
+            )
+        self.chunk_size = chunk_size
+        self.completed: Set[int] = set(checkpoint["completed"] if checkpoint else ())
+        self._on_checkpoint = on_checkpoint
+
+    def chunks(self, items: Iterable[I]) -> Iterator[Tuple[ChunkInfo, List[I]]]:
+        """Splits the items into chunks, skipping the completed ones"""
+        iterator = iter(items)
+        for index in itertools.count():
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            if index not in self.completed:
+                yield self._info(index, chunk), chunk
+
+    async def achunks(
+        self, items: Union[Iterable[I], AsyncIterable[I]]
+    ) -> AsyncIterator[Tuple[ChunkInfo, List[I]]]:
+        """Asynchronous version of `chunks` also accepting async iterables"""
+        if not isinstance(items, AsyncIterable):
+            for info, chunk in self.chunks(items):
+                yield info, chunk
+            return
+        index, chunk = 0, []
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) == self.chunk_size:
+                if index not in self.completed:
+                    yield self._info(index, chunk), chunk
+                index, chunk = index + 1, []
+        if chunk and index not in self.completed:
+            yield self._info(index, chunk), chunk
+
+    def finish(self, result: BatchResult[ChunkInfo, T]) -> BatchResult[ChunkInfo, T]:
+        """Records a chunk's result, reporting the new checkpoint on success"""
+        if result.ok:
+            self.completed.add(result.key["index"])
+            if self._on_checkpoint is not None:
+                self._on_checkpoint(
+                    {"chunk_size": self.chunk_size, "completed": sorted(self.completed)}
+                )
+        return result
+
+    def _info(self, index: int, chunk: List[Any]) -> ChunkInfo:
+        return {"index": index, "start": index * self.chunk_size, "size": len(chunk)}
+
+
+def _encode_and_send(
+    chunk: List[I], encode: Callable[[List[I]], E], send: Callable[[E], T]
+) -> T:
+    return send(encode(chunk))
+
+
+def map_chunks_threaded(
+    items: Iterable[I],
+    encode: Callable[[List[I]], E],
+    send: Callable[[E], T],
+    *,
+    chunk_size: int,
+    max_workers: int,
+    checkpoint: Optional[ChunkCheckpoint] = None,
+    on_checkpoint: Optional[Callable[[ChunkCheckpoint], None]] = None,
+) -> Iterator[BatchResult[ChunkInfo, T]]:
+    """
+    Splits `items` into chunks and calls `send(encode(chunk))` for each on a
+    pool of at most `max_workers` threads, yielding each chunk's result as
+    soon as it completes.
+
+    While chunks are being sent, the following ones are encoded by the other
+    workers. Only the chunks being processed, or waiting for a free worker,
+    are held in memory, so `items` may be a lazy iterable of any length.
+
+    Args:
+        items: Items to process
+        encode: Validates and serialises a chunk
+        send: Sends an encoded chunk
+        chunk_size: Number of items per chunk
+        max_workers: Maximum number of chunks processed concurrently
+        checkpoint: Progress of an earlier run over the same items, whose
+            completed chunks are skipped
+        on_checkpoint: Called with the updated progress after every chunk
+            which succeeded
+
+    Closing the iterator early cancels the chunks which have not started yet.
+    """
+    _check_concurrency(max_workers)
+    progress = _Progress(chunk_size, checkpoint, on_checkpoint)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending: Set["concurrent.futures.Future[BatchResult[ChunkInfo, T]]"] = set()
+    try:
+        for info, chunk in progress.chunks(items):
+            if len(pending) >= 2 * max_workers:
+                # enough chunks queued to keep every worker busy
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield progress.finish(future.result())
+            pending.add(
+                executor.submit(
+                    _call_one,
+                    info,
+                    lambda _, chunk=chunk: _encode_and_send(chunk, encode, send),
+                )
+            )
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield progress.finish(future.result())
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def map_chunks_bounded(
+    items: Union[Iterable[I], AsyncIterable[I]],
+    encode: Callable[[List[I]], E],
+    send: Callable[[E], Awaitable[T]],
+    *,
+    chunk_size: int,
+    concurrency: int,
+    checkpoint: Optional[ChunkCheckpoint] = None,
+    on_checkpoint: Optional[Callable[[ChunkCheckpoint], None]] = None,
+) -> AsyncIterator[BatchResult[ChunkInfo, T]]:
+    """
+    Splits `items` into chunks and awaits `send(encode(chunk))` for each with
+    at most `concurrency` chunks in flight, yielding each chunk's result as
+    soon as it completes.
+
+    Chunks are encoded in the default executor, so validation and
+    serialisation run alongside the chunks in flight rather than blocking
+    the event loop. Only the chunks in flight are held in memory.
+
+    Args:
+        items: Items to process, an iterable or async iterable
+        encode: Validates and serialises a chunk
+        send: Sends an encoded chunk
+        chunk_size: Number of items per chunk
+        concurrency: Maximum number of chunks in flight
+        checkpoint: Progress of an earlier run over the same items, whose
+            completed chunks are skipped
+        on_checkpoint: Called with the updated progress after every chunk
+            which succeeded
+
+    Closing the iterator early cancels the chunks still in flight.
+    """
+    _check_concurrency(concurrency)
+    progress = _Progress(chunk_size, checkpoint, on_checkpoint)
+    loop = asyncio.get_running_loop()
+
+    async def run(info: ChunkInfo, chunk: List[I]) -> BatchResult[ChunkInfo, T]:
+        try:
+            encoded = await loop.run_in_executor(None, encode, chunk)
+            return BatchResult(key=info, value=await send(encoded))
+        except Exception as exc:
+            return BatchResult(key=info, error=exc)
+
+    pending: Set["asyncio.Future[BatchResult[ChunkInfo, T]]"] = set()
+    try:
+        async for info, chunk in progress.achunks(items):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield progress.finish(task.result())
+            pending.add(asyncio.ensure_future(run(info, chunk)))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield progress.finish(task.result())
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -1,5 +1,18 @@
+import asyncio
+import mmap
+import os
+import tempfile
+from typing import IO, Any, AsyncIterator, Callable, Iterator, Optional, Union
+
+import httpx
 from httpx._models import Headers
 
+DEFAULT_SPILL_THRESHOLD = 8 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+WriteTarget = Union[str, "os.PathLike[str]", int, IO[bytes]]
+"""A path, an open file descriptor or a binary file object"""
+
 
 class BinaryResponse:
     """
@@ -7,9 +20,13 @@ class BinaryResponse:
 
     A lightweight wrapper for binary content and its associated HTTP headers,
     typically used for handling file downloads or raw binary data from HTTP requests.
+
+    Responses created with `from_stream` are lazy, the body is only read
+    from the connection when it is iterated, written out or buffered.
+    Bodies larger than the spill threshold are buffered in a temporary file
+    rather than in memory, and can be accessed through a memory map.
     """
 
-    content: bytes
     headers: Headers
 
     def __init__(self, content: bytes, headers: Headers) -> None:
@@ -19,5 +36,265 @@ class BinaryResponse:
         The content represents the raw binary data received in the response,
         while headers contain the associated HTTP response headers.
         """
-        self.content = content
         self.headers = headers
+        self._content: Optional[bytes] = content
+        self._response: Optional[httpx.Response] = None
+        self._spill_threshold = DEFAULT_SPILL_THRESHOLD
+        self._spill_file: Optional[IO[bytes]] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._buffer = bytearray()
+
+    @classmethod
+    def from_stream(
+        cls,
+        response: httpx.Response,
+        *,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+    ) -> "BinaryResponse":
+        """
+        Wraps a response whose body has not been read yet.
+
+        Args:
+            response: A response sent with `stream=True`
+            spill_threshold: Size in bytes above which a buffered body is kept
+                in a temporary file rather than in memory
+        """
+        binary = cls(content=b"", headers=response.headers)
+        binary._content = None
+        binary._response = response
+        binary._spill_threshold = spill_threshold
+        return binary
+
+    @property
+    def is_buffered(self) -> bool:
+        """Whether the whole body has been read, into memory or a temporary file"""
+        return self._content is not None or self._spill_file is not None
+
+    @property
+    def is_spilled(self) -> bool:
+        """Whether the body has been buffered in a temporary file"""
+        return self._spill_file is not None
+
+    @property
+    def content(self) -> bytes:
+        """
+        The whole body, reading it from the connection first if needed.
+
+        Loads spilled bodies back into memory, prefer `iter_bytes`, `write_to`
+        or `view` for large payloads.
+        """
+        if not self.is_buffered:
+            self.read()
+        if self._content is not None:
+            return self._content
+        return bytes(self.view())
+
+    def read(self) -> None:
+        """
+        Buffers the body, spilling it to a temporary file when it is larger
+        than the spill threshold.
+        """
+        if self.is_buffered:
+            return
+        response = self._require_stream()
+        try:
+            self._buffer_start()
+            for chunk in response.iter_bytes(_CHUNK_SIZE):
+                self._buffer_chunk(chunk)
+        finally:
+            response.close()
+        self._buffer_end()
+
+    async def aread(self) -> None:
+        """Asynchronous version of `read`"""
+        if self.is_buffered:
+            return
+        response = self._require_stream()
+        try:
+            self._buffer_start()
+            async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                self._buffer_chunk(chunk)
+        finally:
+            await response.aclose()
+        self._buffer_end()
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterates over the body in chunks.
+
+        An unbuffered body is streamed straight from the connection and can
+        only be iterated once.
+        """
+        if self.is_buffered:
+            yield from self._iter_buffered(chunk_size or _CHUNK_SIZE)
+            return
+        response = self._require_stream()
+        self._response = None
+        try:
+            yield from response.iter_bytes(chunk_size)
+        finally:
+            response.close()
+
+    async def aiter_bytes(
+        self, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Asynchronous version of `iter_bytes`"""
+        if self.is_buffered:
+            for chunk in self._iter_buffered(chunk_size or _CHUNK_SIZE):
+                yield chunk
+            return
+        response = self._require_stream()
+        self._response = None
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    def write_to(self, target: WriteTarget) -> int:
+        """
+        Writes the body to a path, file descriptor or file object in chunks.
+
+        Returns:
+            The number of bytes written
+        """
+        written = 0
+        with _Writer(target) as write:
+            for chunk in self.iter_bytes(_CHUNK_SIZE):
+                write(chunk)
+                written += len(chunk)
+        return written
+
+    async def awrite_to(self, target: WriteTarget) -> int:
+        """
+        Asynchronous version of `write_to`, writing in the default executor
+        so the event loop is never blocked on disk I/O.
+        """
+        loop = asyncio.get_running_loop()
+        written = 0
+        with _Writer(target) as write:
+            async for chunk in self.aiter_bytes(_CHUNK_SIZE):
+                await loop.run_in_executor(None, write, chunk)
+                written += len(chunk)
+        return written
+
+    def view(self) -> memoryview:
+        """
+        A zero-copy view of the buffered body, backed by a memory map of the
+        temporary file when the body was spilled.
+
+        Raises:
+            RuntimeError: If the body has not been buffered with `read`/`aread`
+        """
+        if self._content is not None:
+            return memoryview(self._content)
+        if self._spill_file is None:
+            raise RuntimeError("the body must be buffered with read()/aread() first")
+        if os.fstat(self._spill_file.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            return memoryview(b"")
+        if self._mmap is None:
+            self._mmap = mmap.mmap(
+                self._spill_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return memoryview(self._mmap)
+
+    def close(self) -> None:
+        """Releases the connection and any temporary file"""
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+        self._release_buffer()
+
+    async def aclose(self) -> None:
+        """Asynchronous version of `close`"""
+        if self._response is not None:
+            await self._response.aclose()
+            self._response = None
+        self._release_buffer()
+
+    def __enter__(self) -> "BinaryResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "BinaryResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _require_stream(self) -> httpx.Response:
+        if self._response is None:
+            raise httpx.StreamConsumed()
+        return self._response
+
+    def _buffer_start(self) -> None:
+        length = self.headers.get("content-length")
+        if length is not None and length.isdigit():
+            if int(length) > self._spill_threshold:
+                # no point buffering in memory first
+                self._spill_file = tempfile.TemporaryFile()
+
+    def _buffer_chunk(self, chunk: bytes) -> None:
+        if self._spill_file is not None:
+            self._spill_file.write(chunk)
+            return
+        self._buffer += chunk
+        if len(self._buffer) > self._spill_threshold:
+            self._spill_file = tempfile.TemporaryFile()
+            self._spill_file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def _buffer_end(self) -> None:
+        self._response = None
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        else:
+            self._content = bytes(self._buffer)
+        self._buffer = bytearray()
+
+    def _iter_buffered(self, chunk_size: int) -> Iterator[bytes]:
+        view = self.view()
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset : offset + chunk_size])
+
+    def _release_buffer(self) -> None:
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # a view returned by `view` is still alive
+                pass
+            self._mmap = None
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+class _Writer:
+    """Chunk writer for the targets accepted by `BinaryResponse.write_to`"""
+
+    def __init__(self, target: WriteTarget):
+        self._target = target
+        self._file: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> Callable[[bytes], Any]:
+        target = self._target
+        if isinstance(target, (str, os.PathLike)):
+            self._file = open(target, "wb")
+            return self._file.write
+        if isinstance(target, int):
+            return self._write_fd
+        return target.write
+
+    def __exit__(self, *args: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def _write_fd(self, chunk: bytes) -> None:
+        view = memoryview(chunk)
+        while view:
+            written = os.write(self._target, view)  # type: ignore[arg-type]
+            view = view[written:]
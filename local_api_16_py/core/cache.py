@@ -0,0 +1,503 @@
+"""
+HTTP response caching for GET requests.
+
+Responses are stored according to their `Cache-Control`/`Expires` headers (or
+a configured TTL) and served without a round trip while fresh. Once stale,
+entries carrying an `ETag` or `Last-Modified` validator are revalidated with a
+conditional request, so a `304 Not Modified` answer skips both the body
+transfer and its decoding.
+"""
+
+import abc
+import copy
+import datetime
+import email.utils
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from typing_extensions import NotRequired, TypedDict
+
+from .request import RequestConfig
+
+
+class CacheEntry:
+    """
+    A cached response.
+
+    Attributes:
+        status_code: Status code of the cached response
+        headers: Headers of the cached response
+        content: Body of the cached response
+        expires_at: Unix time after which the entry must be revalidated
+        vary: Values of the request headers named by the response's `Vary` header
+    """
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        content: bytes,
+        expires_at: float,
+        vary: Dict[str, Optional[str]],
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+        self.vary = vary
+        # values decoded from `content`, keyed by the type they were cast to
+        self._decoded: Dict[Any, Any] = {}
+
+    def is_fresh(self) -> bool:
+        """Whether the entry may be served without revalidation"""
+        return time.time() < self.expires_at
+
+    def to_response(self) -> httpx.Response:
+        """Rebuilds the cached response"""
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.content
+        )
+
+
+class CacheBackend(abc.ABC):
+    """
+    Storage for cached responses.
+
+    Implementations must be safe to use from multiple threads.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry stored under `key`, None if there is none
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Stores `entry` under `key`, replacing any previous entry
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the entry stored under `key`, if any
+        """
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Removes every entry whose key starts with `prefix`.
+
+        Backends which cannot look up keys by prefix may keep this default,
+        which clears all entries, stale reads are never served but unrelated
+        entries are dropped too.
+        """
+        self.clear()
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all entries
+        """
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache backend.
+
+    Entries are kept as is, so values decoded from them are copied on later
+    hits rather than decoded again. Once `maxsize` entries are held, the
+    least recently used one is evicted.
+    """
+
+    def __init__(self, *, maxsize: int = 1024):
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheInvalidation(TypedDict):
+    """
+    A read endpoint whose cached responses a mutating operation makes stale.
+
+    Placeholders of `path` are filled from the mutating request, cached
+    responses of the resulting URL (with any query) are then dropped. When a
+    placeholder cannot be filled, the responses of every URL of the endpoint
+    are dropped instead.
+
+    Attributes:
+        path: Path pattern of the GET endpoint, e.g. `/pet/{petId}`
+        path_params: Maps placeholders of `path` to path parameters of the
+            mutating operation
+        body_params: Maps placeholders of `path` to top-level fields of the
+            mutating operation's JSON body
+    """
+
+    path: str
+    path_params: NotRequired[Dict[str, str]]
+    body_params: NotRequired[Dict[str, str]]
+
+
+InvalidationMap = Dict[str, List[CacheInvalidation]]
+"""
+Maps mutating operations, written as `"<METHOD> <path pattern>"` (e.g.
+`"DELETE /pet/{petId}"`), to the cached reads they make stale
+"""
+
+
+class ResponseCacheConfig(TypedDict):
+    """
+    Enables and configures caching of GET responses.
+
+    Attributes:
+        backend: Where entries are stored, defaults to a `MemoryCache`
+        ttl: Seconds a response stays fresh when it has neither a
+            `Cache-Control: max-age` nor an `Expires` header
+        ttl_overrides: Seconds responses stay fresh per endpoint path as
+            written in the API docs (e.g. `/pet/{petId}`), taking precedence
+            over the response's `max-age`/`Expires` headers
+        max_entries: Capacity of the default `MemoryCache`
+        invalidations: Cached reads to drop once a mutating operation is sent
+        paths: Path patterns of the GET endpoints whose responses are cached,
+            e.g. `/pet/{petId}`, every GET endpoint when omitted
+    """
+
+    backend: NotRequired[CacheBackend]
+    ttl: NotRequired[float]
+    ttl_overrides: NotRequired[Dict[str, float]]
+    max_entries: NotRequired[int]
+    invalidations: NotRequired[InvalidationMap]
+    paths: NotRequired[List[str]]
+
+
+def default_response_cache_config() -> ResponseCacheConfig:
+    """
+    Provides the default response cache configuration.
+
+    Responses without freshness headers are stored for 60 seconds in an
+    in-memory LRU of 1024 entries, no invalidations are applied.
+    """
+    return {
+        "ttl": 60.0,
+        "ttl_overrides": {},
+        "max_entries": 1024,
+        "invalidations": {},
+    }
+
+
+class ResponseCacheStats(TypedDict):
+    """
+    Snapshot of a response cache's counters.
+
+    Attributes:
+        hits: Requests served from a fresh entry without a round trip
+        revalidated: Requests served from a stale entry after a 304 response
+        misses: Requests which had to transfer and decode a full response
+        hit_ratio: Fraction of cacheable requests served from the cache
+    """
+
+    hits: int
+    revalidated: int
+    misses: int
+    hit_ratio: float
+
+
+def _cache_control(headers: httpx.Headers) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for value in headers.get_list("cache-control", split_commas=True):
+        name, _, arg = value.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def _expires_in(headers: httpx.Headers) -> Optional[float]:
+    value = headers.get("expires")
+    if value is None:
+        return None
+    try:
+        expires_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        # invalid dates, e.g. "0", mean already expired
+        return 0.0
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (expires_at - now).total_seconds())
+
+
+class ResponseCache:
+    """
+    Applies a `ResponseCacheConfig` to the GET requests of a client.
+
+    Only successful (200) responses are stored, `Cache-Control: no-store` and
+    `Vary: *` responses never are. `no-cache` responses are stored but always
+    revalidated. Every hit returns its own copy of the decoded value, so
+    callers may modify it freely.
+    """
+
+    def __init__(self, config: ResponseCacheConfig):
+        config = {**default_response_cache_config(), **config}
+        backend = config.get("backend")
+        if backend is None:
+            backend = MemoryCache(maxsize=config.get("max_entries", 1024))
+        self.backend = backend
+        self._ttl = config.get("ttl", 0.0)
+        self._ttl_overrides = config.get("ttl_overrides", {})
+        self._invalidations = config.get("invalidations", {})
+        paths = config.get("paths")
+        self._paths = None if paths is None else frozenset(paths)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def caches(self, path: str) -> bool:
+        """Whether responses of the endpoint with path pattern `path` are cached"""
+        return self._paths is None or path in self._paths
+
+    def key(
+        self, cfg: RequestConfig, *, credentials: Iterable[Tuple[str, str]] = ()
+    ) -> str:
+        """
+        Builds the key a request's response is stored under.
+
+        Responses are keyed by URL and by the credentials they were requested
+        with, the `Authorization` header, HTTP auth, cookies and the parameters
+        named by `credentials` (the location and name of the auth providers'
+        parameters). Credentials only enter the key as a digest, credentials
+        sent in the query are removed from the URL.
+        """
+        url = httpx.URL(cfg["url"], params=cfg.get("params"))
+        secrets: List[Any] = []
+        auth_headers = {"authorization", "proxy-authorization", "cookie"}
+        for location, name in credentials:
+            if location == "header":
+                auth_headers.add(name.lower())
+            elif location == "query" and name in url.params:
+                secrets.append((name, url.params.get_list(name)))
+                url = url.copy_remove_param(name)
+
+        headers = httpx.Headers(cfg.get("headers"))
+        for name in sorted(auth_headers):
+            if name in headers:
+                secrets.append((name, headers.get_list(name)))
+        if cfg.get("auth") is not None:
+            secrets.append(("auth", cfg["auth"]))
+        cookies = cfg.get("cookies")
+        if cookies:
+            secrets.append(("cookies", sorted(dict(cookies).items())))
+
+        key = f"GET {url}"
+        if secrets:
+            digest = hashlib.sha256(repr(secrets).encode()).hexdigest()
+            key += f" auth={digest}"
+        return key
+
+    def lookup(self, key: str, cfg: RequestConfig) -> Optional[CacheEntry]:
+        """
+        Returns the entry for the request, None if there is none or it was
+        stored for a request with different `Vary` header values
+        """
+        entry = self.backend.get(key)
+        if entry is None or not entry.vary:
+            return entry
+        headers = httpx.Headers(cfg.get("headers"))
+        for name, value in entry.vary.items():
+            if headers.get(name) != value:
+                return None
+        return entry
+
+    def add_validators(self, entry: CacheEntry, cfg: RequestConfig) -> None:
+        """Turns the request into a conditional request revalidating `entry`"""
+        cached = httpx.Headers(entry.headers)
+        headers = cfg.setdefault("headers", {})
+        etag = cached.get("etag")
+        if etag is not None:
+            headers["if-none-match"] = etag
+        last_modified = cached.get("last-modified")
+        if last_modified is not None:
+            headers["if-modified-since"] = last_modified
+
+    def hit(self, entry: CacheEntry, cast_to: Any, decode: Callable[..., Any]) -> Any:
+        """Serves a request from a fresh entry"""
+        self._count("hits")
+        return self._decode(entry, cast_to, decode)
+
+    def revalidate(
+        self,
+        *,
+        key: str,
+        entry: CacheEntry,
+        response: httpx.Response,
+        path: str,
+        cast_to: Any,
+        decode: Callable[..., Any],
+    ) -> Any:
+        """
+        Serves a request from a stale entry the server answered with 304,
+        extending its freshness with the 304's headers
+        """
+        self._count("revalidated")
+        headers = httpx.Headers(entry.headers)
+        for name in ("cache-control", "expires", "etag", "last-modified", "date"):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        entry.headers = headers.multi_items()
+        entry.expires_at = time.time() + self._freshness(headers, path)
+        self.backend.set(key, entry)
+        return self._decode(entry, cast_to, decode)
+
+    def store(
+        self,
+        *,
+        key: str,
+        cfg: RequestConfig,
+        response: httpx.Response,
+        path: str,
+        cast_to: Any,
+        decode: Callable[..., Any],
+    ) -> Any:
+        """Stores a full response if it is cacheable and returns it decoded"""
+        self._count("misses")
+        entry = self._entry(cfg=cfg, response=response, path=path)
+        if entry is None:
+            self.backend.delete(key)
+            return decode(response=response, cast_to=cast_to)
+        self.backend.set(key, entry)
+        return self._decode(entry, cast_to, decode, response=response)
+
+    def invalidations(self, *, method: str, path: str) -> List[CacheInvalidation]:
+        """Returns the cached reads made stale by an operation"""
+        return self._invalidations.get(f"{method.upper()} {path}", [])
+
+    def invalidate(self, url: str) -> None:
+        """Drops the cached responses of `url`, regardless of their query"""
+        key = f"GET {httpx.URL(url)}"
+        self.backend.delete(key)
+        self.backend.delete_prefix(f"{key}?")
+        self.backend.delete_prefix(f"{key} ")
+
+    def invalidate_prefix(self, url_prefix: str) -> None:
+        """Drops the cached responses of every URL starting with `url_prefix`"""
+        self.backend.delete_prefix(f"GET {httpx.URL(url_prefix)}")
+
+    def stats(self) -> ResponseCacheStats:
+        """Returns the current hit/miss counters of the cache"""
+        with self._lock:
+            hits, revalidated, misses = (
+                self._counts["hits"],
+                self._counts["revalidated"],
+                self._counts["misses"],
+            )
+        total = hits + revalidated + misses
+        return {
+            "hits": hits,
+            "revalidated": revalidated,
+            "misses": misses,
+            "hit_ratio": (hits + revalidated) / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drops all entries and resets the counters"""
+        self.backend.clear()
+        with self._lock:
+            for counter in self._counts:
+                self._counts[counter] = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counts[counter] += 1
+
+    def _freshness(self, headers: httpx.Headers, path: str) -> float:
+        directives = _cache_control(headers)
+        if "no-cache" in directives:
+            return 0.0
+        if path in self._ttl_overrides:
+            return self._ttl_overrides[path]
+        max_age = directives.get("max-age")
+        if max_age is not None and max_age.isdigit():
+            return float(max_age)
+        expires_in = _expires_in(headers)
+        if expires_in is not None:
+            return expires_in
+        return self._ttl
+
+    def _entry(
+        self, *, cfg: RequestConfig, response: httpx.Response, path: str
+    ) -> Optional[CacheEntry]:
+        headers = response.headers
+        if response.status_code != 200 or "no-store" in _cache_control(headers):
+            return None
+
+        vary_names = [
+            name.strip().lower()
+            for name in headers.get_list("vary", split_commas=True)
+        ]
+        if "*" in vary_names:
+            return None
+
+        freshness = self._freshness(headers, path)
+        if freshness <= 0 and "etag" not in headers and "last-modified" not in headers:
+            # could neither be served nor revalidated
+            return None
+
+        req_headers = httpx.Headers(cfg.get("headers"))
+        return CacheEntry(
+            status_code=response.status_code,
+            headers=headers.multi_items(),
+            content=response.content,
+            expires_at=time.time() + freshness,
+            vary={name: req_headers.get(name) for name in vary_names},
+        )
+
+    def _decode(
+        self,
+        entry: CacheEntry,
+        cast_to: Any,
+        decode: Callable[..., Any],
+        response: Optional[httpx.Response] = None,
+    ) -> Any:
+        try:
+            if cast_to in entry._decoded:
+                return copy.deepcopy(entry._decoded[cast_to])
+        except TypeError:
+            # unhashable type, cannot be memoized
+            return decode(response=response or entry.to_response(), cast_to=cast_to)
+
+        # the memoized value is never handed out, callers could modify it
+        value = decode(response=response or entry.to_response(), cast_to=cast_to)
+        entry._decoded[cast_to] = value
+        return copy.deepcopy(value)
@@ -0,0 +1,333 @@
+"""
+Circuit breakers failing requests fast while an upstream is degraded.
+
+A breaker records the outcome of the last `window` calls. Once enough of them
+failed or were slow it opens and rejects calls without sending them. After
+`open_duration` it lets a few probe calls through (half-open) and closes
+again if they succeed, or reopens if any of them fails.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Collection, Deque, Dict, Optional, Tuple, Type
+
+import httpx
+from typing_extensions import Literal, NotRequired, TypedDict
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerThresholds(TypedDict):
+    """
+    Controls when a circuit opens and how it recovers.
+
+    Attributes:
+        window: Number of most recent calls the failure rates are computed over
+        min_calls: Calls to record before the circuit may open
+        failure_rate: Fraction of failed calls (between 0 and 1) which opens
+            the circuit
+        slow_call_duration: Seconds after which a call counts as slow, None to
+            ignore latency
+        slow_call_rate: Fraction of slow calls (between 0 and 1) which opens
+            the circuit
+        open_duration: Seconds an open circuit rejects calls before letting
+            probes through
+        half_open_calls: Probe calls which must succeed to close the circuit
+        failure_status_codes: Response status codes counted as failures
+        failure_exceptions: Exception types raised by the transport which are
+            counted as failures
+    """
+
+    window: NotRequired[int]
+    min_calls: NotRequired[int]
+    failure_rate: NotRequired[float]
+    slow_call_duration: NotRequired[Optional[float]]
+    slow_call_rate: NotRequired[float]
+    open_duration: NotRequired[float]
+    half_open_calls: NotRequired[int]
+    failure_status_codes: NotRequired[Collection[int]]
+    failure_exceptions: NotRequired[Tuple[Type[BaseException], ...]]
+
+
+class CircuitBreakerConfig(CircuitBreakerThresholds):
+    """
+    Configures the circuit breakers of a client.
+
+    Any key left out falls back to `default_circuit_breaker_config()`.
+
+    Attributes:
+        per_operation: Give every operation its own circuit rather than
+            sharing one per service
+        operations: Thresholds of operations with their own circuit, keyed by
+            method and path pattern, e.g. "GET /pet/{petId}", on top of the
+            thresholds above
+    """
+
+    per_operation: NotRequired[bool]
+    operations: NotRequired[Dict[str, CircuitBreakerThresholds]]
+
+
+def default_circuit_breaker_config() -> CircuitBreakerConfig:
+    """
+    Provides the default circuit breaker configuration, opening a service's
+    circuit for 30 seconds once half of its last 20 calls failed with a 5xx
+    status or a transport error.
+    """
+    return {
+        "window": 20,
+        "min_calls": 10,
+        "failure_rate": 0.5,
+        "slow_call_duration": None,
+        "slow_call_rate": 1.0,
+        "open_duration": 30.0,
+        "half_open_calls": 3,
+        "failure_status_codes": frozenset(range(500, 600)),
+        "failure_exceptions": (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+        ),
+        "per_operation": False,
+        "operations": {},
+    }
+
+
+class CircuitBreakerState(TypedDict):
+    """
+    Snapshot of a circuit.
+
+    Attributes:
+        state: "closed", "open" or "half_open"
+        calls: Calls in the current window
+        failure_rate: Fraction of failed calls in the window
+        slow_call_rate: Fraction of slow calls in the window
+        retry_after: Seconds until an open circuit lets probes through,
+            0 unless open
+        rejected: Calls rejected while the circuit was open
+    """
+
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    retry_after: float
+    rejected: int
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while its circuit is open.
+
+    Attributes:
+        circuit: Name of the open circuit, the service name or the operation
+        retry_after: Seconds until the circuit lets probe requests through
+    """
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        super().__init__(
+            f"circuit {circuit!r} is open, retry in {retry_after:.2f} seconds"
+        )
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker of a service or operation"""
+
+    def __init__(self, name: str, thresholds: CircuitBreakerThresholds) -> None:
+        """
+        Args:
+            name: Name of the circuit reported by `CircuitOpenError`
+            thresholds: Complete thresholds of the circuit
+        """
+        self.name = name
+        self._thresholds = thresholds
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=thresholds["window"])
+        self._failures = 0
+        self._slow = 0
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._probing_since = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self._state
+
+    def acquire(self) -> None:
+        """
+        Admits a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every
+                probe already admitted
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._refresh(now)
+            if self._state == "closed":
+                return
+            if self._state == "half_open":
+                if self._probes < self._thresholds["half_open_calls"]:
+                    self._probes += 1
+                    return
+                if now - self._probing_since >= self._thresholds["open_duration"]:
+                    # probes which never reported back, e.g. cancelled calls
+                    self._half_open(now)
+                    self._probes += 1
+                    return
+            self._rejected += 1
+            retry_after = self._retry_after(now)
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_response(self, response: httpx.Response, latency: float) -> None:
+        """
+        Records the outcome of a call which received a response.
+
+        Args:
+            response: Response to the call
+            latency: Seconds the call took
+        """
+        failed = response.status_code in self._thresholds["failure_status_codes"]
+        self._record(failed, latency)
+
+    def record_exception(self, exc: BaseException, latency: float) -> None:
+        """
+        Records the outcome of a call which raised. Exceptions which are not
+        transport failures, e.g. invalid requests, are counted as successes.
+
+        Args:
+            exc: Exception raised by the call
+            latency: Seconds the call took
+        """
+        self._record(isinstance(exc, self._thresholds["failure_exceptions"]), latency)
+
+    def snapshot(self) -> CircuitBreakerState:
+        now = time.monotonic()
+        with self._lock:
+            self._refresh(now)
+            calls = len(self._outcomes)
+            return {
+                "state": self._state,
+                "calls": calls,
+                "failure_rate": self._failures / calls if calls else 0.0,
+                "slow_call_rate": self._slow / calls if calls else 0.0,
+                "retry_after": self._retry_after(now) if self._state == "open" else 0.0,
+                "rejected": self._rejected,
+            }
+
+    def _record(self, failed: bool, latency: float) -> None:
+        slow_after = self._thresholds["slow_call_duration"]
+        slow = slow_after is not None and latency >= slow_after
+        now = time.monotonic()
+        with self._lock:
+            self._refresh(now)
+            if self._state == "open":
+                # a call admitted before the circuit opened
+                return
+            if self._state == "half_open":
+                if failed or slow:
+                    self._open(now)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self._thresholds["half_open_calls"]:
+                        self._close()
+                return
+
+            if len(self._outcomes) == self._outcomes.maxlen:
+                old_failed, old_slow = self._outcomes[0]
+                self._failures -= old_failed
+                self._slow -= old_slow
+            self._outcomes.append((failed, slow))
+            self._failures += failed
+            self._slow += slow
+            calls = len(self._outcomes)
+            if calls < self._thresholds["min_calls"]:
+                return
+            if self._failures >= self._thresholds["failure_rate"] * calls or (
+                slow_after is not None
+                and self._slow >= self._thresholds["slow_call_rate"] * calls
+            ):
+                self._open(now)
+
+    def _refresh(self, now: float) -> None:
+        if (
+            self._state == "open"
+            and now - self._opened_at >= self._thresholds["open_duration"]
+        ):
+            self._half_open(now)
+
+    def _retry_after(self, now: float) -> float:
+        return max(0.0, self._opened_at + self._thresholds["open_duration"] - now)
+
+    def _open(self, now: float) -> None:
+        self._state = "open"
+        self._opened_at = now
+
+    def _half_open(self, now: float) -> None:
+        self._state = "half_open"
+        self._probing_since = now
+        self._probes = 0
+        self._probe_successes = 0
+
+    def _close(self) -> None:
+        self._state = "closed"
+        self._outcomes.clear()
+        self._failures = 0
+        self._slow = 0
+
+
+class CircuitBreakers:
+    """The circuits of a client, created on first use"""
+
+    def __init__(self, config: CircuitBreakerConfig) -> None:
+        self._config: CircuitBreakerConfig = {
+            **default_circuit_breaker_config(),
+            **config,
+        }
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, CircuitBreaker] = {}
+
+    def get(self, service: Optional[str], operation: str) -> CircuitBreaker:
+        """
+        Gets the circuit guarding an operation of a service.
+
+        Service circuits are named after the service ("default" for the API's
+        default service) and operation circuits after the operation, prefixed
+        by the service name unless it is the default one.
+
+        Args:
+            service: Name of the service, None for the default service
+            operation: Method and path pattern of the request, e.g. "GET /pet/{petId}"
+
+        Returns:
+            The operation's circuit if it has its own, else the service's
+        """
+        overrides = (self._config.get("operations") or {}).get(operation)
+        if overrides is None and not self._config.get("per_operation"):
+            name = service or "default"
+        elif service is None:
+            name = operation
+        else:
+            name = f"{service} {operation}"
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.get(name)
+                if circuit is None:
+                    thresholds = {**self._config, **(overrides or {})}
+                    circuit = self._circuits[name] = CircuitBreaker(
+                        name, thresholds  # type: ignore[arg-type]
+                    )
+        return circuit
+
+    def states(self) -> Dict[str, CircuitBreakerState]:
+        with self._lock:
+            circuits = list(self._circuits.values())
+        return {circuit.name: circuit.snapshot() for circuit in circuits}
@@ -0,0 +1,158 @@
+"""
+Request coalescing ("single-flight") for identical concurrent requests.
+
+While a request is in flight, identical requests made by other threads or
+coroutines wait for it and share its outcome, the decoded result or the
+raised exception, instead of each making their own upstream call.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import httpx
+from typing_extensions import TypedDict
+
+from .request import RequestConfig
+
+T = TypeVar("T")
+
+
+class CoalesceStats(TypedDict):
+    """
+    Snapshot of a client's coalescing counters.
+
+    Attributes:
+        executed: Calls which made the upstream request
+        coalesced: Calls which shared the outcome of an identical in-flight call
+    """
+
+    executed: int
+    coalesced: int
+
+
+def coalesce_key(cfg: RequestConfig, cast_to: Any) -> Optional[Hashable]:
+    """
+    Builds the key identifying identical requests from their method, URL,
+    query, headers and cookies (which carry the auth identity) and the type
+    the response is decoded into.
+
+    Returns None for requests which cannot be keyed, e.g. ones decoded into
+    an unhashable type.
+    """
+    url = httpx.URL(cfg["url"], params=cfg.get("params"))
+    headers = httpx.Headers(cfg.get("headers"))
+    key: Tuple[Any, ...] = (
+        cfg["method"].upper(),
+        str(url),
+        tuple(sorted(headers.multi_items())),
+        tuple(sorted(dict(cfg.get("cookies") or {}).items())),
+        cast_to,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def record(self, *, leader: bool) -> None:
+        with self._lock:
+            if leader:
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+    def stats(self) -> CoalesceStats:
+        with self._lock:
+            return {"executed": self._executed, "coalesced": self._coalesced}
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Thread-safe single-flight group for synchronous calls"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._counters = _Counters()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Calls `fn` unless a call with the same key is already in flight, in
+        which case its outcome is waited for and shared.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+        self._counters.record(leader=leader)
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> CoalesceStats:
+        return self._counters.stats()
+
+
+class AsyncRequestCoalescer:
+    """
+    Single-flight group for coroutines of a single event loop.
+
+    The shared call runs in its own task, so cancelling any of the waiting
+    coroutines, including the one which started it, does not cancel the
+    call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._counters = _Counters()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Awaits `fn` unless a call with the same key is already in flight, in
+        which case its outcome is awaited and shared.
+        """
+        flight = self._flights.get(key)
+        self._counters.record(leader=flight is None)
+        if flight is None:
+            flight = self._flights[key] = asyncio.ensure_future(fn())
+            flight.add_done_callback(lambda task: self._finish(key, task))
+        return await asyncio.shield(flight)
+
+    def stats(self) -> CoalesceStats:
+        return self._counters.stats()
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # mark the exception as retrieved in case every waiter was cancelled
+            task.exception()
@@ -0,0 +1,250 @@
+"""
+Request hedging for idempotent reads.
+
+When a request has not answered within the latency percentile observed for
+its operation, an identical request is sent. Whichever response arrives
+first is used and the other request is cancelled, unless it is an error the
+other request may not run into (e.g. a 503), which is only used once both
+requests completed. A budget earned by every request bounds the extra load
+hedges add.
+"""
+
+import asyncio
+import bisect
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+import httpx
+from typing_extensions import NotRequired, TypedDict
+
+
+class HedgePolicy(TypedDict):
+    """
+    Controls when requests are hedged.
+
+    Any key left out falls back to `default_hedge_policy()`.
+
+    Attributes:
+        percentile: Latency percentile of the operation (between 0 and 1)
+            after which a hedge is sent
+        initial_delay: Seconds after which a hedge is sent while fewer than
+            `min_samples` latencies of the operation have been observed
+        min_delay: Lower bound in seconds for the hedge delay
+        max_delay: Upper bound in seconds for the hedge delay
+        min_samples: Latencies to observe before using the percentile
+        window: Number of recent latencies the percentile is computed over
+        budget: Hedges earned per request, e.g. 0.05 allows at most about 5%
+            extra requests
+        max_burst: Hedges which may be sent in a row from an unused budget
+    """
+
+    percentile: NotRequired[float]
+    initial_delay: NotRequired[float]
+    min_delay: NotRequired[float]
+    max_delay: NotRequired[float]
+    min_samples: NotRequired[int]
+    window: NotRequired[int]
+    budget: NotRequired[float]
+    max_burst: NotRequired[float]
+
+
+def default_hedge_policy() -> HedgePolicy:
+    """
+    Provides the default hedge policy, hedging requests slower than the
+    operation's p95 latency with at most 5% extra requests.
+    """
+    return {
+        "percentile": 0.95,
+        "initial_delay": 0.5,
+        "min_delay": 0.01,
+        "max_delay": 5.0,
+        "min_samples": 20,
+        "window": 500,
+        "budget": 0.05,
+        "max_burst": 10.0,
+    }
+
+
+class HedgeStats(TypedDict):
+    """
+    Snapshot of a client's hedging counters.
+
+    Attributes:
+        requests: Requests eligible for hedging
+        hedged: Requests for which a hedge was sent
+        hedge_wins: Hedged requests answered by the hedge first
+        budget_exhausted: Requests which were not hedged for lack of budget
+    """
+
+    requests: int
+    hedged: int
+    hedge_wins: int
+    budget_exhausted: int
+
+
+class _Latencies:
+    """Sliding window of an operation's latencies kept in sorted order"""
+
+    def __init__(self, window: int) -> None:
+        self._recent: Deque[float] = deque()
+        self._sorted: List[float] = []
+        self._window = window
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def add(self, latency: float) -> None:
+        if len(self._recent) == self._window:
+            oldest = self._recent.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._recent.append(latency)
+        bisect.insort(self._sorted, latency)
+
+    def percentile(self, q: float) -> float:
+        index = min(len(self._sorted) - 1, int(q * len(self._sorted)))
+        return self._sorted[index]
+
+
+class Hedger:
+    """Sends hedged requests according to a policy, tracking their latencies"""
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self._policy: HedgePolicy = {**default_hedge_policy(), **policy}
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, _Latencies] = {}
+        self._tokens = self._policy["max_burst"]
+        self._counts = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "budget_exhausted": 0,
+        }
+
+    def delay(self, operation: str) -> float:
+        """Seconds after which a request of the operation is hedged"""
+        policy = self._policy
+        with self._lock:
+            latencies = self._latencies.get(operation)
+            if latencies is None or len(latencies) < policy["min_samples"]:
+                delay = policy["initial_delay"]
+            else:
+                delay = latencies.percentile(policy["percentile"])
+        return min(policy["max_delay"], max(policy["min_delay"], delay))
+
+    async def run(
+        self,
+        operation: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        hedge: Optional[Callable[[], Awaitable[httpx.Response]]] = None,
+        retryable: Optional[Callable[[httpx.Response], bool]] = None,
+    ) -> httpx.Response:
+        """
+        Awaits `send`, sending a hedge if the first call has not completed
+        within the operation's hedge delay and the budget allows.
+
+        Args:
+            operation: Method and path pattern of the request, e.g. "GET /pet/{petId}"
+            send: Sends the request
+            hedge: Sends the hedge, `send` when omitted
+            retryable: Whether a response failed in a way another request may
+                not, e.g. a 503. Such a response is only used once no other
+                request is still running.
+
+        Returns:
+            The first response received, preferring any response which is not
+            retryable, the other request being cancelled
+
+        Raises:
+            Exception: The first error raised, if every request raised
+        """
+        loop = asyncio.get_running_loop()
+        self._earn()
+        started: Dict["asyncio.Future[httpx.Response]", float] = {}
+        primary = asyncio.ensure_future(send())
+        started[primary] = loop.time()
+        tasks: Set["asyncio.Future[httpx.Response]"] = {primary}
+        winner: Optional["asyncio.Future[httpx.Response]"] = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay(operation))
+            if not done:
+                if self._spend():
+                    hedge_task = asyncio.ensure_future((hedge or send)())
+                    started[hedge_task] = loop.time()
+                    tasks.add(hedge_task)
+                else:
+                    self._count("budget_exhausted")
+
+            error: Optional[BaseException] = None
+            fallback: Optional["asyncio.Future[httpx.Response]"] = None
+            pending = tasks
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                    elif retryable is not None and retryable(task.result()):
+                        # the other request may still succeed
+                        fallback = fallback or task
+                    else:
+                        winner = task
+                        break
+            winner = winner or fallback
+            if winner is None:
+                assert error is not None
+                raise error
+            self._record(operation, loop.time() - started[winner])
+            if winner is not primary:
+                self._count("hedge_wins")
+            return winner.result()
+        finally:
+            await _cancel_losers(tasks - {winner} if winner else tasks)
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return {
+                "requests": self._counts["requests"],
+                "hedged": self._counts["hedged"],
+                "hedge_wins": self._counts["hedge_wins"],
+                "budget_exhausted": self._counts["budget_exhausted"],
+            }
+
+    def _earn(self) -> None:
+        with self._lock:
+            self._counts["requests"] += 1
+            self._tokens = min(
+                self._policy["max_burst"], self._tokens + self._policy["budget"]
+            )
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._counts["hedged"] += 1
+            return True
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def _record(self, operation: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(operation)
+            if latencies is None:
+                latencies = self._latencies[operation] = _Latencies(
+                    self._policy["window"]
+                )
+            latencies.add(latency)
+
+
+async def _cancel_losers(losers: Set["asyncio.Future[Any]"]) -> None:
+    """Cancels the requests still running and closes the responses of the others"""
+    for task in losers:
+        task.cancel()
+    for result in await asyncio.gather(*losers, return_exceptions=True):
+        if isinstance(result, httpx.Response):
+            await result.aclose()
@@ -0,0 +1,150 @@
+"""
+Pluggable JSON encoding and decoding of request and response bodies.
+
+The standard library's `json` module is used by default, orjson and msgspec
+can be selected explicitly or through "auto", which picks the fastest one
+installed.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+from typing_extensions import Literal
+
+JsonBackend = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+
+class JsonCodec(ABC):
+    """
+    Serialises request bodies to bytes and parses response bodies.
+
+    Attributes:
+        name: Name of the backend, as accepted by `get_json_codec`
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes a JSON-compatible value as UTF-8 bytes"""
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Parses a JSON document.
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec backed by the standard library's `json` module"""
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        # matches the encoding httpx applies to `json=` request bodies
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+_stdlib = StdlibJsonCodec()
+
+
+class OrjsonJsonCodec(JsonCodec):
+    """
+    JSON codec backed by orjson.
+
+    Values orjson cannot encode, such as integers wider than 64 bits, are
+    encoded with the standard library instead.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # type: ignore
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return _stdlib.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """
+    JSON codec backed by msgspec.
+
+    Values msgspec cannot encode are encoded with the standard library instead.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except TypeError:
+            return _stdlib.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+
+_BACKENDS = {
+    "orjson": OrjsonJsonCodec,
+    "msgspec": MsgspecJsonCodec,
+}
+
+
+def get_json_codec(backend: Union[JsonBackend, JsonCodec] = "stdlib") -> JsonCodec:
+    """
+    Resolves a JSON codec.
+
+    Args:
+        backend: A codec instance, the name of a backend, or "auto" for the
+            fastest installed backend (orjson, then msgspec, then stdlib)
+
+    Raises:
+        ImportError: If the named backend is not installed
+        ValueError: If the backend name is unknown
+    """
+    if isinstance(backend, JsonCodec):
+        return backend
+    if backend == "stdlib":
+        return _stdlib
+    if backend == "auto":
+        for candidate in _BACKENDS.values():
+            try:
+                return candidate()
+            except ImportError:
+                continue
+        return _stdlib
+    codec_cls = _BACKENDS.get(backend)
+    if codec_cls is None:
+        raise ValueError(f"unknown JSON backend '{backend}'")
+    return codec_cls()
@@ -0,0 +1,277 @@
+"""
+Incremental decoding of top-level JSON arrays.
+
+Allows list endpoints to be consumed one validated item at a time while the
+response body is still arriving, so memory use is bounded by the largest
+single item rather than the whole payload.
+"""
+
+import re
+from collections import deque
+from typing import Deque, Generic, List, Type, TypeVar
+
+import httpx
+
+from .response import response_decoders
+
+T = TypeVar("T")
+
+_WHITESPACE = b" \t\r\n"
+# characters that change the parser state outside of / inside of a string
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class JsonArrayParser:
+    """
+    Splits a top-level JSON array into the raw bytes of its items as chunks of
+    the document are fed in.
+
+    Only the structure needed to find item boundaries (nesting depth and string
+    literals) is tracked, each item is left for pydantic-core to parse. Bytes of
+    items that have been emitted are discarded, so the buffer only ever holds
+    the item currently being received.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._item_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the closing bracket of the top-level array has been seen"""
+        return self._finished
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Adds a chunk of the document and returns the raw JSON of every item
+        completed by it.
+
+        Raises:
+            ValueError: If the document is not a JSON array
+        """
+        if self._finished:
+            return []
+
+        self._buffer += chunk
+        items: List[bytes] = []
+        buffer = self._buffer
+
+        if not self._started:
+            start = self._skip_whitespace(self._pos)
+            if start == len(buffer):
+                self._pos = start
+                return items
+            if buffer[start] != ord("["):
+                raise ValueError("expected a JSON array at the top level")
+            self._started = True
+            self._depth = 1
+            self._pos = self._item_start = start + 1
+
+        while not self._finished:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, self._pos)
+                if match is None:
+                    break
+                if match.group() == b"\\":
+                    # skip the escaped character, which may not have arrived yet
+                    self._pos = match.end() + 1
+                else:
+                    self._in_string = False
+                    self._pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                break
+            char = match.group()
+            self._pos = match.end()
+
+            if char == b'"':
+                self._in_string = True
+            elif char in (b"{", b"["):
+                self._depth += 1
+            elif char in (b"}", b"]"):
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(items, match.start())
+                    self._finished = True
+            elif char == b"," and self._depth == 1:
+                self._emit(items, match.start())
+                self._item_start = self._pos
+
+        # drop the bytes of already emitted items
+        if self._item_start > 0:
+            consumed = min(self._item_start, len(buffer))
+            del buffer[:consumed]
+            self._pos -= consumed
+            self._item_start -= consumed
+
+        return items
+
+    def close(self) -> None:
+        """
+        Signals the end of the document.
+
+        Raises:
+            ValueError: If the document ended before the array was closed
+        """
+        if not self._finished:
+            raise ValueError("JSON array ended unexpectedly")
+
+    def _skip_whitespace(self, pos: int) -> int:
+        while pos < len(self._buffer) and self._buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _emit(self, items: List[bytes], end: int) -> None:
+        item = bytes(self._buffer[self._item_start : end]).strip(_WHITESPACE)
+        if item:
+            items.append(item)
+
+
+class JsonArrayStreamResponse(Generic[T]):
+    """
+    Handles synchronous streaming of a top-level JSON array.
+
+    Reads the HTTP response incrementally and yields each array item
+    converted into the specified type. The connection is released once the
+    array is exhausted or `close` is called, allowing early cancellation.
+    """
+
+    def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
+        """
+        Initialize the stream processor with response and conversion settings.
+
+        Args:
+            response: The HTTP response containing the JSON array
+            stream_context: Context manager for the stream
+            cast_to: Target type for converting each array item
+        """
+        self.response = response
+        self._context = stream_context
+        self.cast_to = cast_to
+        self.iterator = response.iter_bytes()
+        self._parser = JsonArrayParser()
+        self._pending: Deque[bytes] = deque()
+        self._closed = False
+
+    def __iter__(self):
+        """Enables iteration over the array items."""
+        return self
+
+    def __next__(self) -> T:
+        """
+        Retrieves the next item of the array, reading more of the response
+        as required.
+
+        Raises:
+            StopIteration: When the array is exhausted
+        """
+        while not self._pending:
+            if self._closed:
+                raise StopIteration
+            try:
+                chunk = next(self.iterator)
+            except StopIteration:
+                self._release()
+                self._parser.close()
+                raise
+            self._pending.extend(self._parser.feed(chunk))
+            if self._parser.finished:
+                # nothing past the closing bracket is needed
+                self._release()
+
+        item = self._pending.popleft()
+        return response_decoders.get(self.cast_to).validate_json(item)
+
+    def __enter__(self) -> "JsonArrayStreamResponse[T]":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the stream, closing the underlying response."""
+        self._pending.clear()
+        self._release()
+
+    def _release(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._context.__exit__(None, None, None)
+
+
+class AsyncJsonArrayStreamResponse(Generic[T]):
+    """
+    Handles asynchronous streaming of a top-level JSON array.
+
+    Asynchronous version of JsonArrayStreamResponse, providing the same
+    functionality but compatible with async/await syntax.
+    """
+
+    def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
+        """
+        Initialize the async stream processor.
+
+        Args:
+            response: The HTTP response containing the JSON array
+            stream_context: Async context manager for the stream
+            cast_to: Target type for converting each array item
+        """
+        self.response = response
+        self._context = stream_context
+        self.cast_to = cast_to
+        self.iterator = response.aiter_bytes()
+        self._parser = JsonArrayParser()
+        self._pending: Deque[bytes] = deque()
+        self._closed = False
+
+    def __aiter__(self):
+        """Enables async iteration over the array items."""
+        return self
+
+    async def __anext__(self) -> T:
+        """
+        Asynchronously retrieves the next item of the array.
+
+        Raises:
+            StopAsyncIteration: When the array is exhausted
+        """
+        while not self._pending:
+            if self._closed:
+                raise StopAsyncIteration
+            try:
+                chunk = await self.iterator.__anext__()
+            except StopAsyncIteration:
+                await self._release()
+                self._parser.close()
+                raise
+            self._pending.extend(self._parser.feed(chunk))
+            if self._parser.finished:
+                # nothing past the closing bracket is needed
+                await self._release()
+
+        item = self._pending.popleft()
+        return response_decoders.get(self.cast_to).validate_json(item)
+
+    async def __aenter__(self) -> "AsyncJsonArrayStreamResponse[T]":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stops the stream, closing the underlying response."""
+        self._pending.clear()
+        await self._release()
+
+    async def _release(self) -> None:
+        if not self._closed:
+            self._closed = True
+            await self._context.__aexit__(None, None, None)
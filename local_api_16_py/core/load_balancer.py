@@ -0,0 +1,302 @@
+"""
+Client-side load balancing of a service's requests across several base URLs.
+
+Requests are built against the service's first base URL and rebased onto the
+selected endpoint when sent, so caching, coalescing and invalidation see one
+URL per resource whichever replica serves it. Endpoints failing repeatedly
+are ejected for a while (passive health checking) and return once their
+ejection expires.
+"""
+
+import itertools
+import threading
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Collection,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import httpx
+from typing_extensions import Literal, NotRequired, TypedDict
+
+from .request import RequestConfig
+
+BalancingStrategy = Literal["round_robin", "least_outstanding", "ewma"]
+
+
+class LoadBalancingConfig(TypedDict):
+    """
+    Configures how requests are spread across the base URLs of a service.
+
+    Any key left out falls back to `default_load_balancing_config()`.
+
+    Attributes:
+        strategy: "round_robin" cycles through the endpoints,
+            "least_outstanding" picks the endpoint with the fewest requests in
+            flight, "ewma" the lowest moving average latency weighted by the
+            requests in flight
+        ewma_alpha: Weight (between 0 and 1) of the latest latency in the
+            moving average
+        failure_threshold: Consecutive failures which eject an endpoint
+        ejection_duration: Seconds an endpoint is ejected for, doubled with
+            every consecutive ejection
+        max_ejection_duration: Upper bound in seconds of an ejection
+        failure_status_codes: Response status codes counted as failures
+        failure_exceptions: Exception types raised by the transport which are
+            counted as failures
+    """
+
+    strategy: NotRequired[BalancingStrategy]
+    ewma_alpha: NotRequired[float]
+    failure_threshold: NotRequired[int]
+    ejection_duration: NotRequired[float]
+    max_ejection_duration: NotRequired[float]
+    failure_status_codes: NotRequired[Collection[int]]
+    failure_exceptions: NotRequired[Tuple[Type[BaseException], ...]]
+
+
+def default_load_balancing_config() -> LoadBalancingConfig:
+    """
+    Provides the default load balancing configuration, cycling through the
+    endpoints and ejecting an endpoint for 10 seconds after 3 consecutive 5xx
+    responses or transport errors.
+    """
+    return {
+        "strategy": "round_robin",
+        "ewma_alpha": 0.3,
+        "failure_threshold": 3,
+        "ejection_duration": 10.0,
+        "max_ejection_duration": 300.0,
+        "failure_status_codes": frozenset(range(500, 600)),
+        "failure_exceptions": (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+        ),
+    }
+
+
+class EndpointStats(TypedDict):
+    """
+    Snapshot of an endpoint of a load balancer.
+
+    Attributes:
+        url: Base URL of the endpoint
+        healthy: Whether the endpoint is currently selectable, False while ejected
+        outstanding: Requests in flight
+        requests: Requests sent to the endpoint
+        failures: Requests which failed
+        latency: Moving average latency in seconds
+        ejections: Times the endpoint was ejected
+    """
+
+    url: str
+    healthy: bool
+    outstanding: int
+    requests: int
+    failures: int
+    latency: float
+    ejections: int
+
+
+class _Endpoint:
+    __slots__ = (
+        "url",
+        "outstanding",
+        "requests",
+        "failures",
+        "latency",
+        "consecutive_failures",
+        "consecutive_ejections",
+        "ejections",
+        "ejected_until",
+    )
+
+    def __init__(self, url: str) -> None:
+        self.url = url[:-1] if url.endswith("/") else url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency = 0.0
+        self.consecutive_failures = 0
+        self.consecutive_ejections = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+
+class LoadBalancer:
+    """Thread-safe load balancer across the base URLs of a service"""
+
+    def __init__(self, urls: Sequence[str], config: LoadBalancingConfig) -> None:
+        """
+        Args:
+            urls: Base URLs of the service, the first one being the URL
+                requests are built against
+            config: Overrides of the default load balancing configuration
+        """
+        if not urls:
+            raise ValueError("at least one base URL is required")
+        self._config: LoadBalancingConfig = {
+            **default_load_balancing_config(),
+            **config,
+        }
+        self._endpoints = [_Endpoint(url) for url in urls]
+        self._base_url = self._endpoints[0].url
+        self._lock = threading.Lock()
+        self._next = itertools.count()
+
+    def call(
+        self,
+        cfg: RequestConfig,
+        send: Callable[[RequestConfig], httpx.Response],
+    ) -> httpx.Response:
+        """
+        Sends a request to the next endpoint.
+
+        Args:
+            cfg: Request configuration built against the first base URL
+            send: Sends the request configuration rebased onto the endpoint
+
+        Returns:
+            The endpoint's response
+        """
+        endpoint = self._acquire()
+        started = time.monotonic()
+        try:
+            response = send(self._rebase(cfg, endpoint))
+        except Exception as exc:
+            self._release(endpoint, time.monotonic() - started, self._failed(exc))
+            raise
+        except BaseException:
+            self._release(endpoint, None, False)
+            raise
+        self._release(endpoint, time.monotonic() - started, self._failed(response))
+        return response
+
+    async def acall(
+        self,
+        cfg: RequestConfig,
+        send: Callable[[RequestConfig], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """
+        Sends a request to the next endpoint.
+
+        Args:
+            cfg: Request configuration built against the first base URL
+            send: Sends the request configuration rebased onto the endpoint
+
+        Returns:
+            The endpoint's response
+        """
+        endpoint = self._acquire()
+        started = time.monotonic()
+        try:
+            response = await send(self._rebase(cfg, endpoint))
+        except Exception as exc:
+            self._release(endpoint, time.monotonic() - started, self._failed(exc))
+            raise
+        except BaseException:
+            # cancelled, e.g. a hedged request which lost
+            self._release(endpoint, None, False)
+            raise
+        self._release(endpoint, time.monotonic() - started, self._failed(response))
+        return response
+
+    def stats(self) -> List[EndpointStats]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "url": endpoint.url,
+                    "healthy": endpoint.ejected_until <= now,
+                    "outstanding": endpoint.outstanding,
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "latency": endpoint.latency,
+                    "ejections": endpoint.ejections,
+                }
+                for endpoint in self._endpoints
+            ]
+
+    def _acquire(self) -> _Endpoint:
+        now = time.monotonic()
+        with self._lock:
+            endpoint = self._select(now)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _select(self, now: float) -> _Endpoint:
+        endpoints = self._endpoints
+        start = next(self._next) % len(endpoints)
+        # rotating the candidates spreads ties across the endpoints
+        rotated = endpoints[start:] + endpoints[:start]
+        healthy = [endpoint for endpoint in rotated if endpoint.ejected_until <= now]
+        if not healthy:
+            # failing open beats failing every request
+            return min(endpoints, key=lambda endpoint: endpoint.ejected_until)
+
+        strategy = self._config["strategy"]
+        if strategy == "least_outstanding":
+            return min(healthy, key=lambda endpoint: endpoint.outstanding)
+        if strategy == "ewma":
+            return min(
+                healthy,
+                key=lambda endpoint: endpoint.latency * (endpoint.outstanding + 1),
+            )
+        return healthy[0]
+
+    def _release(
+        self, endpoint: _Endpoint, latency: Optional[float], failed: bool
+    ) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if latency is None:
+                return
+            alpha = self._config["ewma_alpha"]
+            endpoint.latency = (
+                latency
+                if endpoint.latency == 0.0
+                else alpha * latency + (1 - alpha) * endpoint.latency
+            )
+            if not failed:
+                # also readmits an endpoint selected while every one was ejected
+                endpoint.consecutive_failures = 0
+                endpoint.consecutive_ejections = 0
+                endpoint.ejected_until = 0.0
+                return
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self._config["failure_threshold"]:
+                self._eject(endpoint)
+
+    def _eject(self, endpoint: _Endpoint) -> None:
+        duration = min(
+            self._config["max_ejection_duration"],
+            self._config["ejection_duration"] * 2**endpoint.consecutive_ejections,
+        )
+        endpoint.consecutive_ejections += 1
+        endpoint.ejections += 1
+        endpoint.consecutive_failures = 0
+        endpoint.ejected_until = time.monotonic() + duration
+
+    def _failed(self, outcome: object) -> bool:
+        if isinstance(outcome, httpx.Response):
+            return outcome.status_code in self._config["failure_status_codes"]
+        return isinstance(outcome, self._config["failure_exceptions"])
+
+    def _rebase(self, cfg: RequestConfig, endpoint: _Endpoint) -> RequestConfig:
+        url = cfg["url"]
+        if endpoint.url == self._base_url or not isinstance(url, str):
+            return cfg
+        if not url.startswith(self._base_url):
+            return cfg
+        rebased = dict(cfg)
+        rebased["url"] = endpoint.url + url[len(self._base_url) :]
+        return rebased  # type: ignore[return-value]
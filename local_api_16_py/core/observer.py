@@ -0,0 +1,195 @@
+"""
+Per-request phase timing reported to observers.
+
+Timing is only collected while at least one observer is registered, a client
+without observers merely checks for a missing timer at each phase boundary.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import httpx
+from typing_extensions import TypedDict
+
+from .request import RequestConfig
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTiming(TypedDict):
+    """
+    Timing of a request made through a client, reported to its observers.
+
+    Phases which did not occur are absent from `phases`. The time spent in
+    the transport is additionally broken down into "connect", "tls",
+    "send", "ttfb" (waiting for the response headers) and "read" (reading
+    the body) when the transport reports them, which HTTPX's default
+    transports do.
+
+    Attributes:
+        operation: Name of the operation, e.g. "pet.find_by_status", or its
+            method and path pattern if it has no name
+        method: HTTP method
+        path: API endpoint path pattern
+        status_code: Status of the last response, None if none was received
+        request_size: Bytes of the request body, None if not known upfront
+        response_size: Bytes of the last response body, None if no response
+            was received or its body is streamed to the caller
+        attempts: Requests sent upstream, 0 for responses served from the cache
+        duration: Seconds the request took in total
+        phases: Seconds spent in each phase: "auth", "build", "cache"
+            (looking up the response cache), "rate_limit", "transport",
+            "backoff" (between retries) and "decode"
+        error: The exception the request raised, if any
+    """
+
+    operation: str
+    method: str
+    path: str
+    status_code: Optional[int]
+    request_size: Optional[int]
+    response_size: Optional[int]
+    attempts: int
+    duration: float
+    phases: Dict[str, float]
+    error: Optional[BaseException]
+
+
+RequestObserver = Callable[[RequestTiming], None]
+"""Called with the timing of every request once it completed or failed"""
+
+# transport trace events (as emitted by httpcore) and the phases they belong to
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "ttfb",
+    "receive_response_body": "read",
+}
+
+
+class PhaseTimer:
+    """
+    Accumulates the phase timings of a single request.
+
+    Attributes:
+        headers: Headers added to every attempt, e.g. to propagate a trace context
+        url: URL of the request, set once it is sent upstream
+    """
+
+    __slots__ = (
+        "headers",
+        "url",
+        "_timing",
+        "_started",
+        "_mark",
+        "_trace_started",
+        "_callbacks",
+    )
+
+    def __init__(self, *, operation: str, method: str, path: str) -> None:
+        self.headers: Optional[Dict[str, str]] = None
+        self.url: Optional[str] = None
+        self._started = self._mark = time.monotonic()
+        self._trace_started: Dict[str, float] = {}
+        self._callbacks: List[RequestObserver] = []
+        self._timing: RequestTiming = {
+            "operation": operation,
+            "method": method,
+            "path": path,
+            "status_code": None,
+            "request_size": None,
+            "response_size": None,
+            "attempts": 0,
+            "duration": 0.0,
+            "phases": {},
+            "error": None,
+        }
+
+    @property
+    def timing(self) -> RequestTiming:
+        """The timing collected so far"""
+        return self._timing
+
+    def on_finish(self, callback: RequestObserver) -> None:
+        """Calls `callback` with the request's timing after the observers"""
+        self._callbacks.append(callback)
+
+    def lap(self, phase: str) -> None:
+        """Attributes the time since the previous lap to `phase`"""
+        now = time.monotonic()
+        phases = self._timing["phases"]
+        phases[phase] = phases.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def traced(self, cfg: RequestConfig, *, is_async: bool) -> RequestConfig:
+        """
+        Adds the transport trace hook reporting to this timer, and the
+        timer's headers, to a request
+        """
+        if self.url is None and isinstance(cfg["url"], str):
+            self.url = cfg["url"]
+        extensions = dict(cfg.get("extensions") or {})
+        extensions["trace"] = self.atrace if is_async else self.trace
+        traced: RequestConfig = {**cfg, "extensions": extensions}
+        if self.headers:
+            traced["headers"] = {**(cfg.get("headers") or {}), **self.headers}
+        return traced
+
+    def trace(self, event: str, info: Dict[str, Any]) -> None:
+        name, _, stage = event.rpartition(".")
+        phase = _TRACE_PHASES.get(name.rpartition(".")[2])
+        if phase is None:
+            return
+        if stage == "started":
+            self._trace_started[name] = time.monotonic()
+            return
+        started = self._trace_started.pop(name, None)
+        if started is not None:
+            phases = self._timing["phases"]
+            phases[phase] = phases.get(phase, 0.0) + time.monotonic() - started
+
+    async def atrace(self, event: str, info: Dict[str, Any]) -> None:
+        self.trace(event, info)
+
+    def attempt(self, response: Optional[httpx.Response]) -> None:
+        """
+        Attributes the time since the previous lap to the transport and
+        records the response of an upstream request, None if it raised.
+        """
+        self.lap("transport")
+        timing = self._timing
+        timing["attempts"] += 1
+        if response is None:
+            return
+        timing["status_code"] = response.status_code
+        try:
+            timing["response_size"] = len(response.content)
+        except httpx.ResponseNotRead:
+            # streamed to the caller
+            timing["response_size"] = None
+        content_length = response.request.headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            timing["request_size"] = int(content_length)
+
+    def finish(
+        self,
+        observers: Sequence[RequestObserver],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Reports the request's timing to the observers. An observer raising
+        is logged and skipped, it neither affects the other observers nor
+        the outcome of the request.
+        """
+        timing = self._timing
+        timing["duration"] = time.monotonic() - self._started
+        timing["error"] = error
+        for observer in [*observers, *self._callbacks]:
+            try:
+                observer(timing)
+            except Exception:
+                logger.exception("request observer %r failed", observer)
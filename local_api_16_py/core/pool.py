@@ -0,0 +1,58 @@
+"""
+Introspection of the connection pools behind the httpx clients used by the SDK.
+"""
+
+from typing import Any, Iterable, Union
+
+import httpx
+from typing_extensions import TypedDict
+
+
+class PoolStats(TypedDict):
+    """
+    Snapshot of the connections held by an httpx client's connection pools.
+
+    Attributes:
+        connections: Total number of open connections
+        in_use: Connections currently serving at least one request
+        idle: Connections kept alive and waiting to be reused
+        http2: Open connections which negotiated HTTP/2
+    """
+
+    connections: int
+    in_use: int
+    idle: int
+    http2: int
+
+
+def get_pool_stats(client: Union[httpx.Client, httpx.AsyncClient]) -> PoolStats:
+    """
+    Collects connection counts across every transport mounted on an httpx client.
+
+    httpx does not expose its pools publicly, so this relies on the default
+    transports wrapping an httpcore connection pool. Transports without one
+    (custom or mock transports) contribute no connections.
+    """
+    stats: PoolStats = {"connections": 0, "in_use": 0, "idle": 0, "http2": 0}
+
+    transports = [getattr(client, "_transport", None)]
+    transports.extend(getattr(client, "_mounts", {}).values())
+
+    for transport in transports:
+        for connection in _pool_connections(transport):
+            if connection.is_closed():
+                continue
+            stats["connections"] += 1
+            if connection.is_idle():
+                stats["idle"] += 1
+            else:
+                stats["in_use"] += 1
+            if "HTTP/2" in connection.info():
+                stats["http2"] += 1
+
+    return stats
+
+
+def _pool_connections(transport: Any) -> Iterable[Any]:
+    pool = getattr(transport, "_pool", None)
+    return list(getattr(pool, "connections", None) or [])
@@ -36,6 +36,15 @@ def _query_str(val: Any) -> str:
     """jsonify value without wrapping quotes for strings"""
     if isinstance(val, str):
         return val
+    # the common scalars, formatted as json.dumps would without encoding them
+    if val is True:
+        return "true"
+    if val is False:
+        return "false"
+    if val is None:
+        return "null"
+    if type(val) is int:
+        return str(val)
     return json.dumps(val)
 
 
@@ -0,0 +1,231 @@
+"""
+Client-side rate limiting of upstream requests.
+
+Each budget is a GCRA (generic cell rate algorithm) limiter, the virtual
+scheduling equivalent of a token bucket: it only stores the theoretical
+arrival time of the next request, so a request reserves its slot in O(1)
+under a lock and waits for it outside the lock, without blocking other
+callers or the event loop.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+from typing_extensions import NotRequired, TypedDict
+
+from .retry import parse_retry_after
+
+
+class RateLimit(TypedDict):
+    """
+    A request budget.
+
+    Attributes:
+        rate: Sustained number of requests per second
+        burst: Number of requests which may be sent at once after a pause
+    """
+
+    rate: float
+    burst: NotRequired[int]
+
+
+class RateLimitConfig(TypedDict):
+    """
+    Configures the rate limiting of a client.
+
+    Any key left out falls back to `default_rate_limit_config()`.
+
+    Attributes:
+        rate: Sustained requests per second across every request of the client,
+            None for no client-wide budget
+        burst: Burst size of the client-wide budget
+        operations: Budgets of individual operations, applied on top of the
+            client-wide budget and keyed by method and path pattern, e.g.
+            "GET /pet/{petId}"
+        adaptive: Slow down to the budget announced by `X-RateLimit-*` and
+            `Retry-After` response headers
+    """
+
+    rate: NotRequired[Optional[float]]
+    burst: NotRequired[int]
+    operations: NotRequired[Dict[str, RateLimit]]
+    adaptive: NotRequired[bool]
+
+
+def default_rate_limit_config() -> RateLimitConfig:
+    """
+    Provides the default rate limit configuration, which only paces requests
+    as announced by the upstream's rate limit headers.
+    """
+    return {"rate": None, "burst": 1, "operations": {}, "adaptive": True}
+
+
+class RateLimitStats(TypedDict):
+    """
+    Snapshot of a client's rate limiting counters.
+
+    Attributes:
+        requests: Requests which went through the limiter
+        delayed: Requests which had to wait for their slot
+        total_delay: Seconds spent waiting, summed over every request
+    """
+
+    requests: int
+    delayed: int
+    total_delay: float
+
+
+class Gcra:
+    """
+    Thread-safe GCRA limiter.
+
+    The rate can be lowered at runtime, e.g. from response headers, and the
+    limiter paused until a point in time.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1) -> None:
+        """
+        Args:
+            rate: Sustained requests per second, None for no limit
+            burst: Number of requests which may be sent at once
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._lock = threading.Lock()
+        self._configured = rate
+        self._burst = burst
+        self._interval = 0.0
+        self._tolerance = 0.0
+        self._tat = 0.0
+        self._apply(rate)
+
+    @property
+    def rate(self) -> Optional[float]:
+        """The current sustained rate, None if unlimited"""
+        with self._lock:
+            return None if self._interval == 0 else 1 / self._interval
+
+    def reserve(self) -> float:
+        """
+        Reserves the next slot.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        now = time.monotonic()
+        with self._lock:
+            tat = max(self._tat, now)
+            self._tat = tat + self._interval
+            return max(0.0, tat - self._tolerance - now)
+
+    def adapt(self, rate: Optional[float]) -> None:
+        """Lowers the rate, never above the configured one, None restores it"""
+        if rate is not None and self._configured is not None:
+            rate = min(rate, self._configured)
+        with self._lock:
+            self._apply(rate if rate is not None else self._configured)
+
+    def pause(self, seconds: float) -> None:
+        """Holds back every request for at least `seconds`"""
+        until = time.monotonic() + seconds
+        with self._lock:
+            self._tat = max(self._tat, until + self._tolerance)
+
+    def _apply(self, rate: Optional[float]) -> None:
+        self._interval = 0.0 if rate is None or rate <= 0 else 1 / rate
+        self._tolerance = self._interval * (self._burst - 1)
+
+
+def _header_float(headers: httpx.Headers, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _reset_seconds(value: float) -> float:
+    # either seconds until the window resets or a unix timestamp
+    if value > 1e9:
+        return max(0.0, value - time.time())
+    return value
+
+
+class RateLimiter:
+    """Paces the requests of a client across its client-wide and operation budgets"""
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        config = {**default_rate_limit_config(), **config}
+        self._client = Gcra(config.get("rate"), config.get("burst", 1))
+        self._operations = {
+            key: Gcra(limit["rate"], limit.get("burst", 1))
+            for key, limit in (config.get("operations") or {}).items()
+        }
+        self._adaptive = config.get("adaptive", True)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._delayed = 0
+        self._total_delay = 0.0
+
+    def reserve(self, operation: str) -> float:
+        """
+        Reserves a slot for a request of an operation.
+
+        Args:
+            operation: Method and path pattern of the request, e.g. "GET /pet/{petId}"
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        delay = self._client.reserve()
+        op_limiter = self._operations.get(operation)
+        if op_limiter is not None:
+            delay = max(delay, op_limiter.reserve())
+        with self._lock:
+            self._requests += 1
+            if delay > 0:
+                self._delayed += 1
+                self._total_delay += delay
+        return delay
+
+    def observe(self, operation: str, response: httpx.Response) -> None:
+        """
+        Adapts the budget of the client, or of the operation if it has its
+        own, to the rate limit headers of a response.
+        """
+        if not self._adaptive:
+            return
+        limiter = self._operations.get(operation, self._client)
+        headers = response.headers
+        if response.status_code == 429:
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            if retry_after is not None:
+                limiter.pause(retry_after)
+                return
+
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        reset = _header_float(headers, "x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        window = _reset_seconds(reset)
+        if remaining <= 0:
+            limiter.pause(window)
+        elif window > 0:
+            # spread what is left of the window's budget over the window
+            limiter.adapt(remaining / window)
+        else:
+            limiter.adapt(None)
+
+    def stats(self) -> RateLimitStats:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "delayed": self._delayed,
+                "total_delay": self._total_delay,
+            }
@@ -1,10 +1,23 @@
-from typing import Any, Dict, Type, Union, List, Mapping
+import functools
+import typing
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type, Union, List, Mapping
 
 import httpx
+import typing_extensions
 from typing_extensions import TypedDict, Required, NotRequired
-from pydantic import TypeAdapter, BaseModel
+from pydantic import BaseModel
 
+from .adapter_cache import AdapterCache
+from .retry import RetryPolicy
 from .type_utils import NotGiven
+from .upload import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncFileStream,
+    AsyncUploadSource,
+    FileStream,
+    UploadProgress,
+    UploadSource,
+)
 from .query import QueryParams, QueryParamStyle, encode_query_param
 
 """
@@ -42,18 +55,29 @@ class RequestOptions(TypedDict):
     """
     Additional options for customizing request behavior.
 
-    Provides configuration for timeouts and additional headers/parameters
+    Provides configuration for timeouts, retries and additional headers/parameters
     that should be included with requests.
 
     Attributes:
         timeout: Number of seconds to await an API call before timing out
         additional_headers: Extra headers to include in the request
         additional_params: Extra query parameters to include in the request
+        retry: Overrides of the client's retry policy for this request
+        stream_binary: Return binary responses lazily, streaming the body from
+            the connection instead of reading it into memory up front
+        spill_threshold: Size in bytes above which a lazily streamed binary
+            body is buffered in a temporary file rather than in memory
+        hedge: Whether a GET request may be hedged when the asynchronous
+            client has hedging enabled, True by default
     """
 
     timeout: NotRequired[int]
     additional_headers: NotRequired[Dict[str, str]]
     additional_params: NotRequired[QueryParams]
+    retry: NotRequired[RetryPolicy]
+    stream_binary: NotRequired[bool]
+    spill_threshold: NotRequired[int]
+    hedge: NotRequired[bool]
 
 
 def default_request_options() -> RequestOptions:
@@ -81,6 +105,64 @@ def model_dump(item: Any) -> Any:
         return item
 
 
+request_encoders = AdapterCache(maxsize=256)
+"""
+Bounded, process-wide registry of the TypeAdapters used to validate request
+data, shared by sync and async clients. Use `request_encoders.stats()` to
+inspect its hit/miss counters.
+"""
+
+_PRIMITIVE_TYPES = (str, int, float, bool)
+_primitive_fast_path = False
+
+
+def set_primitive_fast_path(enabled: bool) -> None:
+    """
+    Opts in (or back out) of skipping pydantic validation in `to_encodable`
+    when `dump_with` is a plain `str`, `int`, `float`, `bool` or a `Literal`
+    of those, and the item is already exactly a valid value of that type.
+
+    Items that do not match exactly are still validated as usual, so invalid
+    input continues to raise.
+    """
+    global _primitive_fast_path
+    _primitive_fast_path = enabled
+
+
+@functools.lru_cache(maxsize=256)
+def _primitive_values(dump_with: Any) -> Optional[FrozenSet[Tuple[type, Any]]]:
+    """
+    Returns the accepted values for a Literal of primitives as (type, value)
+    pairs (so that `True` does not match `Literal[1]`), an empty set for a
+    plain primitive type, or None if `dump_with` is not eligible for the
+    primitive fast path.
+    """
+    if dump_with in _PRIMITIVE_TYPES:
+        return frozenset()
+    if typing_extensions.get_origin(dump_with) in (
+        typing.Literal,
+        typing_extensions.Literal,
+    ):
+        values = typing_extensions.get_args(dump_with)
+        if all(type(v) in _PRIMITIVE_TYPES for v in values):
+            return frozenset((type(v), v) for v in values)
+    return None
+
+
+def _is_valid_primitive(item: Any, dump_with: Any) -> bool:
+    """Checks whether `item` may bypass validation against `dump_with`"""
+    try:
+        values = _primitive_values(dump_with)
+    except TypeError:
+        # unhashable dump_with, never a primitive
+        return False
+    if values is None:
+        return False
+    if values:
+        return (type(item), item) in values
+    return type(item) is dump_with
+
+
 def to_encodable(
     *, item: Any, dump_with: Union[Type, Union[Type, Any], List[Type]]
 ) -> Any:
@@ -89,9 +171,10 @@ def to_encodable(
     Uses Pydantic's TypeAdapter for validation and converts the result
     to a format suitable for encoding in requests.
     """
+    if _primitive_fast_path and _is_valid_primitive(item, dump_with):
+        return item
     filtered_item = filter_not_given(item)
-    adapter: TypeAdapter = TypeAdapter(dump_with)
-    validated_item = adapter.validate_python(filtered_item)
+    validated_item = request_encoders.get(dump_with).validate_python(filtered_item)
     return model_dump(validated_item)
 
 
@@ -120,20 +203,59 @@ def to_form_urlencoded(
     return form_data
 
 
-def to_content(*, file: httpx._types.FileTypes) -> httpx._types.RequestContent:
+def to_content(
+    *,
+    file: UploadSource,
+    progress: Optional[UploadProgress] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> FileStream:
     """
-    Converts the various ways files can be provided to something that is accepted by
-    the httpx.request content kwarg
+    Converts the various ways files can be provided to request content which
+    is streamed in chunks by the httpx.request content kwarg, rather than read
+    into memory up front
     """
-    if isinstance(file, tuple):
-        file_content: httpx._types.FileContent = file[1]
-    else:
-        file_content = file
+    return FileStream(file, chunk_size=chunk_size, progress=progress)
 
-    if hasattr(file_content, "read") and callable(file_content.read):
-        return file_content.read()
-    else:
-        return file_content
+
+def to_async_content(
+    *,
+    file: AsyncUploadSource,
+    progress: Optional[UploadProgress] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncFileStream:
+    """
+    Asynchronous version of `to_content`, additionally accepting async
+    iterables of bytes
+    """
+    return AsyncFileStream(file, chunk_size=chunk_size, progress=progress)
+
+
+def is_replayable(cfg: RequestConfig) -> bool:
+    """
+    Checks whether the body of a request can be sent again as is, i.e. it is
+    not an iterator or non-seekable file which the first attempt consumed
+    """
+    content = cfg.get("content")
+    if content is not None and not isinstance(content, (bytes, str)):
+        if not getattr(content, "replayable", False):
+            return False
+    files = cfg.get("files") or {}
+    # httpx accepts a mapping of names to files or a sequence of pairs
+    uploads = (
+        files.values() if isinstance(files, Mapping) else (file for _, file in files)
+    )
+    for file in uploads:
+        if isinstance(file, tuple):
+            file = file[1]
+        if isinstance(file, (bytes, str)):
+            continue
+        try:
+            # httpx rewinds seekable files before sending them
+            if not file.seekable():
+                return False
+        except (AttributeError, OSError, ValueError):
+            return False
+    return True
 
 
 def filter_not_given(value: Any) -> Any:
@@ -0,0 +1,188 @@
+"""
+Precompiled request templates.
+
+Everything about an operation's requests that does not change between calls
+(method, URL, applicable auth providers and static headers) is resolved once
+per client and operation, leaving only path parameters, query parameters and
+the body to be filled in per call.
+"""
+
+import re
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from .auth import AuthProvider
+from .json_codec import JsonCodec, get_json_codec
+from .request import QueryParams, RequestConfig, RequestOptions
+
+_PATH_PARAM = re.compile(r"\{([^{}]+)\}")
+
+
+def _escape_braces(literal: str) -> str:
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+class RequestTemplate:
+    """
+    The precomputed parts of every request made by a single operation.
+
+    Attributes:
+        method: HTTP method
+        path: Path pattern of the operation, e.g. `/pet/{petId}`
+        base_url: Base URL the template was compiled against
+        auth_names: IDs of the auth providers applied to the request
+        headers: Static headers sent with every request, these are the client's
+            default headers plus the operation's content type
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "base_url",
+        "auth_names",
+        "headers",
+        "_url",
+        "_path_params",
+    )
+
+    method: str
+    path: str
+    base_url: str
+    auth_names: Tuple[str, ...]
+    headers: Dict[str, str]
+    _url: str
+    _path_params: Tuple[str, ...]
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        path: str,
+        base_url: str,
+        auth_names: Tuple[str, ...] = (),
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            method: HTTP method
+            path: Path pattern, placeholders are wrapped in braces
+            base_url: Base URL of the service the operation belongs to
+            auth_names: IDs of the auth providers applied to the request
+            headers: Static headers sent with every request
+        """
+        self.method = method
+        self.path = path
+        self.base_url = base_url
+        self.auth_names = auth_names
+        self.headers = headers or {}
+
+        if base_url.endswith("/"):
+            base_url = base_url[:-1]
+        if path.startswith("/"):
+            path = path[1:]
+
+        # alternating literal segments and placeholder names, compiled into a
+        # positional format string (with literal braces escaped)
+        parts = _PATH_PARAM.split(path)
+        self._path_params = tuple(parts[1::2])
+        if self._path_params:
+            literals = [f"{base_url}/{parts[0]}", *parts[2::2]]
+            self._url = "{}".join(_escape_braces(part) for part in literals)
+        else:
+            self._url = f"{base_url}/{path}"
+
+    def url(self, path_params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Fills the path pattern's placeholders into a complete URL.
+
+        Raises:
+            KeyError: If a placeholder has no value in `path_params`
+        """
+        if not self._path_params:
+            return self._url
+
+        params = path_params or {}
+        return self._url.format(*[params[name] for name in self._path_params])
+
+    def build(
+        self,
+        *,
+        auths: Mapping[str, AuthProvider],
+        opts: RequestOptions,
+        path_params: Optional[Mapping[str, Any]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ) -> RequestConfig:
+        """
+        Builds the request configuration of a single call.
+
+        Args:
+            auths: Auth providers registered with the client
+            opts: Request options of the call
+            path_params: Values of the path pattern's placeholders
+            query_params: Query parameters
+            headers: Headers specific to the call
+            data: Form data
+            files: Files to upload
+            json: JSON data, serialised with `json_codec`
+            content: Raw content
+            json_codec: Codec encoding the JSON data, the stdlib one by default
+
+        Returns:
+            Complete request configuration
+        """
+        cfg: RequestConfig = {"method": self.method, "url": self.url(path_params)}
+
+        for auth_name in self.auth_names:
+            auth_provider = auths.get(auth_name)
+            if auth_provider is not None:
+                cfg = auth_provider.add_to_request(cfg)
+
+        # headers set by auth providers are kept unless overridden
+        req_headers = cfg.get("headers")
+        if req_headers is None:
+            req_headers = self.headers.copy()
+        else:
+            req_headers.update(self.headers)
+        if headers is not None:
+            req_headers.update(headers)
+        additional_headers = opts.get("additional_headers")
+        if additional_headers is not None:
+            req_headers.update(additional_headers)
+        if json is not None and not any(
+            name.lower() == "content-type" for name in req_headers
+        ):
+            req_headers["content-type"] = "application/json"
+        if req_headers:
+            cfg["headers"] = req_headers
+
+        additional_params = opts.get("additional_params")
+        if query_params or additional_params:
+            params = cfg.get("params", {})
+            if query_params:
+                params.update(query_params)
+            if additional_params:
+                params.update(additional_params)
+            cfg["params"] = params
+
+        if data is not None:
+            cfg["data"] = data
+        if files is not None:
+            cfg["files"] = files
+        if json is not None:
+            # pre-serialised so the client's codec is used rather than httpx's
+            cfg["content"] = (json_codec or get_json_codec("stdlib")).dumps(json)
+        if content is not None:
+            cfg["content"] = content
+
+        timeout = opts.get("timeout")
+        if timeout is not None:
+            cfg["timeout"] = timeout
+
+        return cfg
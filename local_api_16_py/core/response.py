@@ -1,8 +1,12 @@
 import json
-from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional
+from collections import deque
+from typing import Any, Union, Dict, Deque, Type, TypeVar, List, Generic, Optional
 from pydantic import BaseModel
 import httpx
 
+from .adapter_cache import AdapterCache
+from .sse import SSEDecoder, ServerSentEvent
+
 """
 Provides functionality for handling Server-Sent Events (SSE) streams and response data encoding.
 Includes utilities for both synchronous and asynchronous stream processing.
@@ -23,30 +27,62 @@ EncodableT = TypeVar(
 )
 
 
+response_decoders = AdapterCache()
+"""
+Process-wide registry of the TypeAdapters used to decode response data,
+shared by every client, response and stream event. Use
+`response_decoders.stats()` to inspect its hit/miss counters.
+"""
+
+
 def from_encodable(*, data: Any, load_with: Type[EncodableT]) -> Any:
     """
     Converts raw data into a specified type using Pydantic validation.
 
-    Uses a dynamic Pydantic model to validate and convert incoming data
-    into the specified target type.
+    The TypeAdapter for `load_with` is built once and reused from the
+    `response_decoders` registry for all subsequent conversions.
     """
+    return response_decoders.get(load_with).validate_python(data)
 
-    class Caster(BaseModel):
-        data: load_with  # type: ignore
 
-    return Caster(data=data).data
+def from_json(*, content: Union[str, bytes], load_with: Type[EncodableT]) -> Any:
+    """
+    Parses and validates a raw JSON document into the specified type in a
+    single pass.
+
+    The bytes are handed straight to pydantic-core's JSON parser, skipping
+    the intermediate Python dict/list tree that `json.loads` followed by
+    `from_encodable` would build.
+    """
+    return response_decoders.get(load_with).validate_json(content)
 
 
 T = TypeVar("T")
 
 
+def _event_payload(event: ServerSentEvent) -> Any:
+    """
+    Builds the value to convert into the stream's target type from an SSE event.
+
+    JSON data is used as is when it is an object with a `data` key, any other
+    data (JSON or plain text) is wrapped as `{"data": ...}`. The event's
+    metadata is left out, it is exposed by the stream response's `event`.
+    """
+    try:
+        payload = json.loads(event["data"])
+        if not isinstance(payload, dict) or "data" not in payload:
+            payload = {"data": payload}
+    except json.JSONDecodeError:
+        payload = {"data": event["data"]}
+    return payload
+
+
 class StreamResponse(Generic[T]):
     """
     Handles synchronous streaming of Server-Sent Events (SSE).
 
-    Processes a streaming HTTP response by buffering chunks of data
-    and parsing them according to SSE format, converting each event
-    into the specified type.
+    Feeds chunks of a streaming HTTP response through an incremental
+    SSE tokenizer, converting each event into the specified type.
     """
 
     def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
@@ -57,13 +93,28 @@ class StreamResponse(Generic[T]):
             response: The HTTP response containing the SSE stream
             stream_context: Context manager for the stream
             cast_to: Target type for converting parsed events
+
+        The raw event (including its `event` type, `id` and `retry` fields)
+        of the item last returned is kept in `event`.
         """
         self.response = response
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.iter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self.event: Optional[ServerSentEvent] = None
+        self._decoder = SSEDecoder()
+        self._events: Deque[ServerSentEvent] = deque()
+        self._exhausted = False
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """The last event ID received on the stream"""
+        return self._decoder.last_event_id
+
+    @property
+    def retry(self) -> Optional[int]:
+        """The reconnection time in milliseconds last requested by the server"""
+        return self._decoder.retry
 
     def __iter__(self):
         """Enables iteration over the stream events."""
@@ -73,100 +124,33 @@ class StreamResponse(Generic[T]):
         """
         Retrieves and processes the next event from the stream.
 
-        Buffers incoming data and processes it according to SSE format,
-        converting each complete event into the specified type.
+        Reads chunks until the tokenizer completes an event with data,
+        converting it into the specified type.
 
         Raises:
             StopIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
-
-                chunk = next(self.iterator)
-                self.buffer += chunk
-
-        except StopIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
-            self._context.__exit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
-        """
-        Processes the current buffer to extract complete SSE events.
-
-        Searches for event boundaries and parses complete events,
-        handling both JSON and non-JSON payloads.
+        while True:
+            while self._events:
+                event = self._events.popleft()
+                if event["data"]:
+                    self.event = event
+                    return from_encodable(
+                        data=_event_payload(event), load_with=self.cast_to
+                    )
 
-        Args:
-            final: Whether this is the final processing of the buffer
-        """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
-        """
-        Parses an SSE message to extract the data field.
+            if self._exhausted:
+                raise StopIteration
 
-        Handles multi-line data fields and empty data fields according
-        to the SSE specification.
-        """
-        data = []
-        for line in message.split("\n"):
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line.strip() == "data:":  # Handle empty data field
-                data.append("")
+            try:
+                chunk = next(self.iterator)
+            except StopIteration:
+                self._exhausted = True
+                self._events.extend(self._decoder.flush())
+                self._context.__exit__(None, None, None)
+                continue
 
-        if data:
-            return "\n".join(data)
-        return None
+            self._events.extend(self._decoder.feed(chunk))
 
 
 class AsyncStreamResponse(Generic[T]):
@@ -185,13 +169,28 @@ class AsyncStreamResponse(Generic[T]):
             response: The HTTP response containing the SSE stream
             stream_context: Async context manager for the stream
             cast_to: Target type for converting parsed events
+
+        The raw event (including its `event` type, `id` and `retry` fields)
+        of the item last returned is kept in `event`.
         """
         self.response = response
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.aiter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self.event: Optional[ServerSentEvent] = None
+        self._decoder = SSEDecoder()
+        self._events: Deque[ServerSentEvent] = deque()
+        self._exhausted = False
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """The last event ID received on the stream"""
+        return self._decoder.last_event_id
+
+    @property
+    def retry(self) -> Optional[int]:
+        """The reconnection time in milliseconds last requested by the server"""
+        return self._decoder.retry
 
     def __aiter__(self):
         """Enables async iteration over the stream events."""
@@ -207,87 +206,24 @@ class AsyncStreamResponse(Generic[T]):
         Raises:
             StopAsyncIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
-
-                chunk = await self.iterator.__anext__()
-                self.buffer += chunk
+        while True:
+            while self._events:
+                event = self._events.popleft()
+                if event["data"]:
+                    self.event = event
+                    return from_encodable(
+                        data=_event_payload(event), load_with=self.cast_to
+                    )
 
-        except StopAsyncIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
-            await self._context.__aexit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
-        """
-        Processes the current buffer to extract complete SSE events.
+            if self._exhausted:
+                raise StopAsyncIteration
 
-        Identical to the synchronous version's buffer processing.
-        """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
-        """
-        Parses an SSE message to extract the data field.
+            try:
+                chunk = await self.iterator.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+                self._events.extend(self._decoder.flush())
+                await self._context.__aexit__(None, None, None)
+                continue
 
-        Identical to the synchronous version's SSE parsing.
-        """
-        data = []
-        for line in message.split("\n"):
-            line = line.strip()
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line == "data:":  # Handle empty data field
-                data.append("")
-
-        if data:
-            return "\n".join(data)
-        return None
+            self._events.extend(self._decoder.feed(chunk))
@@ -0,0 +1,212 @@
+"""
+Retry policies with exponential backoff for transient HTTP failures.
+"""
+
+import datetime
+import email.utils
+import random
+import threading
+from typing import Collection, Dict, Optional, Tuple, Type
+
+import httpx
+from typing_extensions import NotRequired, TypedDict
+
+
+class RetryPolicy(TypedDict):
+    """
+    Controls if and how failed requests are retried.
+
+    Any key left out falls back to the client's policy, which in turn falls
+    back to `default_retry_policy()`.
+
+    Attributes:
+        max_attempts: Total number of attempts including the first, 1 disables retries
+        initial_delay: Seconds to wait before the first retry
+        max_delay: Upper bound in seconds for a single backoff delay
+        multiplier: Factor the delay grows by after each attempt
+        jitter: Randomize each delay between 0 and its computed value ("full jitter")
+        retry_status_codes: Response status codes which should be retried
+        retry_exceptions: Exception types raised by the transport which should be retried
+        retry_methods: HTTP methods which may be retried
+        respect_retry_after: Wait for the duration given by a `Retry-After` header.
+            Responses asking for a longer wait than `max_delay` are not retried.
+    """
+
+    max_attempts: NotRequired[int]
+    initial_delay: NotRequired[float]
+    max_delay: NotRequired[float]
+    multiplier: NotRequired[float]
+    jitter: NotRequired[bool]
+    retry_status_codes: NotRequired[Collection[int]]
+    retry_exceptions: NotRequired[Tuple[Type[BaseException], ...]]
+    retry_methods: NotRequired[Collection[str]]
+    respect_retry_after: NotRequired[bool]
+
+
+def default_retry_policy() -> RetryPolicy:
+    """
+    Provides the default retry policy.
+
+    Retries idempotent methods up to 3 attempts on rate limiting, gateway
+    errors and transient transport failures.
+    """
+    return {
+        "max_attempts": 3,
+        "initial_delay": 0.5,
+        "max_delay": 8.0,
+        "multiplier": 2.0,
+        "jitter": True,
+        "retry_status_codes": frozenset({429, 502, 503, 504}),
+        "retry_exceptions": (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+        ),
+        "retry_methods": frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+        "respect_retry_after": True,
+    }
+
+
+class RetryStats(TypedDict):
+    """
+    Snapshot of a client's retry counters.
+
+    Attributes:
+        retries: Total number of retry attempts made
+        retried_requests: Requests which needed at least one retry
+        recovered: Retried requests which eventually succeeded
+        exhausted: Retried requests which still failed after the final attempt
+    """
+
+    retries: int
+    retried_requests: int
+    recovered: int
+    exhausted: int
+
+
+class RetryMetrics:
+    """Thread-safe retry counters shared by all requests of a client"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {
+            "retries": 0,
+            "retried_requests": 0,
+            "recovered": 0,
+            "exhausted": 0,
+        }
+
+    def record(self, key: str, *, first_retry: bool = False) -> None:
+        with self._lock:
+            self._counts[key] += 1
+            if first_retry:
+                self._counts["retried_requests"] += 1
+
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return {
+                "retries": self._counts["retries"],
+                "retried_requests": self._counts["retried_requests"],
+                "recovered": self._counts["recovered"],
+                "exhausted": self._counts["exhausted"],
+            }
+
+
+class Retrier:
+    """
+    Tracks the attempts of a single request and decides whether, and after
+    how long, each failure should be retried.
+
+    Requests whose body cannot be sent again (e.g. a consumed iterator) are
+    never retried, whatever their method.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: RetryPolicy,
+        method: str,
+        metrics: RetryMetrics,
+        replayable: bool = True,
+    ):
+        self.policy = policy
+        self.metrics = metrics
+        self.attempt = 1
+        self._enabled = replayable and method.upper() in policy.get(
+            "retry_methods", ()
+        )
+
+    def response_delay(self, response: httpx.Response) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying a request which produced
+        `response`, or None if the response should be returned as is.
+        """
+        if response.is_success:
+            if self.attempt > 1:
+                self.metrics.record("recovered")
+            return None
+        if response.status_code not in self.policy.get("retry_status_codes", ()):
+            self._give_up()
+            return None
+
+        delay = self._backoff()
+        if self.policy.get("respect_retry_after", True):
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                if retry_after > self.policy.get("max_delay", retry_after):
+                    self._give_up()
+                    return None
+                delay = retry_after
+        return self._next_attempt(delay)
+
+    def exception_delay(self, exc: BaseException) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying a request which raised
+        `exc`, or None if the exception should be propagated.
+        """
+        if not isinstance(exc, tuple(self.policy.get("retry_exceptions", ()))):
+            self._give_up()
+            return None
+        return self._next_attempt(self._backoff())
+
+    def _backoff(self) -> float:
+        delay = min(
+            self.policy.get("max_delay", 0.0),
+            self.policy.get("initial_delay", 0.0)
+            * self.policy.get("multiplier", 1.0) ** (self.attempt - 1),
+        )
+        if self.policy.get("jitter", False):
+            delay = random.uniform(0, delay)
+        return delay
+
+    def _next_attempt(self, delay: float) -> Optional[float]:
+        if not self._enabled or self.attempt >= self.policy.get("max_attempts", 1):
+            self._give_up()
+            return None
+        self.metrics.record("retries", first_retry=self.attempt == 1)
+        self.attempt += 1
+        return delay
+
+    def _give_up(self) -> None:
+        if self.attempt > 1:
+            self.metrics.record("exhausted")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a `Retry-After` header given either as delay-seconds or an HTTP date
+    into a number of seconds from now.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
@@ -0,0 +1,132 @@
+"""
+Incremental tokenizer for Server-Sent Events (SSE) streams.
+
+Implements the event stream interpretation rules of the HTML living standard:
+https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation
+"""
+
+import re
+from typing import List, Optional
+
+from typing_extensions import TypedDict
+
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+
+
+class ServerSentEvent(TypedDict):
+    """
+    A single event dispatched from an SSE stream.
+
+    Attributes:
+        event: Value of the last `event:` field, None if not given
+        data: All `data:` field values joined by newlines
+        id: The last event ID seen on the stream, None if never set
+        retry: Reconnection time in milliseconds from the last valid `retry:`
+            field, None if never set
+    """
+
+    event: Optional[str]
+    data: str
+    id: Optional[str]
+    retry: Optional[int]
+
+
+class SSEDecoder:
+    """
+    Single pass, incremental SSE tokenizer.
+
+    Bytes are appended to an internal buffer and scanned line by line from a
+    running offset, so every byte is examined once regardless of how the
+    stream is chunked. Consumed bytes are discarded once per `feed` call,
+    leaving only a trailing partial line buffered.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._event: Optional[str] = None
+        self._data: List[str] = []
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """
+        Adds a chunk of the stream and returns the events it completes
+        """
+        self._buffer += chunk
+        events = self._read_lines(final=False)
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._pos = 0
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        """
+        Signals the end of the stream, returning any event left unterminated
+        """
+        events = self._read_lines(final=True)
+        self._buffer.clear()
+        self._pos = 0
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _read_lines(self, *, final: bool) -> List[ServerSentEvent]:
+        events: List[ServerSentEvent] = []
+        buffer = self._buffer
+        while True:
+            match = _LINE_END.search(buffer, self._pos)
+            if match is None:
+                if final and self._pos < len(buffer):
+                    self._process_line(bytes(buffer[self._pos :]))
+                    self._pos = len(buffer)
+                break
+            if match.group() == b"\r" and match.end() == len(buffer) and not final:
+                # a trailing \r may be the first half of a \r\n split across chunks
+                break
+
+            line_start, self._pos = self._pos, match.end()
+            if line_start == match.start():
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+            else:
+                self._process_line(bytes(buffer[line_start : match.start()]))
+        return events
+
+    def _process_line(self, raw: bytes) -> None:
+        line = raw.decode()
+        if line.startswith(":"):
+            # comment
+            return
+
+        field, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry":
+            if value.isascii() and value.isdigit():
+                self.retry = int(value)
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        if not self._data:
+            self._event = None
+            return None
+
+        event: ServerSentEvent = {
+            "event": self._event,
+            "data": "\n".join(self._data),
+            "id": self.last_event_id,
+            "retry": self.retry,
+        }
+        self._event = None
+        self._data = []
+        return event
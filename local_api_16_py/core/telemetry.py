@@ -0,0 +1,171 @@
+"""
+Optional OpenTelemetry tracing and metrics.
+
+OpenTelemetry is only imported once a client enables telemetry, and
+telemetry is silently disabled when it is not installed, so the SDK neither
+depends on it nor pays for its import otherwise.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+import httpx
+from typing_extensions import NotRequired, TypedDict
+
+from .observer import PhaseTimer, RequestTiming
+
+INSTRUMENTATION_NAME = "local_api_16_py"
+
+
+class TelemetryConfig(TypedDict):
+    """
+    Configures the OpenTelemetry instrumentation of a client.
+
+    Attributes:
+        tracer_provider: Provider of the client's tracer, the global one by default
+        meter_provider: Provider of the client's meter, the global one by default
+        propagate: Inject the request span's trace context into the request
+            headers with the global propagator, True by default
+    """
+
+    tracer_provider: NotRequired[Any]
+    meter_provider: NotRequired[Any]
+    propagate: NotRequired[bool]
+
+
+class Telemetry:
+    """
+    Records a client span and metrics for each request of a client.
+
+    Spans are named after the method and path pattern of the request and
+    carry the HTTP client semantic convention attributes, along with the
+    operation name as `code.function.name`. The request duration, body sizes
+    and decode time are recorded in histograms with the same attributes.
+    """
+
+    def __init__(self, config: TelemetryConfig) -> None:
+        """
+        Args:
+            config: Providers and options of the instrumentation
+
+        Raises:
+            ImportError: If OpenTelemetry is not installed
+        """
+        from opentelemetry import metrics, propagate, trace
+
+        self._trace = trace
+        self._inject = propagate.inject if config.get("propagate", True) else None
+        self._tracer = trace.get_tracer(
+            INSTRUMENTATION_NAME, tracer_provider=config.get("tracer_provider")
+        )
+        meter = metrics.get_meter(
+            INSTRUMENTATION_NAME, meter_provider=config.get("meter_provider")
+        )
+        self._duration = meter.create_histogram(
+            "http.client.request.duration",
+            unit="s",
+            description="Duration of HTTP client requests",
+        )
+        self._request_size = meter.create_histogram(
+            "http.client.request.body.size",
+            unit="By",
+            description="Size of HTTP client request bodies",
+        )
+        self._response_size = meter.create_histogram(
+            "http.client.response.body.size",
+            unit="By",
+            description="Size of HTTP client response bodies",
+        )
+        self._decode_duration = meter.create_histogram(
+            f"{INSTRUMENTATION_NAME}.client.decode.duration",
+            unit="s",
+            description="Duration of decoding HTTP client responses",
+        )
+
+    def start(self, timer: PhaseTimer) -> None:
+        """
+        Starts the span of a request, ended once the timer finishes.
+
+        Args:
+            timer: Timer of the request
+        """
+        timing = timer.timing
+        span = self._tracer.start_span(
+            f"{timing['method']} {timing['path']}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": timing["method"],
+                "url.template": timing["path"],
+                "code.function.name": timing["operation"],
+            },
+        )
+        if self._inject is not None:
+            carrier: Dict[str, str] = {}
+            self._inject(carrier, context=self._trace.set_span_in_context(span))
+            timer.headers = carrier
+        timer.on_finish(lambda finished: self._end(span, timer, finished))
+
+    def _end(self, span: Any, timer: PhaseTimer, timing: RequestTiming) -> None:
+        attributes: Dict[str, Union[str, int]] = {
+            "http.request.method": timing["method"],
+            "url.template": timing["path"],
+            "code.function.name": timing["operation"],
+        }
+        if timer.url is not None:
+            url = httpx.URL(timer.url)
+            attributes["server.address"] = url.host
+            if url.port is not None:
+                attributes["server.port"] = url.port
+        status_code = timing["status_code"]
+        if status_code is not None:
+            attributes["http.response.status_code"] = status_code
+        error = timing["error"]
+        error_type: Optional[str] = None
+        if status_code is not None and status_code >= 400:
+            error_type = str(status_code)
+        elif error is not None:
+            error_type = type(error).__qualname__
+        if error_type is not None:
+            attributes["error.type"] = error_type
+
+        self._duration.record(timing["duration"], attributes)
+        if timing["request_size"] is not None:
+            self._request_size.record(timing["request_size"], attributes)
+        if timing["response_size"] is not None:
+            self._response_size.record(timing["response_size"], attributes)
+        decode = timing["phases"].get("decode")
+        if decode is not None:
+            self._decode_duration.record(decode, attributes)
+
+        span.set_attributes(attributes)
+        if timer.url is not None:
+            # the query is left out as it may carry credentials
+            span.set_attribute("url.full", timer.url)
+        if timing["attempts"] > 1:
+            span.set_attribute("http.request.resend_count", timing["attempts"] - 1)
+        if timing["request_size"] is not None:
+            span.set_attribute("http.request.body.size", timing["request_size"])
+        if timing["response_size"] is not None:
+            span.set_attribute("http.response.body.size", timing["response_size"])
+        if error is not None:
+            span.record_exception(error)
+        if error_type is not None:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+
+def create_telemetry(config: Union[bool, TelemetryConfig]) -> Optional[Telemetry]:
+    """
+    Creates the OpenTelemetry instrumentation of a client.
+
+    Args:
+        config: True or a configuration to enable telemetry, False to disable it
+
+    Returns:
+        The instrumentation, None if disabled or OpenTelemetry is not installed
+    """
+    if config is False:
+        return None
+    try:
+        return Telemetry({} if config is True else config)
+    except ImportError:
+        return None
@@ -0,0 +1,281 @@
+"""
+Streaming request bodies for file uploads.
+
+Files are sent in fixed size chunks as the request is written rather than
+read into memory up front, so the memory an upload needs is bounded by the
+chunk size regardless of the file size.
+"""
+
+import asyncio
+import io
+import mmap
+import os
+import stat
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+import httpx
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+UploadProgress = Callable[[int, Optional[int]], None]
+"""
+Called after every chunk with the number of bytes sent so far and the total
+size of the upload, None if it is not known up front
+"""
+
+UploadSource = Union[httpx._types.FileTypes, "os.PathLike[str]", Iterable[bytes]]
+AsyncUploadSource = Union[UploadSource, AsyncIterable[bytes]]
+
+
+def _file_content(source: Any) -> Any:
+    # (filename, content, ...) tuples as accepted by httpx `files`
+    return source[1] if isinstance(source, tuple) else source
+
+
+def _seekable(file: Any) -> bool:
+    try:
+        return bool(file.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _regular_file_size(st: os.stat_result) -> Optional[int]:
+    # pipes, sockets and character devices report a size of 0 (or whatever
+    # is buffered), only the size of a regular file is its content length
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
+def _remaining_length(file: Any, start: int) -> Optional[int]:
+    try:
+        size = _regular_file_size(os.fstat(file.fileno()))
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+    else:
+        return None if size is None else size - start
+    if not _seekable(file):
+        return None
+    end = file.seek(0, os.SEEK_END)
+    file.seek(start)
+    return end - start
+
+
+def _read_path(path: "os.PathLike[str]", chunk_size: int) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        try:
+            # map the file rather than reading it through a user space buffer,
+            # pages are brought in by the OS as chunks are sliced off
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # empty files, special files and platforms without mmap
+            yield from _read_file(file, chunk_size)
+            return
+        with mapped:
+            for offset in range(0, size, chunk_size):
+                yield mapped[offset : offset + chunk_size]
+
+
+def _read_file(file: Any, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def _read_bytes(
+    content: Union[bytes, bytearray, memoryview], chunk_size: int
+) -> Iterator[bytes]:
+    view = memoryview(content)
+    for offset in range(0, len(view), chunk_size):
+        yield bytes(view[offset : offset + chunk_size])
+
+
+def _next_chunk(chunks: Iterator[bytes]) -> Optional[bytes]:
+    return next(chunks, None)
+
+
+class _Source:
+    """Turns any supported upload source into a series of byte chunks"""
+
+    def __init__(self, source: Any, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.content = _file_content(source)
+        self.content_length: Optional[int] = None
+        # whether producing a chunk may block on disk I/O
+        self.blocking = False
+        # position of a seekable file object, to rewind to when re-sent
+        self._start: Optional[int] = None
+
+        content = self.content
+        if isinstance(content, str):
+            self.content = content = content.encode()
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            self.content_length = len(content)
+        elif isinstance(content, os.PathLike):
+            self.content_length = _regular_file_size(os.stat(content))
+            self.blocking = True
+        elif hasattr(content, "read") and callable(content.read):
+            if _seekable(content):
+                self._start = content.tell()
+            self.content_length = _remaining_length(
+                content, self._start if self._start is not None else 0
+            )
+            self.blocking = True
+
+    @property
+    def replayable(self) -> bool:
+        content = self.content
+        if isinstance(content, (bytes, bytearray, memoryview, os.PathLike)):
+            return True
+        return self._start is not None
+
+    def chunks(self) -> Iterator[bytes]:
+        content = self.content
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return _read_bytes(content, self.chunk_size)
+        if isinstance(content, os.PathLike):
+            return _read_path(content, self.chunk_size)
+        if hasattr(content, "read") and callable(content.read):
+            if self._start is not None:
+                content.seek(self._start)
+            return _read_file(content, self.chunk_size)
+        # any other iterable of bytes, which can only be sent once
+        return iter(content)
+
+
+class FileStream:
+    """
+    Request content streaming an upload in chunks.
+
+    File objects, paths and byte strings can be sent repeatedly (e.g. when
+    the request is retried), other iterables only once.
+    """
+
+    def __init__(
+        self,
+        source: UploadSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[UploadProgress] = None,
+    ):
+        """
+        Args:
+            source: A file object, path, byte string, iterable of bytes or an
+                httpx style `(filename, content, ...)` tuple of one of these
+            chunk_size: Number of bytes read from files per chunk
+            progress: Callback reporting the bytes sent after every chunk
+        """
+        self._source = _Source(source, chunk_size)
+        self._progress = progress
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Size of the upload in bytes, None if it is not known up front"""
+        return self._source.content_length
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the upload can be sent again, e.g. when its request is retried"""
+        return self._source.replayable
+
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the upload, to be sent with its request"""
+        if self.content_length is None:
+            return {}
+        return {"content-length": str(self.content_length)}
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        for chunk in self._source.chunks():
+            sent += len(chunk)
+            if self._progress is not None:
+                self._progress(sent, self.content_length)
+            yield chunk
+
+
+class AsyncFileStream:
+    """
+    Request content streaming an upload in chunks for asynchronous clients.
+
+    Accepts the same sources as `FileStream` plus async iterables of bytes.
+    Chunks of files and paths are read in the default executor so the event
+    loop is never blocked on disk I/O.
+    """
+
+    def __init__(
+        self,
+        source: AsyncUploadSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[UploadProgress] = None,
+    ):
+        """
+        Args:
+            source: A file object, path, byte string, (async) iterable of bytes
+                or an httpx style `(filename, content, ...)` tuple of one of these
+            chunk_size: Number of bytes read from files per chunk
+            progress: Callback reporting the bytes sent after every chunk
+        """
+        content = _file_content(source)
+        self._async_content: Optional[AsyncIterable[bytes]] = (
+            content if isinstance(content, AsyncIterable) else None
+        )
+        self._source = (
+            None if self._async_content is not None else _Source(source, chunk_size)
+        )
+        self._progress = progress
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Size of the upload in bytes, None if it is not known up front"""
+        return None if self._source is None else self._source.content_length
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the upload can be sent again, e.g. when its request is retried"""
+        return self._source is not None and self._source.replayable
+
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the upload, to be sent with its request"""
+        if self.content_length is None:
+            return {}
+        return {"content-length": str(self.content_length)}
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        sent = 0
+        async for chunk in self._chunks():
+            sent += len(chunk)
+            if self._progress is not None:
+                self._progress(sent, self.content_length)
+            yield chunk
+
+    async def _chunks(self) -> AsyncIterator[bytes]:
+        if self._async_content is not None:
+            async for chunk in self._async_content:
+                yield chunk
+            return
+
+        assert self._source is not None
+        chunks = self._source.chunks()
+        if not self._source.blocking:
+            for chunk in chunks:
+                yield chunk
+            return
+
+        loop = asyncio.get_running_loop()
+        while True:
+            read = await loop.run_in_executor(None, _next_chunk, chunks)
+            if read is None:
+                return
+            yield read
@@ -1,3 +1,4 @@
+import json
 import typing
 import re
 from typing_extensions import Literal
@@ -29,6 +30,39 @@ def get_response_type(headers: httpx.Headers) -> Literal["json", "text", "binary
         return "binary"
 
 
+_BYTE_ORDER_MARKS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+
+
+def is_utf8_json(response: httpx.Response) -> bool:
+    """
+    Check whether a JSON response body is unambiguously UTF-8 encoded, i.e. it
+    declares no charset (or a UTF-8 one) and does not start with a byte order mark
+    """
+    charset = response.charset_encoding
+    if charset is not None and charset.lower().replace("-", "") != "utf8":
+        return False
+    return not response.content.startswith(_BYTE_ORDER_MARKS)
+
+
+def load_json(response: httpx.Response) -> typing.Any:
+    """
+    Parse a JSON response body in the charset it declares, skipping a leading
+    byte order mark. Bodies without a charset are decoded as UTF-8, UTF-16 or
+    UTF-32, as detected from their first bytes.
+    """
+    charset = response.charset_encoding
+    if charset is None:
+        return response.json()
+    if charset.lower().replace("-", "") == "utf8":
+        charset = "utf-8-sig"
+    try:
+        text = response.content.decode(charset)
+    except LookupError:
+        # unknown charset
+        return response.json()
+    return json.loads(text)
+
+
 def is_union_type(type_hint: typing.Any) -> bool:
     """Check if a type hint is a Union type."""
     return hasattr(type_hint, "__origin__") and type_hint.__origin__ is typing.Union
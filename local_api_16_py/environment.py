@@ -10,9 +10,13 @@ class Environment(enum.Enum):
 
 
 def _get_base_url(
-    *, base_url: typing.Optional[str] = None, environment: Environment
-) -> str:
+    *,
+    base_url: typing.Optional[typing.Union[str, typing.List[str]]] = None,
+    environment: Environment,
+) -> typing.Union[str, typing.List[str]]:
     if base_url is not None:
+        if not isinstance(base_url, str) and not base_url:
+            raise ValueError("base_url must include at least one URL")
         return base_url
     elif environment is not None:
         return environment.value
@@ -0,0 +1,59 @@
+import typing
+
+from local_api_16_py.core import CacheInvalidation, InvalidationMap
+
+CACHEABLE_PATHS: typing.List[str] = [
+    "/pet/findByStatus",
+    "/pet/findByTags",
+    "/pet/{petId}",
+    "/store/inventory",
+    "/store/order/{orderId}",
+    "/user/{username}",
+]
+"""
+GET endpoints whose responses are cached when the response cache is enabled,
+`/user/login` and `/user/logout` are left out as they start and end sessions
+and carry credentials in their query
+"""
+
+_PET_STATUS: CacheInvalidation = {"path": "/pet/findByStatus"}
+_PET_TAGS: CacheInvalidation = {"path": "/pet/findByTags"}
+_INVENTORY: CacheInvalidation = {"path": "/store/inventory"}
+
+CACHE_INVALIDATIONS: InvalidationMap = {
+    "POST /pet": [_PET_STATUS, _PET_TAGS, _INVENTORY],
+    "PUT /pet": [
+        {"path": "/pet/{petId}", "body_params": {"petId": "id"}},
+        _PET_STATUS,
+        _PET_TAGS,
+        _INVENTORY,
+    ],
+    "DELETE /pet/{petId}": [
+        {"path": "/pet/{petId}", "path_params": {"petId": "petId"}},
+        _PET_STATUS,
+        _PET_TAGS,
+        _INVENTORY,
+    ],
+    "POST /pet/{petId}/uploadImage": [
+        {"path": "/pet/{petId}", "path_params": {"petId": "petId"}},
+        _PET_STATUS,
+        _PET_TAGS,
+    ],
+    "POST /store/order": [_INVENTORY],
+    "DELETE /store/order/{orderId}": [
+        {"path": "/store/order/{orderId}", "path_params": {"orderId": "orderId"}},
+        _INVENTORY,
+    ],
+    "PUT /user/{username}": [
+        {"path": "/user/{username}", "path_params": {"username": "username"}},
+        # the update may rename the user
+        {"path": "/user/{username}", "body_params": {"username": "username"}},
+    ],
+    "DELETE /user/{username}": [
+        {"path": "/user/{username}", "path_params": {"username": "username"}},
+    ],
+}
+"""
+Cached reads made stale by each mutating operation of the API, applied
+when the response cache is enabled
+"""
@@ -0,0 +1,26 @@
+import typing
+
+OPERATION_NAMES: typing.Dict[str, str] = {
+    "DELETE /pet/{petId}": "pet.delete",
+    "GET /pet/findByStatus": "pet.find_by_status",
+    "GET /pet/findByTags": "pet.find_by_tags",
+    "GET /pet/{petId}": "pet.get",
+    "POST /pet": "pet.create",
+    "POST /pet/{petId}/uploadImage": "pet.upload_image",
+    "PUT /pet": "pet.update",
+    "GET /store/inventory": "store.inventory.list",
+    "DELETE /store/order/{orderId}": "store.order.delete",
+    "GET /store/order/{orderId}": "store.order.get",
+    "POST /store/order": "store.order.create",
+    "DELETE /user/{username}": "user.delete",
+    "GET /user/login": "user.login",
+    "GET /user/logout": "user.logout",
+    "GET /user/{username}": "user.get",
+    "POST /user": "user.create",
+    "POST /user/createWithList": "user.create_with_list",
+    "PUT /user/{username}": "user.update",
+}
+"""
+Name of the client method of each operation of the API, keyed by method and
+path pattern, as reported to request observers
+"""
@@ -4,12 +4,20 @@ import typing_extensions
 
 from local_api_16_py.core import (
     AsyncBaseClient,
+    AsyncJsonArrayStreamResponse,
+    AsyncUploadSource,
+    BatchGet,
+    BatchResult,
     BinaryResponse,
+    JsonArrayStreamResponse,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    UploadProgress,
+    UploadSource,
     default_request_options,
     encode_query_param,
+    to_async_content,
     to_content,
     to_encodable,
     type_utils,
@@ -49,7 +57,8 @@ class PetClient:
         """
         return self._base_client.request(
             method="DELETE",
-            path=f"/pet/{pet_id}",
+            path="/pet/{petId}",
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -157,6 +166,116 @@ class PetClient:
             request_options=request_options or default_request_options(),
         )
 
+    def find_by_status_iter(
+        self,
+        *,
+        status: typing.Union[
+            typing.Optional[typing_extensions.Literal["available", "pending", "sold"]],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> JsonArrayStreamResponse[models.Pet]:
+        """
+        Finds Pets by status, streaming the results.
+
+        Incremental variant of `find_by_status` which decodes the response array
+        as it arrives, yielding one validated pet at a time. Closing the stream
+        before it is exhausted closes the connection.
+
+        GET /pet/findByStatus
+
+        Args:
+            status: Status values that need to be considered for filter
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            successful operation
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        with client.pet.find_by_status_iter(status="available") as pets:
+            for pet in pets:
+                ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(status, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "status",
+                to_encodable(
+                    item=status,
+                    dump_with=typing_extensions.Literal["available", "pending", "sold"],
+                ),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.stream_json_array(
+            method="GET",
+            path="/pet/findByStatus",
+            auth_names=["api_key"],
+            query_params=_query,
+            cast_to=models.Pet,
+            request_options=request_options or default_request_options(),
+        )
+
+    def find_by_tags_iter(
+        self,
+        *,
+        tags: typing.Union[
+            typing.Optional[typing.List[str]], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> JsonArrayStreamResponse[models.Pet]:
+        """
+        Finds Pets by tags, streaming the results.
+
+        Incremental variant of `find_by_tags` which decodes the response array
+        as it arrives, yielding one validated pet at a time. Closing the stream
+        before it is exhausted closes the connection.
+
+        GET /pet/findByTags
+
+        Args:
+            tags: Tags to filter by
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            successful operation
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        with client.pet.find_by_tags_iter(tags=["tag1"]) as pets:
+            for pet in pets:
+                ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(tags, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "tags",
+                to_encodable(item=tags, dump_with=typing.List[str]),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.stream_json_array(
+            method="GET",
+            path="/pet/findByTags",
+            auth_names=["api_key"],
+            query_params=_query,
+            cast_to=models.Pet,
+            request_options=request_options or default_request_options(),
+        )
+
     def get(
         self, *, pet_id: int, request_options: typing.Optional[RequestOptions] = None
     ) -> typing.Union[models.Pet, BinaryResponse]:
@@ -185,12 +304,77 @@ class PetClient:
         """
         return self._base_client.request(
             method="GET",
-            path=f"/pet/{pet_id}",
+            path="/pet/{petId}",
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
 
+    def get_many(
+        self,
+        *,
+        pet_ids: typing.Iterable[int],
+        max_workers: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[BatchResult[int, typing.Union[models.Pet, BinaryResponse]]]:
+        """
+        Find pets by ID.
+
+        Calls `get` for every item concurrently on a pool of at most `max_workers`
+        threads sharing this client's connection pool. A failure for one item does
+        not affect the others.
+
+        Args:
+            pet_ids: Items to fetch
+            max_workers: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            One BatchResult per item, in the same order, holding either the
+            fetched value or the exception raised for it
+
+        Examples:
+        ```py
+        client.pet.get_many(pet_ids=[1, 2, 3])
+        ```
+        """
+        return BatchGet[int, typing.Union[models.Pet, BinaryResponse]](
+            self.get, key_param="pet_id", request_options=request_options
+        ).map(pet_ids, max_workers=max_workers)
+
+    def get_many_as_completed(
+        self,
+        *,
+        pet_ids: typing.Iterable[int],
+        max_workers: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[BatchResult[int, typing.Union[models.Pet, BinaryResponse]]]:
+        """
+        Find pets by ID.
+
+        Streaming variant of `get_many` yielding each BatchResult as soon as its
+        request completes. Closing the iterator early cancels the requests which
+        have not started yet.
+
+        Args:
+            pet_ids: Items to fetch
+            max_workers: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Iterator of BatchResults in completion order
+
+        Examples:
+        ```py
+        for res in client.pet.get_many_as_completed(pet_ids=[1, 2, 3]):
+            ...
+        ```
+        """
+        return BatchGet[int, typing.Union[models.Pet, BinaryResponse]](
+            self.get, key_param="pet_id", request_options=request_options
+        ).as_completed(pet_ids, max_workers=max_workers)
+
     def create(
         self,
         *,
@@ -267,8 +451,9 @@ class PetClient:
             typing.Optional[str], type_utils.NotGiven
         ] = type_utils.NOT_GIVEN,
         data: typing.Union[
-            typing.Optional[httpx._types.FileTypes], type_utils.NotGiven
+            typing.Optional[UploadSource], type_utils.NotGiven
         ] = type_utils.NOT_GIVEN,
+        upload_progress: typing.Optional[UploadProgress] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> models.ApiResponse:
         """
@@ -280,8 +465,9 @@ class PetClient:
 
         Args:
             additionalMetadata: Additional Metadata
-            data: httpx._types.FileTypes
+            data: File object, path, bytes or iterable of byte chunks, streamed in chunks
             petId: ID of pet to update
+            upload_progress: Called with the bytes sent so far and the total size
             request_options: Additional options to customize the HTTP request
 
         Returns:
@@ -305,13 +491,15 @@ class PetClient:
                 style="form",
                 explode=True,
             )
-        _content = to_content(file=data) if data else None
+        _content = to_content(file=data, progress=upload_progress) if data else None
         _content_type = "application/octet-stream" if data else None
         return self._base_client.request(
             method="POST",
-            path=f"/pet/{pet_id}/uploadImage",
+            path="/pet/{petId}/uploadImage",
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             query_params=_query,
+            headers=_content.headers() if _content is not None else None,
             content=_content,
             content_type=_content_type,
             cast_to=models.ApiResponse,
@@ -419,7 +607,8 @@ class AsyncPetClient:
         """
         return await self._base_client.request(
             method="DELETE",
-            path=f"/pet/{pet_id}",
+            path="/pet/{petId}",
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -527,6 +716,116 @@ class AsyncPetClient:
             request_options=request_options or default_request_options(),
         )
 
+    async def find_by_status_iter(
+        self,
+        *,
+        status: typing.Union[
+            typing.Optional[typing_extensions.Literal["available", "pending", "sold"]],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncJsonArrayStreamResponse[models.Pet]:
+        """
+        Finds Pets by status, streaming the results.
+
+        Incremental variant of `find_by_status` which decodes the response array
+        as it arrives, yielding one validated pet at a time. Closing the stream
+        before it is exhausted closes the connection.
+
+        GET /pet/findByStatus
+
+        Args:
+            status: Status values that need to be considered for filter
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            successful operation
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async with await client.pet.find_by_status_iter(status="available") as pets:
+            async for pet in pets:
+                ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(status, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "status",
+                to_encodable(
+                    item=status,
+                    dump_with=typing_extensions.Literal["available", "pending", "sold"],
+                ),
+                style="form",
+                explode=True,
+            )
+        return await self._base_client.stream_json_array(
+            method="GET",
+            path="/pet/findByStatus",
+            auth_names=["api_key"],
+            query_params=_query,
+            cast_to=models.Pet,
+            request_options=request_options or default_request_options(),
+        )
+
+    async def find_by_tags_iter(
+        self,
+        *,
+        tags: typing.Union[
+            typing.Optional[typing.List[str]], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncJsonArrayStreamResponse[models.Pet]:
+        """
+        Finds Pets by tags, streaming the results.
+
+        Incremental variant of `find_by_tags` which decodes the response array
+        as it arrives, yielding one validated pet at a time. Closing the stream
+        before it is exhausted closes the connection.
+
+        GET /pet/findByTags
+
+        Args:
+            tags: Tags to filter by
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            successful operation
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async with await client.pet.find_by_tags_iter(tags=["tag1"]) as pets:
+            async for pet in pets:
+                ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(tags, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "tags",
+                to_encodable(item=tags, dump_with=typing.List[str]),
+                style="form",
+                explode=True,
+            )
+        return await self._base_client.stream_json_array(
+            method="GET",
+            path="/pet/findByTags",
+            auth_names=["api_key"],
+            query_params=_query,
+            cast_to=models.Pet,
+            request_options=request_options or default_request_options(),
+        )
+
     async def get(
         self, *, pet_id: int, request_options: typing.Optional[RequestOptions] = None
     ) -> typing.Union[models.Pet, BinaryResponse]:
@@ -555,12 +854,76 @@ class AsyncPetClient:
         """
         return await self._base_client.request(
             method="GET",
-            path=f"/pet/{pet_id}",
+            path="/pet/{petId}",
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
 
+    async def get_many(
+        self,
+        *,
+        pet_ids: typing.Iterable[int],
+        concurrency: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[BatchResult[int, typing.Union[models.Pet, BinaryResponse]]]:
+        """
+        Find pets by ID.
+
+        Awaits `get` for every item with at most `concurrency` requests in flight.
+        A failure for one item does not affect the others.
+
+        Args:
+            pet_ids: Items to fetch
+            concurrency: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            One BatchResult per item, in the same order, holding either the
+            fetched value or the exception raised for it
+
+        Examples:
+        ```py
+        await client.pet.get_many(pet_ids=[1, 2, 3])
+        ```
+        """
+        return await BatchGet[int, typing.Union[models.Pet, BinaryResponse]](
+            self.get, key_param="pet_id", request_options=request_options
+        ).gather(pet_ids, concurrency=concurrency)
+
+    def get_many_as_completed(
+        self,
+        *,
+        pet_ids: typing.Iterable[int],
+        concurrency: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[BatchResult[int, typing.Union[models.Pet, BinaryResponse]]]:
+        """
+        Find pets by ID.
+
+        Streaming variant of `get_many` yielding each BatchResult as soon as its
+        request completes. Closing the iterator early cancels the requests still
+        in flight.
+
+        Args:
+            pet_ids: Items to fetch
+            concurrency: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Async iterator of BatchResults in completion order
+
+        Examples:
+        ```py
+        async for res in client.pet.get_many_as_completed(pet_ids=[1, 2, 3]):
+            ...
+        ```
+        """
+        return BatchGet[int, typing.Union[models.Pet, BinaryResponse]](
+            self.get, key_param="pet_id", request_options=request_options
+        ).aas_completed(pet_ids, concurrency=concurrency)
+
     async def create(
         self,
         *,
@@ -637,8 +1000,9 @@ class AsyncPetClient:
             typing.Optional[str], type_utils.NotGiven
         ] = type_utils.NOT_GIVEN,
         data: typing.Union[
-            typing.Optional[httpx._types.FileTypes], type_utils.NotGiven
+            typing.Optional[AsyncUploadSource], type_utils.NotGiven
         ] = type_utils.NOT_GIVEN,
+        upload_progress: typing.Optional[UploadProgress] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> models.ApiResponse:
         """
@@ -650,8 +1014,9 @@ class AsyncPetClient:
 
         Args:
             additionalMetadata: Additional Metadata
-            data: httpx._types.FileTypes
+            data: File object, path, bytes or (async) iterable of byte chunks, streamed in chunks
             petId: ID of pet to update
+            upload_progress: Called with the bytes sent so far and the total size
             request_options: Additional options to customize the HTTP request
 
         Returns:
@@ -675,13 +1040,15 @@ class AsyncPetClient:
                 style="form",
                 explode=True,
             )
-        _content = to_content(file=data) if data else None
+        _content = to_async_content(file=data, progress=upload_progress) if data else None
         _content_type = "application/octet-stream" if data else None
         return await self._base_client.request(
             method="POST",
-            path=f"/pet/{pet_id}/uploadImage",
+            path="/pet/{petId}/uploadImage",
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             query_params=_query,
+            headers=_content.headers() if _content is not None else None,
             content=_content,
             content_type=_content_type,
             cast_to=models.ApiResponse,
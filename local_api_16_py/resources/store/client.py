@@ -1,20 +1,45 @@
+import functools
+import typing
+
 from local_api_16_py.core import AsyncBaseClient, SyncBaseClient
-from local_api_16_py.resources.store.inventory import (
-    AsyncInventoryClient,
-    InventoryClient,
-)
-from local_api_16_py.resources.store.order import AsyncOrderClient, OrderClient
+
+if typing.TYPE_CHECKING:
+    from local_api_16_py.resources.store.inventory import (
+        AsyncInventoryClient,
+        InventoryClient,
+    )
+    from local_api_16_py.resources.store.order import AsyncOrderClient, OrderClient
 
 
 class StoreClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.order = OrderClient(base_client=self._base_client)
-        self.inventory = InventoryClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def order(self) -> "OrderClient":
+        from local_api_16_py.resources.store.order import OrderClient
+
+        return OrderClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def inventory(self) -> "InventoryClient":
+        from local_api_16_py.resources.store.inventory import InventoryClient
+
+        return InventoryClient(base_client=self._base_client)
 
 
 class AsyncStoreClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.order = AsyncOrderClient(base_client=self._base_client)
-        self.inventory = AsyncInventoryClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def order(self) -> "AsyncOrderClient":
+        from local_api_16_py.resources.store.order import AsyncOrderClient
+
+        return AsyncOrderClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def inventory(self) -> "AsyncInventoryClient":
+        from local_api_16_py.resources.store.inventory import AsyncInventoryClient
+
+        return AsyncInventoryClient(base_client=self._base_client)
@@ -3,6 +3,8 @@ import typing
 
 from local_api_16_py.core import (
     AsyncBaseClient,
+    BatchGet,
+    BatchResult,
     BinaryResponse,
     RequestOptions,
     SyncBaseClient,
@@ -45,7 +47,8 @@ class OrderClient:
         """
         return self._base_client.request(
             method="DELETE",
-            path=f"/store/order/{order_id}",
+            path="/store/order/{orderId}",
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -79,12 +82,77 @@ class OrderClient:
         """
         return self._base_client.request(
             method="GET",
-            path=f"/store/order/{order_id}",
+            path="/store/order/{orderId}",
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Order, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
 
+    def get_many(
+        self,
+        *,
+        order_ids: typing.Iterable[int],
+        max_workers: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[BatchResult[int, typing.Union[models.Order, BinaryResponse]]]:
+        """
+        Find purchase orders by ID.
+
+        Calls `get` for every item concurrently on a pool of at most `max_workers`
+        threads sharing this client's connection pool. A failure for one item does
+        not affect the others.
+
+        Args:
+            order_ids: Items to fetch
+            max_workers: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            One BatchResult per item, in the same order, holding either the
+            fetched value or the exception raised for it
+
+        Examples:
+        ```py
+        client.store.order.get_many(order_ids=[1, 2, 3])
+        ```
+        """
+        return BatchGet[int, typing.Union[models.Order, BinaryResponse]](
+            self.get, key_param="order_id", request_options=request_options
+        ).map(order_ids, max_workers=max_workers)
+
+    def get_many_as_completed(
+        self,
+        *,
+        order_ids: typing.Iterable[int],
+        max_workers: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[BatchResult[int, typing.Union[models.Order, BinaryResponse]]]:
+        """
+        Find purchase orders by ID.
+
+        Streaming variant of `get_many` yielding each BatchResult as soon as its
+        request completes. Closing the iterator early cancels the requests which
+        have not started yet.
+
+        Args:
+            order_ids: Items to fetch
+            max_workers: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Iterator of BatchResults in completion order
+
+        Examples:
+        ```py
+        for res in client.store.order.get_many_as_completed(order_ids=[1, 2, 3]):
+            ...
+        ```
+        """
+        return BatchGet[int, typing.Union[models.Order, BinaryResponse]](
+            self.get, key_param="order_id", request_options=request_options
+        ).as_completed(order_ids, max_workers=max_workers)
+
     def create(
         self,
         *,
@@ -161,7 +229,8 @@ class AsyncOrderClient:
         """
         return await self._base_client.request(
             method="DELETE",
-            path=f"/store/order/{order_id}",
+            path="/store/order/{orderId}",
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -195,12 +264,76 @@ class AsyncOrderClient:
         """
         return await self._base_client.request(
             method="GET",
-            path=f"/store/order/{order_id}",
+            path="/store/order/{orderId}",
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Order, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
 
+    async def get_many(
+        self,
+        *,
+        order_ids: typing.Iterable[int],
+        concurrency: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[BatchResult[int, typing.Union[models.Order, BinaryResponse]]]:
+        """
+        Find purchase orders by ID.
+
+        Awaits `get` for every item with at most `concurrency` requests in flight.
+        A failure for one item does not affect the others.
+
+        Args:
+            order_ids: Items to fetch
+            concurrency: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            One BatchResult per item, in the same order, holding either the
+            fetched value or the exception raised for it
+
+        Examples:
+        ```py
+        await client.store.order.get_many(order_ids=[1, 2, 3])
+        ```
+        """
+        return await BatchGet[int, typing.Union[models.Order, BinaryResponse]](
+            self.get, key_param="order_id", request_options=request_options
+        ).gather(order_ids, concurrency=concurrency)
+
+    def get_many_as_completed(
+        self,
+        *,
+        order_ids: typing.Iterable[int],
+        concurrency: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[BatchResult[int, typing.Union[models.Order, BinaryResponse]]]:
+        """
+        Find purchase orders by ID.
+
+        Streaming variant of `get_many` yielding each BatchResult as soon as its
+        request completes. Closing the iterator early cancels the requests still
+        in flight.
+
+        Args:
+            order_ids: Items to fetch
+            concurrency: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Async iterator of BatchResults in completion order
+
+        Examples:
+        ```py
+        async for res in client.store.order.get_many_as_completed(order_ids=[1, 2, 3]):
+            ...
+        ```
+        """
+        return BatchGet[int, typing.Union[models.Order, BinaryResponse]](
+            self.get, key_param="order_id", request_options=request_options
+        ).aas_completed(order_ids, concurrency=concurrency)
+
     async def create(
         self,
         *,
@@ -3,12 +3,18 @@ import typing
 
 from local_api_16_py.core import (
     AsyncBaseClient,
+    BatchGet,
+    BatchResult,
     BinaryResponse,
+    ChunkCheckpoint,
+    ChunkInfo,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
     encode_query_param,
+    map_chunks_bounded,
+    map_chunks_threaded,
     to_encodable,
     type_utils,
 )
@@ -47,7 +53,8 @@ class UserClient:
         """
         return self._base_client.request(
             method="DELETE",
-            path=f"/user/{username}",
+            path="/user/{username}",
+            path_params={"username": username},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -175,12 +182,77 @@ class UserClient:
         """
         return self._base_client.request(
             method="GET",
-            path=f"/user/{username}",
+            path="/user/{username}",
+            path_params={"username": username},
             auth_names=["api_key"],
             cast_to=typing.Union[models.User, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
 
+    def get_many(
+        self,
+        *,
+        usernames: typing.Iterable[str],
+        max_workers: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[BatchResult[str, typing.Union[models.User, BinaryResponse]]]:
+        """
+        Get users by user name.
+
+        Calls `get` for every item concurrently on a pool of at most `max_workers`
+        threads sharing this client's connection pool. A failure for one item does
+        not affect the others.
+
+        Args:
+            usernames: Items to fetch
+            max_workers: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            One BatchResult per item, in the same order, holding either the
+            fetched value or the exception raised for it
+
+        Examples:
+        ```py
+        client.user.get_many(usernames=["user1", "user2"])
+        ```
+        """
+        return BatchGet[str, typing.Union[models.User, BinaryResponse]](
+            self.get, key_param="username", request_options=request_options
+        ).map(usernames, max_workers=max_workers)
+
+    def get_many_as_completed(
+        self,
+        *,
+        usernames: typing.Iterable[str],
+        max_workers: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[BatchResult[str, typing.Union[models.User, BinaryResponse]]]:
+        """
+        Get users by user name.
+
+        Streaming variant of `get_many` yielding each BatchResult as soon as its
+        request completes. Closing the iterator early cancels the requests which
+        have not started yet.
+
+        Args:
+            usernames: Items to fetch
+            max_workers: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Iterator of BatchResults in completion order
+
+        Examples:
+        ```py
+        for res in client.user.get_many_as_completed(usernames=["user1", "user2"]):
+            ...
+        ```
+        """
+        return BatchGet[str, typing.Union[models.User, BinaryResponse]](
+            self.get, key_param="username", request_options=request_options
+        ).as_completed(usernames, max_workers=max_workers)
+
     def create(
         self,
         *,
@@ -269,6 +341,67 @@ class UserClient:
             request_options=request_options or default_request_options(),
         )
 
+    def create_with_list_chunked(
+        self,
+        *,
+        data: typing.Iterable[params.User],
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+        checkpoint: typing.Optional[ChunkCheckpoint] = None,
+        on_checkpoint: typing.Optional[typing.Callable[[ChunkCheckpoint], None]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[
+        BatchResult[ChunkInfo, typing.Union[models.User, BinaryResponse]]
+    ]:
+        """
+        Creates list of users with given input array, in chunks.
+
+        Splits `data` into chunks of `chunk_size` users, each validated, serialised
+        and sent with `create_with_list` on a pool of at most `max_workers` threads,
+        so later chunks are encoded while earlier ones are in flight. `data` is
+        consumed lazily. A failure for one chunk does not affect the others.
+
+        POST /user/createWithList
+
+        Args:
+            data: Users to create
+            chunk_size: Number of users per request
+            max_workers: Maximum number of chunks processed concurrently
+            checkpoint: Progress of an earlier import of the same `data`, whose
+                completed chunks are skipped
+            on_checkpoint: Called with the updated progress after every chunk
+                which succeeded, e.g. to persist it
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Iterator of one BatchResult per chunk in completion order
+
+        Examples:
+        ```py
+        for res in client.user.create_with_list_chunked(data=users, chunk_size=500):
+            ...
+        ```
+        """
+        return map_chunks_threaded(
+            data,
+            lambda chunk: self._base_client.encode_json(
+                to_encodable(item=chunk, dump_with=typing.List[params._SerializerUser])
+            ),
+            lambda content: self._base_client.request(
+                method="POST",
+                path="/user/createWithList",
+                auth_names=["api_key"],
+                content=content,
+                content_type="application/json",
+                cast_to=typing.Union[models.User, BinaryResponse],
+                request_options=request_options or default_request_options(),
+            ),
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+            on_checkpoint=on_checkpoint,
+        )
+
     def update(
         self,
         *,
@@ -307,7 +440,8 @@ class UserClient:
         )
         return self._base_client.request(
             method="PUT",
-            path=f"/user/{username}",
+            path="/user/{username}",
+            path_params={"username": username},
             auth_names=["api_key"],
             json=_json,
             cast_to=httpx.Response,
@@ -347,7 +481,8 @@ class AsyncUserClient:
         """
         return await self._base_client.request(
             method="DELETE",
-            path=f"/user/{username}",
+            path="/user/{username}",
+            path_params={"username": username},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -475,12 +610,76 @@ class AsyncUserClient:
         """
         return await self._base_client.request(
             method="GET",
-            path=f"/user/{username}",
+            path="/user/{username}",
+            path_params={"username": username},
             auth_names=["api_key"],
             cast_to=typing.Union[models.User, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
 
+    async def get_many(
+        self,
+        *,
+        usernames: typing.Iterable[str],
+        concurrency: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[BatchResult[str, typing.Union[models.User, BinaryResponse]]]:
+        """
+        Get users by user name.
+
+        Awaits `get` for every item with at most `concurrency` requests in flight.
+        A failure for one item does not affect the others.
+
+        Args:
+            usernames: Items to fetch
+            concurrency: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            One BatchResult per item, in the same order, holding either the
+            fetched value or the exception raised for it
+
+        Examples:
+        ```py
+        await client.user.get_many(usernames=["user1", "user2"])
+        ```
+        """
+        return await BatchGet[str, typing.Union[models.User, BinaryResponse]](
+            self.get, key_param="username", request_options=request_options
+        ).gather(usernames, concurrency=concurrency)
+
+    def get_many_as_completed(
+        self,
+        *,
+        usernames: typing.Iterable[str],
+        concurrency: int = 10,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[BatchResult[str, typing.Union[models.User, BinaryResponse]]]:
+        """
+        Get users by user name.
+
+        Streaming variant of `get_many` yielding each BatchResult as soon as its
+        request completes. Closing the iterator early cancels the requests still
+        in flight.
+
+        Args:
+            usernames: Items to fetch
+            concurrency: Maximum number of requests in flight
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Async iterator of BatchResults in completion order
+
+        Examples:
+        ```py
+        async for res in client.user.get_many_as_completed(usernames=["user1", "user2"]):
+            ...
+        ```
+        """
+        return BatchGet[str, typing.Union[models.User, BinaryResponse]](
+            self.get, key_param="username", request_options=request_options
+        ).aas_completed(usernames, concurrency=concurrency)
+
     async def create(
         self,
         *,
@@ -569,6 +768,69 @@ class AsyncUserClient:
             request_options=request_options or default_request_options(),
         )
 
+    def create_with_list_chunked(
+        self,
+        *,
+        data: typing.Union[
+            typing.Iterable[params.User], typing.AsyncIterable[params.User]
+        ],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        checkpoint: typing.Optional[ChunkCheckpoint] = None,
+        on_checkpoint: typing.Optional[typing.Callable[[ChunkCheckpoint], None]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[
+        BatchResult[ChunkInfo, typing.Union[models.User, BinaryResponse]]
+    ]:
+        """
+        Creates list of users with given input array, in chunks.
+
+        Splits `data` into chunks of `chunk_size` users sent with at most
+        `concurrency` requests in flight. Chunks are validated and serialised in
+        the default executor while earlier ones are in flight. `data` is consumed
+        lazily. A failure for one chunk does not affect the others.
+
+        POST /user/createWithList
+
+        Args:
+            data: Users to create, an iterable or async iterable
+            chunk_size: Number of users per request
+            concurrency: Maximum number of chunks in flight
+            checkpoint: Progress of an earlier import of the same `data`, whose
+                completed chunks are skipped
+            on_checkpoint: Called with the updated progress after every chunk
+                which succeeded, e.g. to persist it
+            request_options: Additional options to customize each HTTP request
+
+        Returns:
+            Async iterator of one BatchResult per chunk in completion order
+
+        Examples:
+        ```py
+        async for res in client.user.create_with_list_chunked(data=users):
+            ...
+        ```
+        """
+        return map_chunks_bounded(
+            data,
+            lambda chunk: self._base_client.encode_json(
+                to_encodable(item=chunk, dump_with=typing.List[params._SerializerUser])
+            ),
+            lambda content: self._base_client.request(
+                method="POST",
+                path="/user/createWithList",
+                auth_names=["api_key"],
+                content=content,
+                content_type="application/json",
+                cast_to=typing.Union[models.User, BinaryResponse],
+                request_options=request_options or default_request_options(),
+            ),
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            on_checkpoint=on_checkpoint,
+        )
+
     async def update(
         self,
         *,
@@ -607,7 +869,8 @@ class AsyncUserClient:
         )
         return await self._base_client.request(
             method="PUT",
-            path=f"/user/{username}",
+            path="/user/{username}",
+            path_params={"username": username},
             auth_names=["api_key"],
             json=_json,
             cast_to=httpx.Response,
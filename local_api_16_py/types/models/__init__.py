@@ -1,10 +1,41 @@
-from .api_response import ApiResponse
-from .category import Category
-from .order import Order
-from .pet import Pet
-from .store_inventory_list_response import StoreInventoryListResponse
-from .tag import Tag
-from .user import User
+"""
+Response models, each imported from its module on first access.
+"""
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .api_response import ApiResponse
+    from .category import Category
+    from .order import Order
+    from .pet import Pet
+    from .store_inventory_list_response import StoreInventoryListResponse
+    from .tag import Tag
+    from .user import User
+
+_MODULES = {
+    "ApiResponse": "api_response",
+    "Category": "category",
+    "Order": "order",
+    "Pet": "pet",
+    "StoreInventoryListResponse": "store_inventory_list_response",
+    "Tag": "tag",
+    "User": "user",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *__all__})
 
 
 __all__ = [
@@ -10,6 +10,7 @@ class ApiResponse(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     code: typing.Optional[int] = pydantic.Field(alias="code", default=None)
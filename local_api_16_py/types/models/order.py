@@ -11,6 +11,7 @@ class Order(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     complete: typing.Optional[bool] = pydantic.Field(alias="complete", default=None)
@@ -14,6 +14,7 @@ class Pet(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     category: typing.Optional[Category] = pydantic.Field(alias="category", default=None)
@@ -10,6 +10,7 @@ class Tag(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     id: typing.Optional[int] = pydantic.Field(alias="id", default=None)
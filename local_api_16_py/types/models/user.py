@@ -10,6 +10,7 @@ class User(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     email: typing.Optional[str] = pydantic.Field(alias="email", default=None)
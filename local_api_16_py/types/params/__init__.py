@@ -1,8 +1,43 @@
-from .category import Category, _SerializerCategory
-from .order import Order, _SerializerOrder
-from .pet import Pet, _SerializerPet
-from .tag import Tag, _SerializerTag
-from .user import User, _SerializerUser
+"""
+Request parameters and their serializers, each imported from its module on
+first access.
+"""
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .category import Category, _SerializerCategory
+    from .order import Order, _SerializerOrder
+    from .pet import Pet, _SerializerPet
+    from .tag import Tag, _SerializerTag
+    from .user import User, _SerializerUser
+
+_MODULES = {
+    "Category": "category",
+    "Order": "order",
+    "Pet": "pet",
+    "Tag": "tag",
+    "User": "user",
+    "_SerializerCategory": "category",
+    "_SerializerOrder": "order",
+    "_SerializerPet": "pet",
+    "_SerializerTag": "tag",
+    "_SerializerUser": "user",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *__all__})
 
 
 __all__ = [
@@ -21,6 +21,7 @@ class _SerializerCategory(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     id: typing.Optional[int] = pydantic.Field(alias="id", default=None)
@@ -34,6 +34,7 @@ class _SerializerOrder(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     complete: typing.Optional[bool] = pydantic.Field(alias="complete", default=None)
@@ -37,6 +37,7 @@ class _SerializerPet(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     category: typing.Optional[_SerializerCategory] = pydantic.Field(
@@ -36,6 +36,7 @@ class _SerializerUser(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     email: typing.Optional[str] = pydantic.Field(alias="email", default=None)
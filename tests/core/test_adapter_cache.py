@@ -0,0 +1,49 @@
+import typing
+
+import pytest
+import typing_extensions
+
+from local_api_16_py.core import AdapterCache
+
+
+def test_get_builds_once_per_type():
+    cache = AdapterCache()
+
+    adapter = cache.get(typing.List[int])
+    assert cache.get(typing.List[int]) is adapter
+    assert adapter.validate_python(["1", 2]) == [1, 2]
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": None}
+
+
+def test_get_evicts_least_recently_used():
+    cache = AdapterCache(maxsize=2)
+
+    int_adapter = cache.get(int)
+    str_adapter = cache.get(str)
+    cache.get(int)  # int becomes the most recently used
+    cache.get(float)  # evicts str
+
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+    assert cache.get(int) is int_adapter
+    assert cache.get(str) is not str_adapter
+
+
+def test_get_unhashable_type_is_not_cached():
+    cache = AdapterCache()
+    unhashable = typing_extensions.Annotated[int, []]
+
+    with pytest.raises(TypeError):
+        hash(unhashable)
+    assert cache.get(unhashable).validate_python("3") == 3
+    assert cache.get(unhashable).validate_python("4") == 4
+    assert cache.stats() == {"hits": 0, "misses": 2, "size": 0, "maxsize": None}
+
+
+def test_clear_resets_counters():
+    cache = AdapterCache(maxsize=4)
+    cache.get(int)
+    cache.get(int)
+
+    cache.clear()
+
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 4}
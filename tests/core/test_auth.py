@@ -0,0 +1,145 @@
+import asyncio
+import datetime
+import logging
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py.core import AuthBearer, OAuth2
+
+
+def make_provider() -> OAuth2:
+    return OAuth2(
+        base_url="https://api.example.com",
+        default_token_url="/oauth/token",
+        access_token_pointer="/access_token",
+        expires_in_pointer="/expires_in",
+        credentials_location="request_body",
+        body_content="form",
+        request_mutator=AuthBearer(),
+        form={"client_id": "id", "client_secret": "secret"},
+    )
+
+
+class TokenServer:
+    """Issues numbered tokens, optionally failing every request"""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+        self._lock = threading.Lock()
+
+    def _issue(self) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        if self.fail:
+            return httpx.Response(500)
+        return httpx.Response(
+            200, json={"access_token": f"token-{calls}", "expires_in": 3600}
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        return self._issue()
+
+    async def ahandler(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self._issue()
+
+
+def test_concurrent_prepare_fetches_a_single_token():
+    server = TokenServer()
+    provider = make_provider()
+    client = httpx.Client(transport=httpx.MockTransport(server.handler))
+    start = threading.Barrier(8)
+
+    def prepare() -> None:
+        start.wait()
+        provider.prepare(client)
+
+    threads = [threading.Thread(target=prepare) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert server.calls == 1
+    assert provider.access_token == "token-1"
+    cfg = provider.add_to_request({"method": "get", "url": "/pet", "headers": {}})
+    assert cfg["headers"]["Authorization"] == "Bearer token-1"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_aprepare_fetches_a_single_token():
+    server = TokenServer()
+    provider = make_provider()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.ahandler))
+
+    await asyncio.gather(*(provider.aprepare(client) for _ in range(8)))
+
+    assert server.calls == 1
+    assert provider.access_token == "token-1"
+
+
+def test_aprepare_works_across_event_loops():
+    server = TokenServer()
+    provider = make_provider()
+
+    async def prepare_concurrently() -> None:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(server.ahandler))
+        await asyncio.gather(*(provider.aprepare(client) for _ in range(4)))
+
+    asyncio.run(prepare_concurrently())
+    provider.access_token = None
+    asyncio.run(prepare_concurrently())
+
+    assert server.calls == 2
+    assert provider.access_token == "token-2"
+
+
+def expire_soon(provider: OAuth2) -> None:
+    provider.access_token = "stale"
+    provider.expires_at = datetime.datetime.now() + datetime.timedelta(seconds=5)
+
+
+def test_failed_background_refresh_is_logged(caplog: pytest.LogCaptureFixture):
+    server = TokenServer(delay=0)
+    server.fail = True
+    provider = make_provider()
+    client = httpx.Client(transport=httpx.MockTransport(server.handler))
+    expire_soon(provider)
+
+    with caplog.at_level(logging.WARNING, logger="local_api_16_py.core.auth"):
+        provider.prepare(client)
+        # the refresh runs on a background thread holding the lock
+        with provider._lock:
+            pass
+
+    assert server.calls == 1
+    assert provider.access_token == "stale"
+    assert "token refresh failed" in caplog.text
+    assert caplog.records[0].exc_info is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_async_background_refresh_is_logged(
+    caplog: pytest.LogCaptureFixture,
+):
+    server = TokenServer(delay=0)
+    server.fail = True
+    provider = make_provider()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.ahandler))
+    expire_soon(provider)
+
+    with caplog.at_level(logging.WARNING, logger="local_api_16_py.core.auth"):
+        await provider.aprepare(client)
+        await typing.cast("asyncio.Future[None]", provider._background_task)
+
+    assert server.calls == 1
+    assert provider.access_token == "stale"
+    assert "token refresh failed" in caplog.text
@@ -0,0 +1,233 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient, Client, NotFoundError
+from local_api_16_py.core import (
+    as_completed_bounded,
+    as_completed_threaded,
+    gather_bounded,
+    map_threaded,
+)
+
+
+class InFlight:
+    """Counts the calls in flight and the most ever seen at once"""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc: typing.Any) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+def fail_on_odd(key: int) -> int:
+    if key % 2:
+        raise ValueError(key)
+    return key * 10
+
+
+def test_map_threaded_isolates_errors_in_input_order():
+    results = map_threaded(range(6), fail_on_odd, max_workers=3)
+
+    assert [result.key for result in results] == list(range(6))
+    assert [result.value for result in results if result.ok] == [0, 20, 40]
+    assert [str(result.error) for result in results if not result.ok] == [
+        "1",
+        "3",
+        "5",
+    ]
+    with pytest.raises(ValueError):
+        results[1].unwrap()
+
+
+def test_threaded_concurrency_is_bounded():
+    in_flight = InFlight()
+
+    def call(key: int) -> int:
+        with in_flight:
+            time.sleep(0.01)
+        return key
+
+    map_threaded(range(20), call, max_workers=3)
+    assert in_flight.peak <= 3
+    list(as_completed_threaded(range(20), call, max_workers=3))
+    assert in_flight.peak <= 3
+
+
+def test_as_completed_threaded_yields_in_completion_order():
+    def call(key: int) -> int:
+        time.sleep(key * 0.05)
+        return key
+
+    results = as_completed_threaded([3, 0, 2, 1], call, max_workers=4)
+
+    assert [result.key for result in results] == [0, 1, 2, 3]
+
+
+def test_as_completed_threaded_consumes_keys_lazily():
+    consumed: typing.List[int] = []
+
+    def keys() -> typing.Iterator[int]:
+        for key in range(1_000):
+            consumed.append(key)
+            yield key
+
+    results = as_completed_threaded(keys(), lambda key: key, max_workers=2)
+    next(results)
+    results.close()
+
+    # at most two keys per worker are queued ahead of the results
+    assert len(consumed) <= 5
+
+
+def test_as_completed_threaded_close_cancels_pending_calls():
+    started: typing.List[int] = []
+
+    def call(key: int) -> int:
+        started.append(key)
+        time.sleep(0.05)
+        return key
+
+    results = as_completed_threaded(range(10), call, max_workers=1)
+    next(results)
+    results.close()
+
+    assert len(started) <= 2
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_isolates_errors_and_bounds_concurrency():
+    in_flight = InFlight()
+
+    async def call(key: int) -> int:
+        with in_flight:
+            await asyncio.sleep(0.001 * (10 - key))
+        return fail_on_odd(key)
+
+    results = await gather_bounded(range(10), call, concurrency=3)
+
+    assert [result.key for result in results] == list(range(10))
+    assert [result.ok for result in results] == [True, False] * 5
+    assert in_flight.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_as_completed_bounded_yields_in_completion_order():
+    in_flight = InFlight()
+
+    async def call(key: int) -> int:
+        with in_flight:
+            await asyncio.sleep(key * 0.02)
+        return key
+
+    results = [
+        result.key
+        async for result in as_completed_bounded([3, 0, 2, 1], call, concurrency=4)
+    ]
+
+    assert results == [0, 1, 2, 3]
+    assert in_flight.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_as_completed_bounded_close_cancels_calls_in_flight():
+    started: typing.List[int] = []
+    cancelled: typing.List[int] = []
+
+    async def call(key: int) -> int:
+        started.append(key)
+        try:
+            await asyncio.sleep(0 if key == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+        return key
+
+    results = as_completed_bounded(range(5), call, concurrency=3)
+    assert (await results.__anext__()).key == 0
+    await results.aclose()
+
+    assert len(started) <= 4
+    assert sorted(cancelled) == sorted(started[1:])
+
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        map_threaded([1], lambda key: key, max_workers=0)
+
+
+def missing_odd_ids(request: httpx.Request) -> httpx.Response:
+    key = request.url.path.rsplit("/", 1)[1]
+    if key[-1] in "13579":
+        return httpx.Response(404, json={"message": "not found"})
+    return httpx.Response(
+        200,
+        json={"id": 2, "name": "doggie", "photoUrls": [], "username": key},
+    )
+
+
+RESOURCES = [
+    ("pet", "pet_ids", [1, 2, 3, 4]),
+    ("store.order", "order_ids", [1, 2, 3, 4]),
+    ("user", "usernames", ["a1", "a2", "a3", "a4"]),
+]
+
+
+def resource(client: typing.Any, name: str) -> typing.Any:
+    for attr in name.split("."):
+        client = getattr(client, attr)
+    return client
+
+
+@pytest.mark.parametrize("name,keys_param,keys", RESOURCES)
+def test_get_many_isolates_errors(name, keys_param, keys):
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(missing_odd_ids)),
+    )
+
+    results = resource(client, name).get_many(**{keys_param: keys}, max_workers=2)
+    assert [result.key for result in results] == keys
+    assert [result.ok for result in results] == [False, True, False, True]
+    assert isinstance(results[0].error, NotFoundError)
+
+    streamed = resource(client, name).get_many_as_completed(**{keys_param: keys})
+    assert sorted(result.ok for result in streamed) == [False, False, True, True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name,keys_param,keys", RESOURCES)
+async def test_await_get_many_isolates_errors(name, keys_param, keys):
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(missing_odd_ids)
+        ),
+    )
+
+    results = await resource(client, name).get_many(
+        **{keys_param: keys}, concurrency=2
+    )
+    assert [result.key for result in results] == keys
+    assert [result.ok for result in results] == [False, True, False, True]
+
+    streamed = resource(client, name).get_many_as_completed(**{keys_param: keys})
+    assert sorted([result.ok async for result in streamed]) == [
+        False,
+        False,
+        True,
+        True,
+    ]
@@ -0,0 +1,170 @@
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import Client
+from local_api_16_py.core import CacheBackend, CacheEntry, MemoryCache
+from local_api_16_py.core.cache import ResponseCache
+from local_api_16_py.types import models
+
+
+class Upstream:
+    def __init__(self) -> None:
+        self.requests: typing.List[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith(("/user/login", "/user/logout")):
+            return httpx.Response(200, json="session")
+        pet = {"id": 1, "name": "doggie", "photoUrls": ["a"]}
+        if request.url.path.endswith("/findByStatus"):
+            return httpx.Response(200, json=[pet])
+        return httpx.Response(200, json=pet)
+
+
+def make_client(upstream: Upstream, api_key: str = "API_KEY", **kwargs) -> Client:
+    return Client(
+        api_key=api_key,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(upstream.handler)),
+        **kwargs,
+    )
+
+
+def test_hits_return_copies():
+    upstream = Upstream()
+    client = make_client(upstream, response_cache={"ttl": 60})
+
+    first = client.pet.get(pet_id=1)
+    first.photo_urls.append("b")
+    first.name = "changed"
+    second = client.pet.get(pet_id=1)
+    second.photo_urls.clear()
+    third = client.pet.get(pet_id=1)
+
+    assert isinstance(third, models.Pet)
+    assert third.name == "doggie"
+    assert third.photo_urls == ["a"]
+    assert len(upstream.requests) == 1
+
+
+def test_login_and_logout_are_not_cached():
+    upstream = Upstream()
+    client = make_client(upstream, response_cache={"ttl": 60})
+
+    for _ in range(2):
+        client.user.login(username="user", password="secret")
+        client.user.logout()
+
+    assert len(upstream.requests) == 4
+    assert client._base_client.cache_stats() == {
+        "hits": 0,
+        "revalidated": 0,
+        "misses": 0,
+        "hit_ratio": 0.0,
+    }
+
+
+def test_paths_select_cached_endpoints():
+    upstream = Upstream()
+    client = make_client(upstream, response_cache={"ttl": 60, "paths": []})
+
+    client.pet.get(pet_id=1)
+    client.pet.get(pet_id=1)
+
+    assert len(upstream.requests) == 2
+
+
+def test_responses_are_cached_per_api_key():
+    upstream = Upstream()
+    backend = MemoryCache()
+    config = {"ttl": 60, "backend": backend}
+    alice = make_client(upstream, api_key="alice", response_cache=config)
+    bob = make_client(upstream, api_key="bob", response_cache=config)
+
+    alice.pet.get(pet_id=1)
+    bob.pet.get(pet_id=1)
+    alice.pet.get(pet_id=1)
+
+    assert len(upstream.requests) == 2
+    assert len(backend) == 2
+    assert not any("alice" in key or "bob" in key for key in backend._entries)
+
+
+@pytest.mark.parametrize(
+    "cfg",
+    [
+        {"headers": {"Authorization": "Bearer secret"}},
+        {"headers": {"X-Api-Key": "secret"}},
+        {"params": {"key": "secret"}},
+        {"cookies": {"session": "secret"}},
+        {"auth": ("user", "secret")},
+    ],
+)
+def test_key_digests_credentials(cfg: typing.Dict[str, typing.Any]):
+    cache = ResponseCache({})
+    credentials = [("header", "X-Api-Key"), ("query", "key")]
+    base = {"method": "get", "url": "https://api.example.com/pet/1"}
+
+    key = cache.key({**base, **cfg}, credentials=credentials)
+    other = {
+        name: {k: "other" for k in value} if isinstance(value, dict) else ("u", "p")
+        for name, value in cfg.items()
+    }
+
+    assert key.startswith("GET https://api.example.com/pet/1 auth=")
+    assert "secret" not in key
+    assert key != cache.key({**base, **other}, credentials=credentials)
+    assert cache.key(base) == "GET https://api.example.com/pet/1"
+
+
+def test_query_credentials_are_removed_from_the_url():
+    cache = ResponseCache({})
+    cfg = {
+        "method": "get",
+        "url": "https://api.example.com/pet/findByStatus",
+        "params": {"status": "sold", "key": "secret"},
+    }
+
+    key = cache.key(cfg, credentials=[("query", "key")])
+
+    assert key.startswith("GET https://api.example.com/pet/findByStatus?status=sold ")
+    assert "secret" not in key
+
+
+class DictBackend(CacheBackend):
+    """A backend relying on the default `delete_prefix`"""
+
+    def __init__(self) -> None:
+        self.entries: typing.Dict[str, CacheEntry] = {}
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        return self.entries.get(key)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self.entries[key] = entry
+
+    def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+def test_default_delete_prefix_drops_stale_reads():
+    upstream = Upstream()
+    backend = DictBackend()
+    client = make_client(upstream, response_cache={"ttl": 60, "backend": backend})
+
+    client.pet.find_by_status(status="available")
+    client.pet.get(pet_id=1)
+    assert len(backend.entries) == 2
+    client.pet.update(id=1, name="doggie", photo_urls=[])
+    client.pet.find_by_status(status="available")
+
+    assert [request.method for request in upstream.requests] == [
+        "GET",
+        "GET",
+        "PUT",
+        "GET",
+    ]
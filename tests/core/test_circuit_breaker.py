@@ -0,0 +1,305 @@
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient, CircuitOpenError, Client, ServerError
+from local_api_16_py.core import CircuitBreakers, circuit_breaker
+
+OPERATION = "GET /pet/{petId}"
+PET = {"id": 1, "name": "doggie", "photoUrls": []}
+
+
+class Clock:
+    """Stands in for the `time` module of the circuit breaker"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def make_circuit(**config: typing.Any) -> circuit_breaker.CircuitBreaker:
+    defaults = {"window": 4, "min_calls": 4, "open_duration": 10, "half_open_calls": 2}
+    circuits = CircuitBreakers({**defaults, **config})  # type: ignore[typeddict-item]
+    return circuits.get(None, OPERATION)
+
+
+def call(
+    circuit: circuit_breaker.CircuitBreaker, status_code: int, latency: float = 0.0
+) -> None:
+    circuit.acquire()
+    circuit.record_response(httpx.Response(status_code), latency)
+
+
+def trip(circuit: circuit_breaker.CircuitBreaker) -> None:
+    for _ in range(4):
+        call(circuit, 503)
+    assert circuit.state == "open"
+
+
+def test_opens_once_the_failure_rate_is_reached(clock):
+    circuit = make_circuit()
+    for status_code in (200, 503, 200):
+        call(circuit, status_code)
+    assert circuit.state == "closed"
+
+    call(circuit, 503)
+
+    assert circuit.state == "open"
+    clock.now = 4.0
+    with pytest.raises(CircuitOpenError) as exc_info:
+        circuit.acquire()
+    assert exc_info.value.retry_after == 6.0
+    assert circuit.snapshot()["rejected"] == 1
+
+
+def test_transport_errors_count_as_failures(clock):
+    circuit = make_circuit()
+    for _ in range(4):
+        circuit.acquire()
+        circuit.record_exception(httpx.ConnectTimeout("timed out"), 0.0)
+    assert circuit.state == "open"
+
+    other = make_circuit()
+    for _ in range(4):
+        other.acquire()
+        other.record_exception(ValueError("invalid request"), 0.0)
+    assert other.state == "closed"
+
+
+def test_half_open_admits_a_limited_number_of_probes(clock):
+    circuit = make_circuit()
+    trip(circuit)
+
+    clock.now = 10.0
+    assert circuit.state == "half_open"
+    circuit.acquire()
+    circuit.acquire()
+    with pytest.raises(CircuitOpenError):
+        circuit.acquire()
+
+
+def test_recovers_once_every_probe_succeeded(clock):
+    circuit = make_circuit()
+    trip(circuit)
+
+    clock.now = 10.0
+    call(circuit, 200)
+    assert circuit.state == "half_open"
+    call(circuit, 200)
+
+    assert circuit.state == "closed"
+    # the window starts afresh, earlier failures no longer count
+    assert circuit.snapshot()["calls"] == 0
+    call(circuit, 503)
+    assert circuit.state == "closed"
+
+
+@pytest.mark.parametrize(
+    "status_code,latency", [(503, 0.0), (200, 5.0)], ids=["failure", "slow"]
+)
+def test_reopens_when_a_probe_fails(clock, status_code, latency):
+    circuit = make_circuit(slow_call_duration=1.0)
+    trip(circuit)
+
+    clock.now = 10.0
+    call(circuit, 200)
+    call(circuit, status_code, latency)
+
+    assert circuit.state == "open"
+    assert circuit.snapshot()["retry_after"] == 10.0
+
+
+def test_probes_which_never_report_back_are_replaced(clock):
+    circuit = make_circuit()
+    trip(circuit)
+
+    clock.now = 10.0
+    circuit.acquire()
+    circuit.acquire()
+    # e.g. cancelled calls, a new round of probes is admitted after a while
+    clock.now = 20.0
+    circuit.acquire()
+
+
+def test_opens_once_the_slow_call_rate_is_reached(clock):
+    circuit = make_circuit(slow_call_duration=1.0, slow_call_rate=0.5)
+    call(circuit, 200, 0.1)
+    call(circuit, 200, 2.0)
+    call(circuit, 200, 0.1)
+    assert circuit.state == "closed"
+
+    call(circuit, 200, 1.0)
+
+    assert circuit.state == "open"
+    assert circuit.snapshot()["slow_call_rate"] == 0.5
+
+
+def test_circuits_are_shared_per_service_by_default():
+    circuits = CircuitBreakers({})
+
+    assert circuits.get(None, OPERATION) is circuits.get(None, "GET /store/inventory")
+    assert circuits.get(None, OPERATION).name == "default"
+    assert circuits.get("billing", OPERATION).name == "billing"
+
+
+def test_per_operation_circuits():
+    circuits = CircuitBreakers({"per_operation": True})
+
+    assert circuits.get(None, OPERATION).name == OPERATION
+    assert circuits.get("billing", OPERATION).name == f"billing {OPERATION}"
+    assert circuits.get(None, OPERATION) is not circuits.get(
+        None, "GET /store/inventory"
+    )
+
+
+def test_operation_thresholds_apply_to_that_operation_only(clock):
+    circuits = CircuitBreakers(
+        {"min_calls": 100, "operations": {OPERATION: {"min_calls": 2, "window": 2}}}
+    )
+    pet = circuits.get(None, OPERATION)
+    shared = circuits.get(None, "GET /store/inventory")
+
+    for circuit in (pet, shared):
+        call(circuit, 503)
+        call(circuit, 503)
+
+    assert pet.name == OPERATION
+    assert pet.state == "open"
+    assert shared.name == "default"
+    assert shared.state == "closed"
+
+
+def failing_pets(request: httpx.Request) -> httpx.Response:
+    if "/pet/" in request.url.path:
+        return httpx.Response(503)
+    return httpx.Response(200, json={"available": 1})
+
+
+CONFIG = {"per_operation": True, "min_calls": 2, "window": 2, "open_duration": 10}
+
+
+def test_client_opens_the_failing_operation_only(clock):
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(failing_pets)),
+        retry_policy={"max_attempts": 1},
+        circuit_breaker=CONFIG,  # type: ignore[arg-type]
+    )
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            client.pet.get(pet_id=1)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.pet.get(pet_id=1)
+
+    assert exc_info.value.circuit == OPERATION
+    client.store.inventory.list()
+    states = client._base_client.circuit_breaker_states()
+    assert states is not None
+    assert states[OPERATION]["state"] == "open"
+    assert states["GET /store/inventory"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_async_client_recovers_after_open_duration(clock):
+    healthy = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if healthy:
+            return httpx.Response(200, json=PET)
+        return httpx.Response(503)
+
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy={"max_attempts": 1},
+        circuit_breaker={**CONFIG, "half_open_calls": 1},  # type: ignore[arg-type]
+    )
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            await client.pet.get(pet_id=1)
+    with pytest.raises(CircuitOpenError):
+        await client.pet.get(pet_id=1)
+
+    healthy = True
+    clock.now = 10.0
+    assert (await client.pet.get(pet_id=1)).name == "doggie"
+    states = client._base_client.circuit_breaker_states()
+    assert states is not None
+    assert states[OPERATION]["state"] == "closed"
+
+
+def cached_pet(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/pet/1") and request.method == "GET":
+        return httpx.Response(200, json=PET)
+    return httpx.Response(503)
+
+
+def test_rejected_mutations_do_not_invalidate_the_cache(clock):
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(cached_pet)),
+        retry_policy={"max_attempts": 1},
+        circuit_breaker={"min_calls": 2, "window": 2, "open_duration": 10},
+        response_cache={"ttl": 60},
+    )
+    client.pet.get(pet_id=1)
+    # half of the window failed, which opens the service's circuit
+    with pytest.raises(ServerError):
+        client.pet.find_by_status(status="available")
+
+    with pytest.raises(CircuitOpenError):
+        client.pet.delete(pet_id=1)
+
+    assert client.pet.get(pet_id=1).name == "doggie"
+    stats = client._base_client.cache_stats()
+    assert stats is not None
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_rejected_mutations_do_not_invalidate_the_cache(clock):
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(cached_pet)),
+        retry_policy={"max_attempts": 1},
+        circuit_breaker={"min_calls": 2, "window": 2, "open_duration": 10},
+        response_cache={"ttl": 60},
+    )
+    await client.pet.get(pet_id=1)
+    # half of the window failed, which opens the service's circuit
+    with pytest.raises(ServerError):
+        await client.pet.find_by_status(status="available")
+
+    with pytest.raises(CircuitOpenError):
+        await client.pet.delete(pet_id=1)
+
+    assert (await client.pet.get(pet_id=1)).name == "doggie"
+    stats = client._base_client.cache_stats()
+    assert stats is not None
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_streams_are_guarded_by_the_circuit(clock):
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(failing_pets)),
+        retry_policy={"max_attempts": 1},
+        circuit_breaker={"min_calls": 2, "window": 2, "open_duration": 10},
+    )
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            client.pet.find_by_status_iter(status="available")
+    with pytest.raises(CircuitOpenError):
+        client.pet.find_by_status_iter(status="available")
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import typing
+
+import pytest
+
+from local_api_16_py.core.coalesce import AsyncRequestCoalescer, RequestCoalescer
+
+
+def wait_for_callers(coalescer: typing.Any, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while sum(coalescer.stats().values()) < count:
+        assert time.monotonic() < deadline, "callers did not join in time"
+        time.sleep(0.001)
+
+
+def call_concurrently(
+    coalescer: RequestCoalescer, fn: typing.Callable[[], typing.Any], count: int
+) -> typing.Tuple[typing.List[typing.Any], typing.List[threading.Thread]]:
+    outcomes: typing.List[typing.Any] = [None] * count
+
+    def call(index: int) -> None:
+        try:
+            outcomes[index] = coalescer.do("key", fn)
+        except Exception as exc:
+            outcomes[index] = exc
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return outcomes, threads
+
+
+def test_concurrent_calls_share_one_call():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls = []
+
+    def fn() -> typing.Dict[str, int]:
+        calls.append(1)
+        release.wait(5)
+        return {"id": 1}
+
+    outcomes, threads = call_concurrently(coalescer, fn, 5)
+    wait_for_callers(coalescer, 5)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert outcomes == [{"id": 1}] * 5
+    assert coalescer.stats() == {"executed": 1, "coalesced": 4}
+
+
+def test_concurrent_calls_share_the_error():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+
+    def fn() -> None:
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    outcomes, threads = call_concurrently(coalescer, fn, 3)
+    wait_for_callers(coalescer, 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert coalescer.stats() == {"executed": 1, "coalesced": 2}
+
+
+def test_sequential_calls_are_not_coalesced():
+    coalescer = RequestCoalescer()
+
+    assert [coalescer.do("key", lambda: i) for i in range(3)] == [0, 1, 2]
+    assert coalescer.stats() == {"executed": 3, "coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_leader_does_not_cancel_the_call():
+    coalescer = AsyncRequestCoalescer()
+    release = asyncio.Event()
+
+    async def fn() -> int:
+        await release.wait()
+        return 1
+
+    leader = asyncio.ensure_future(coalescer.do("key", fn))
+    follower = asyncio.ensure_future(coalescer.do("key", fn))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == 1
+    assert leader.cancelled()
+    assert coalescer.stats() == {"executed": 1, "coalesced": 1}
@@ -0,0 +1,130 @@
+import asyncio
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient
+from local_api_16_py.core import Hedger
+
+OPERATION = "GET /pet/{petId}"
+PET = {"id": 1, "name": "doggie", "photoUrls": []}
+POLICY = {"initial_delay": 0.01, "min_delay": 0.01}
+
+
+def server_error(response: httpx.Response) -> bool:
+    return response.status_code >= 500
+
+
+def scripted(
+    *outcomes: typing.Tuple[float, typing.Union[int, Exception]],
+) -> typing.Callable[[], typing.Awaitable[httpx.Response]]:
+    """Each call answers with the next (delay, status or exception) outcome"""
+    remaining = list(outcomes)
+
+    async def send() -> httpx.Response:
+        delay, outcome = remaining.pop(0)
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+    return send
+
+
+@pytest.mark.asyncio
+async def test_first_response_wins():
+    hedger = Hedger(POLICY)
+
+    response = await hedger.run(
+        OPERATION, scripted((0.2, 200), (0.0, 204)), retryable=server_error
+    )
+
+    assert response.status_code == 204
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retryable_response_waits_for_the_other_request():
+    hedger = Hedger(POLICY)
+
+    # the primary fails first while the hedge is still running
+    response = await hedger.run(
+        OPERATION, scripted((0.05, 503), (0.1, 200)), retryable=server_error
+    )
+
+    assert response.status_code == 200
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retryable_response_is_used_once_every_request_failed():
+    hedger = Hedger(POLICY)
+
+    response = await hedger.run(
+        OPERATION,
+        scripted((0.05, 503), (0.0, httpx.ConnectError("refused"))),
+        retryable=server_error,
+    )
+
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_first_error_is_raised_once_every_request_raised():
+    hedger = Hedger(POLICY)
+
+    with pytest.raises(httpx.ConnectError):
+        await hedger.run(
+            OPERATION,
+            scripted(
+                (0.05, httpx.ReadTimeout("slow")), (0.0, httpx.ConnectError("refused"))
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_sent_through_its_own_callable():
+    hedger = Hedger(POLICY)
+    hedges: typing.List[int] = []
+
+    async def hedge() -> httpx.Response:
+        hedges.append(1)
+        return httpx.Response(200)
+
+    await hedger.run(OPERATION, scripted((0.2, 200)), hedge=hedge)
+
+    assert hedges == [1]
+
+
+@pytest.mark.asyncio
+async def test_hedges_are_rate_limited_and_recorded_by_the_circuit():
+    calls: typing.List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(0.2)
+            return httpx.Response(503)
+        return httpx.Response(200, json=PET)
+
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedging=POLICY,  # type: ignore[arg-type]
+        rate_limit={"rate": 1000, "burst": 10},
+        circuit_breaker={"min_calls": 100},
+    )
+
+    pet = await client.pet.get(pet_id=1)
+
+    assert pet.name == "doggie"
+    assert len(calls) == 2
+    rate_limit_stats = client._base_client.rate_limit_stats()
+    assert rate_limit_stats is not None
+    assert rate_limit_stats["requests"] == 2
+    states = client._base_client.circuit_breaker_states()
+    assert states is not None
+    # the hedge answered, the cancelled primary was never recorded
+    assert states["default"]["calls"] == 1
+    assert states["default"]["failure_rate"] == 0.0
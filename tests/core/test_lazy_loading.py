@@ -0,0 +1,122 @@
+import importlib
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+
+import pydantic
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Runs a fresh interpreter, so no module is served from the module cache"""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(ROOT), "PYTHONDONTWRITEBYTECODE": "1"},
+        timeout=120,
+    )
+
+
+def run_script(script: str) -> None:
+    result = run_python("-c", textwrap.dedent(script))
+    assert result.returncode == 0, result.stderr
+
+
+def test_bench_import_check_passes():
+    result = run_python("benchmarks/bench_import.py", "--runs", "1", "--check")
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize(
+    "package", ["local_api_16_py.types.models", "local_api_16_py.types.params"]
+)
+def test_exports_are_imported_on_first_access(package):
+    run_script(
+        f"""
+        import sys
+        import {package} as types
+
+        assert "{package}.pet" not in sys.modules
+        types.Pet
+        assert "{package}.pet" in sys.modules
+        assert "{package}.user" not in sys.modules
+        """
+    )
+
+
+def test_package_import_defers_the_client():
+    run_script(
+        """
+        import sys
+        import local_api_16_py
+
+        assert "local_api_16_py.client" not in sys.modules
+        assert "httpx" not in sys.modules
+        local_api_16_py.Client
+        assert "local_api_16_py.client" in sys.modules
+        assert "local_api_16_py.resources.pet" not in sys.modules
+        """
+    )
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["local_api_16_py", "local_api_16_py.types.models", "local_api_16_py.types.params"],
+)
+def test_every_export_resolves(package):
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+    with pytest.raises(AttributeError):
+        getattr(module, "Missing")
+
+
+def test_deferred_models_validate_on_first_use():
+    run_script(
+        """
+        from local_api_16_py.types import models
+
+        assert not models.Pet.__pydantic_complete__
+        pet = models.Pet.model_validate(
+            {
+                "name": "doggie",
+                "photoUrls": ["a"],
+                "category": {"id": 1, "name": "dogs"},
+                "tags": [{"id": 2}],
+                "status": "sold",
+            }
+        )
+        assert models.Pet.__pydantic_complete__
+        assert pet.photo_urls == ["a"]
+        assert pet.category is not None and pet.category.name == "dogs"
+        assert pet.tags is not None and pet.tags[0].id == 2
+        """
+    )
+
+
+def test_deferred_models_still_reject_invalid_data():
+    from local_api_16_py.types import models, params
+
+    with pytest.raises(pydantic.ValidationError):
+        models.Pet.model_validate({"name": "doggie", "status": "lost"})
+    with pytest.raises(pydantic.ValidationError):
+        params._SerializerPet.model_validate({"name": "doggie"})
+
+
+def test_deferred_serializers_dump_by_alias():
+    from local_api_16_py.types import params
+
+    serialized = params._SerializerPet.model_validate(
+        {"name": "doggie", "photo_urls": ["a"], "tags": [{"id": 2}]}
+    ).model_dump(by_alias=True, exclude_unset=True)
+
+    assert serialized == {"name": "doggie", "photoUrls": ["a"], "tags": [{"id": 2}]}
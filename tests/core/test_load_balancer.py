@@ -0,0 +1,227 @@
+import asyncio
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient
+from local_api_16_py.core import LoadBalancer, load_balancer
+from local_api_16_py.environment import Environment, _get_base_url
+
+PET = {"id": 1, "name": "doggie", "photoUrls": []}
+URLS = ["https://replica-a/api/v3", "https://replica-b/api/v3"]
+
+
+class Clock:
+    """Stands in for the `time` module of the load balancer"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(load_balancer, "time", fake)
+    return fake
+
+
+class Upstream:
+    """Answers with a fixed status per replica and records the replicas called"""
+
+    def __init__(self, clock: typing.Optional[Clock] = None, **statuses: int):
+        self.clock = clock
+        self.statuses = statuses
+        self.latencies: typing.Dict[str, float] = {}
+        self.hosts: typing.List[str] = []
+
+    def __call__(self, cfg: typing.Any) -> httpx.Response:
+        host = httpx.URL(cfg["url"]).host
+        self.hosts.append(host)
+        if self.clock is not None:
+            self.clock.now += self.latencies.get(host, 0.0)
+        return httpx.Response(self.statuses.get(host, 200))
+
+
+def get(balancer: LoadBalancer, send: typing.Callable[..., httpx.Response]) -> int:
+    cfg = {"method": "get", "url": URLS[0] + "/pet/1"}
+    return balancer.call(cfg, send).status_code  # type: ignore[arg-type]
+
+
+def test_requests_are_rebased_onto_the_selected_endpoint():
+    balancer = LoadBalancer(URLS, {})
+    urls: typing.List[str] = []
+
+    def send(cfg: typing.Any) -> httpx.Response:
+        urls.append(cfg["url"])
+        return httpx.Response(200)
+
+    for _ in range(3):
+        get(balancer, send)
+
+    assert urls == [
+        "https://replica-a/api/v3/pet/1",
+        "https://replica-b/api/v3/pet/1",
+        "https://replica-a/api/v3/pet/1",
+    ]
+
+
+def test_least_outstanding_avoids_busy_endpoints():
+    balancer = LoadBalancer(URLS, {"strategy": "least_outstanding"})
+    upstream = Upstream()
+
+    def slow(cfg: typing.Any) -> httpx.Response:
+        # the other requests are sent while this one is in flight
+        for _ in range(3):
+            get(balancer, upstream)
+        return upstream(cfg)
+
+    get(balancer, slow)
+
+    assert upstream.hosts == ["replica-b", "replica-b", "replica-b", "replica-a"]
+    assert [endpoint["outstanding"] for endpoint in balancer.stats()] == [0, 0]
+
+
+def test_ewma_prefers_the_fastest_endpoint(clock):
+    balancer = LoadBalancer(URLS, {"strategy": "ewma"})
+    upstream = Upstream(clock)
+    upstream.latencies = {"replica-a": 1.0, "replica-b": 0.1}
+
+    for _ in range(6):
+        get(balancer, upstream)
+
+    # each endpoint is tried once before the latencies tell them apart
+    assert upstream.hosts == ["replica-a"] + ["replica-b"] * 5
+    replica_a, replica_b = balancer.stats()
+    assert replica_a["latency"] == 1.0
+    assert replica_b["latency"] == pytest.approx(0.1)
+
+
+def test_ewma_weights_latency_by_outstanding_requests(clock):
+    balancer = LoadBalancer(URLS, {"strategy": "ewma"})
+    upstream = Upstream(clock)
+    upstream.latencies = {"replica-a": 0.3, "replica-b": 0.12}
+    get(balancer, upstream)
+    get(balancer, upstream)
+
+    def slow(cfg: typing.Any) -> httpx.Response:
+        # with 2 requests in flight replica-b scores 0.12 * 3 > 0.3
+        get(balancer, nested)
+        return upstream(cfg)
+
+    def nested(cfg: typing.Any) -> httpx.Response:
+        get(balancer, upstream)
+        return upstream(cfg)
+
+    get(balancer, slow)
+
+    assert upstream.hosts[2:] == ["replica-a", "replica-b", "replica-b"]
+
+
+def test_failing_endpoints_are_ejected_and_readmitted(clock):
+    balancer = LoadBalancer(URLS, {"failure_threshold": 2, "ejection_duration": 10.0})
+    upstream = Upstream(clock, **{"replica-a": 503})
+
+    for _ in range(4):
+        get(balancer, upstream)
+    assert upstream.hosts == ["replica-a", "replica-b", "replica-a", "replica-b"]
+    replica_a, _ = balancer.stats()
+    assert not replica_a["healthy"]
+    assert replica_a["failures"] == 2 and replica_a["ejections"] == 1
+
+    upstream.hosts.clear()
+    for _ in range(4):
+        get(balancer, upstream)
+    assert upstream.hosts == ["replica-b"] * 4
+
+    clock.now = 10.0
+    assert balancer.stats()[0]["healthy"]
+    upstream.hosts.clear()
+    upstream.statuses = {}
+    for _ in range(2):
+        get(balancer, upstream)
+    assert sorted(upstream.hosts) == ["replica-a", "replica-b"]
+
+
+def test_repeated_ejections_last_longer(clock):
+    balancer = LoadBalancer(
+        URLS[:1], {"failure_threshold": 1, "ejection_duration": 10.0}
+    )
+    upstream = Upstream(clock, **{"replica-a": 503})
+
+    get(balancer, upstream)
+    clock.now = 10.0
+    # readmitted, but failing again right away
+    get(balancer, upstream)
+
+    clock.now = 29.0
+    assert not balancer.stats()[0]["healthy"]
+    clock.now = 30.0
+    assert balancer.stats()[0]["healthy"]
+    assert balancer.stats()[0]["ejections"] == 2
+
+
+def test_fails_open_when_every_endpoint_is_ejected(clock):
+    balancer = LoadBalancer(URLS, {"failure_threshold": 1, "ejection_duration": 10.0})
+    upstream = Upstream(clock, **{"replica-a": 503, "replica-b": 503})
+    get(balancer, upstream)
+    clock.now = 1.0
+    get(balancer, upstream)
+    assert not any(endpoint["healthy"] for endpoint in balancer.stats())
+
+    # replica-a's ejection expires first, so it is tried despite being ejected
+    upstream.statuses = {}
+    assert get(balancer, upstream) == 200
+    assert upstream.hosts[-1] == "replica-a"
+    replica_a, replica_b = balancer.stats()
+    assert replica_a["healthy"] and not replica_b["healthy"]
+
+
+def test_transport_errors_count_as_failures(clock):
+    balancer = LoadBalancer(URLS, {"failure_threshold": 1})
+
+    def refuse(cfg: typing.Any) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        get(balancer, refuse)
+
+    replica_a, _ = balancer.stats()
+    assert replica_a["failures"] == 1 and not replica_a["healthy"]
+    assert replica_a["outstanding"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedges_are_sent_to_another_endpoint():
+    hosts: typing.List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if request.url.host == "replica-a":
+            await asyncio.sleep(0.2)
+        return httpx.Response(200, json=PET)
+
+    client = AsyncClient(
+        api_key="API_KEY",
+        base_url=URLS,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedging={"initial_delay": 0.01, "min_delay": 0.01},
+    )
+
+    pet = await client.pet.get(pet_id=1)
+
+    assert pet.name == "doggie"
+    assert hosts == ["replica-a", "replica-b"]
+    assert client._base_client.hedge_stats()["hedge_wins"] == 1
+    replica_a, replica_b = client._base_client.load_balancer_stats()["default"]
+    # the losing request was cancelled, which is not held against its endpoint
+    assert replica_a["outstanding"] == 0 and replica_a["failures"] == 0
+    assert replica_a["healthy"] and replica_b["requests"] == 1
+
+
+def test_base_url_must_not_be_empty():
+    with pytest.raises(ValueError):
+        _get_base_url(base_url=[], environment=Environment.ENVIRONMENT)
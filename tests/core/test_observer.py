@@ -0,0 +1,58 @@
+import logging
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient, Client, NotFoundError
+from local_api_16_py.core import RequestTiming
+
+PET = {"id": 1, "name": "doggie", "photoUrls": []}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/404"):
+        return httpx.Response(404, json={"message": "not found"})
+    return httpx.Response(200, json=PET)
+
+
+def broken(timing: RequestTiming) -> None:
+    raise RuntimeError("observer failed")
+
+
+def test_failing_observer_does_not_affect_the_request(caplog):
+    seen: typing.List[RequestTiming] = []
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        observers=[broken, seen.append],
+    )
+
+    with caplog.at_level(logging.ERROR, logger="local_api_16_py.core.observer"):
+        assert client.pet.get(pet_id=1).name == "doggie"
+        # the API error is raised rather than the observer's exception
+        with pytest.raises(NotFoundError):
+            client.pet.get(pet_id=404)
+
+    assert [timing["status_code"] for timing in seen] == [200, 404]
+    assert isinstance(seen[1]["error"], NotFoundError)
+    failures = [r for r in caplog.records if "request observer" in r.getMessage()]
+    assert len(failures) == 2
+    assert failures[0].exc_info is not None
+
+
+@pytest.mark.asyncio
+async def test_failing_observer_does_not_affect_the_async_request(caplog):
+    seen: typing.List[RequestTiming] = []
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        observers=[broken, seen.append],
+    )
+
+    with caplog.at_level(logging.ERROR, logger="local_api_16_py.core.observer"):
+        with pytest.raises(NotFoundError):
+            await client.pet.get(pet_id=404)
+
+    assert len(seen) == 1
+    assert "observer failed" in caplog.text
@@ -0,0 +1,88 @@
+import http.server
+import threading
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient, Client
+from local_api_16_py.core import get_pool_stats
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> typing.Iterator[str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+EMPTY = {"connections": 0, "in_use": 0, "idle": 0, "http2": 0}
+ONE_IDLE = {"connections": 1, "in_use": 0, "idle": 1, "http2": 0}
+
+
+def test_pool_stats_counts_idle_and_in_use_connections(base_url):
+    client = Client(api_key="API_KEY", base_url=base_url)
+    assert client.pool_stats() == EMPTY
+
+    client.store.inventory.list()
+    assert client.pool_stats() == ONE_IDLE
+
+    httpx_client = client._base_client.httpx_client
+    with httpx_client.stream("GET", f"{base_url}/store/inventory") as first:
+        with httpx_client.stream("GET", f"{base_url}/store/inventory") as second:
+            assert client.pool_stats() == {
+                "connections": 2,
+                "in_use": 2,
+                "idle": 0,
+                "http2": 0,
+            }
+            second.read()
+        first.read()
+    assert client.pool_stats()["idle"] == 2
+
+    httpx_client.close()
+    assert client.pool_stats() == EMPTY
+
+
+@pytest.mark.asyncio
+async def test_async_pool_stats(base_url):
+    client = AsyncClient(api_key="API_KEY", base_url=base_url)
+
+    await client.store.inventory.list()
+    assert client.pool_stats() == ONE_IDLE
+    await client._base_client.httpx_client.aclose()
+
+
+def test_pool_stats_include_mounts(base_url):
+    client = httpx.Client(mounts={"http://127.0.0.1": httpx.HTTPTransport()})
+
+    client.get(f"{base_url}/store/inventory")
+    assert get_pool_stats(client)["idle"] == 1
+    client.close()
+
+
+def test_pool_stats_without_pool():
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200))
+    )
+
+    client.get("http://example.com")
+    assert get_pool_stats(client) == EMPTY
@@ -0,0 +1,172 @@
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import Client, RateLimitedError
+from local_api_16_py.core import RateLimiter, base_client, rate_limit
+
+OPERATION = "GET /pet/{petId}"
+NOW = 1_700_000_000.0
+
+
+class Clock:
+    """Stands in for the `time` module of the rate limiter"""
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+
+    def monotonic(self) -> float:
+        return self.elapsed
+
+    def time(self) -> float:
+        return NOW + self.elapsed
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def response(status_code: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status_code, headers={k.replace("_", "-"): v for k, v in headers.items()}
+    )
+
+
+def reserve_many(limiter: RateLimiter, count: int) -> typing.List[float]:
+    return [limiter.reserve(OPERATION) for _ in range(count)]
+
+
+def test_default_config_does_not_pace_without_headers(clock):
+    limiter = RateLimiter({})
+    limiter.observe(OPERATION, response())
+
+    assert reserve_many(limiter, 5) == [0.0] * 5
+
+
+def test_remaining_budget_is_spread_over_the_window(clock):
+    limiter = RateLimiter({})
+    limiter.observe(
+        OPERATION, response(X_RateLimit_Remaining="10", X_RateLimit_Reset="5")
+    )
+
+    # 10 requests left for 5 seconds, one every 0.5 seconds
+    assert reserve_many(limiter, 4) == [0.0, 0.5, 1.0, 1.5]
+    assert limiter.stats() == {"requests": 4, "delayed": 3, "total_delay": 3.0}
+
+
+def test_reset_given_as_unix_timestamp(clock):
+    limiter = RateLimiter({})
+    limiter.observe(
+        OPERATION,
+        response(X_RateLimit_Remaining="2", X_RateLimit_Reset=str(int(NOW + 4))),
+    )
+
+    assert reserve_many(limiter, 3) == [0.0, 2.0, 4.0]
+
+
+def test_exhausted_budget_pauses_until_reset(clock):
+    limiter = RateLimiter({})
+    limiter.observe(
+        OPERATION, response(X_RateLimit_Remaining="0", X_RateLimit_Reset="3")
+    )
+
+    assert limiter.reserve(OPERATION) == 3.0
+    clock.elapsed = 3.0
+    assert limiter.reserve(OPERATION) == 0.0
+
+
+def test_elapsed_window_restores_the_configured_rate(clock):
+    limiter = RateLimiter({"rate": 10})
+    limiter.observe(
+        OPERATION, response(X_RateLimit_Remaining="1", X_RateLimit_Reset="10")
+    )
+    assert reserve_many(limiter, 2) == [0.0, 10.0]
+
+    limiter.observe(
+        OPERATION, response(X_RateLimit_Remaining="100", X_RateLimit_Reset="0")
+    )
+    clock.elapsed = 20.0
+    assert reserve_many(limiter, 2) == [0.0, pytest.approx(0.1)]
+
+
+def test_too_many_requests_pauses_for_retry_after(clock):
+    limiter = RateLimiter({})
+    limiter.observe(OPERATION, response(429, Retry_After="7"))
+
+    assert limiter.reserve(OPERATION) == 7.0
+    clock.elapsed = 7.0
+    assert limiter.reserve(OPERATION) == 0.0
+
+
+def test_headers_adapt_the_operation_budget(clock):
+    limiter = RateLimiter({"operations": {OPERATION: {"rate": 100}}})
+    limiter.observe(OPERATION, response(429, Retry_After="2"))
+
+    assert limiter.reserve(OPERATION) == 2.0
+    assert limiter.reserve("GET /store/inventory") == 0.0
+
+
+def test_headers_are_ignored_unless_adaptive(clock):
+    limiter = RateLimiter({"adaptive": False})
+    limiter.observe(OPERATION, response(429, Retry_After="7"))
+    limiter.observe(
+        OPERATION, response(X_RateLimit_Remaining="0", X_RateLimit_Reset="3")
+    )
+
+    assert limiter.reserve(OPERATION) == 0.0
+
+
+def test_client_paces_requests_after_a_429(monkeypatch, clock):
+    slept: typing.List[float] = []
+    monkeypatch.setattr(base_client.time, "sleep", slept.append)
+    responses = [
+        httpx.Response(429, headers={"retry-after": "3"}),
+        httpx.Response(200, json={"id": 1, "name": "doggie", "photoUrls": []}),
+    ]
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        ),
+        retry_policy={"max_attempts": 1},
+        rate_limit={},
+    )
+
+    with pytest.raises(RateLimitedError):
+        client.pet.get(pet_id=1)
+    assert slept == []
+    # the next request waits out the Retry-After of the 429
+    assert client.pet.get(pet_id=1).name == "doggie"
+    assert slept == [3.0]
+    assert client._base_client.rate_limit_stats() == {
+        "requests": 2,
+        "delayed": 1,
+        "total_delay": 3.0,
+    }
+
+
+def test_streams_are_paced_like_other_requests(monkeypatch, clock):
+    slept: typing.List[float] = []
+    monkeypatch.setattr(base_client.time, "sleep", slept.append)
+    responses = [
+        httpx.Response(429, headers={"retry-after": "3"}),
+        httpx.Response(200, json=[{"id": 1, "name": "doggie", "photoUrls": []}]),
+    ]
+    client = Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        ),
+        retry_policy={"max_attempts": 1},
+        rate_limit={},
+    )
+
+    with pytest.raises(RateLimitedError):
+        client.pet.find_by_status_iter(status="available")
+    with client.pet.find_by_status_iter(status="available") as pets:
+        assert [pet.name for pet in pets] == ["doggie"]
+    assert slept == [3.0]
@@ -0,0 +1,78 @@
+import typing
+
+import pydantic
+import pytest
+import typing_extensions
+
+from local_api_16_py.core import request
+from local_api_16_py.core.request import set_primitive_fast_path, to_encodable
+from local_api_16_py.types import params
+
+
+@pytest.fixture
+def fast_path():
+    set_primitive_fast_path(True)
+    yield
+    set_primitive_fast_path(False)
+
+
+Status = typing_extensions.Literal["available", "pending", "sold"]
+
+
+@pytest.mark.parametrize(
+    "item,dump_with",
+    [
+        ("doggie", str),
+        (10, int),
+        (1.5, float),
+        (True, bool),
+        ("sold", Status),
+        (2, typing_extensions.Literal[1, 2]),
+    ],
+)
+def test_fast_path_round_trips(fast_path, item, dump_with):
+    encoded = to_encodable(item=item, dump_with=dump_with)
+
+    assert encoded == item
+    assert type(encoded) is type(item)
+    set_primitive_fast_path(False)
+    assert to_encodable(item=item, dump_with=dump_with) == encoded
+
+
+@pytest.mark.parametrize(
+    "item,dump_with",
+    [
+        ("unknown", Status),
+        (2, typing_extensions.Literal[1]),
+        ("ten", int),
+    ],
+)
+def test_fast_path_still_validates_invalid_items(fast_path, item, dump_with):
+    with pytest.raises(pydantic.ValidationError):
+        to_encodable(item=item, dump_with=dump_with)
+
+
+def test_fast_path_coerces_like_validation(fast_path):
+    # not exactly an int, so validated (and coerced) as usual
+    assert to_encodable(item=True, dump_with=int) == 1
+    assert to_encodable(item="10", dump_with=int) == 10
+
+
+def test_fast_path_skips_validation(fast_path, monkeypatch):
+    def fail(type_: typing.Any) -> None:
+        raise AssertionError("validated")
+
+    monkeypatch.setattr(request.request_encoders, "get", fail)
+
+    assert to_encodable(item="doggie", dump_with=str) == "doggie"
+    assert to_encodable(item="sold", dump_with=Status) == "sold"
+    with pytest.raises(AssertionError):
+        to_encodable(item=[1], dump_with=typing.List[int])
+
+
+def test_fast_path_ignores_models(fast_path):
+    encoded = to_encodable(
+        item={"name": "doggie", "photo_urls": []}, dump_with=params._SerializerPet
+    )
+
+    assert encoded == {"name": "doggie", "photoUrls": []}
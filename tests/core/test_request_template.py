@@ -0,0 +1,131 @@
+import json
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py.core import AuthKey, RequestTemplate, SyncBaseClient
+from local_api_16_py.core.base_client import _DEFAULT_SERVICE_NAME
+
+
+def test_url_substitutes_path_params():
+    template = RequestTemplate(
+        method="GET",
+        path="/store/{storeId}/order/{orderId}",
+        base_url="https://api.example.com/v1/",
+    )
+
+    assert (
+        template.url({"storeId": 1, "orderId": "a b"})
+        == "https://api.example.com/v1/store/1/order/a b"
+    )
+    assert template.url({"orderId": 2, "storeId": 3, "extra": 4}).endswith(
+        "/store/3/order/2"
+    )
+
+
+def test_url_static_path():
+    static = RequestTemplate(
+        method="GET", path="store/inventory", base_url="https://api.example.com/"
+    )
+    assert static.url() == "https://api.example.com/store/inventory"
+
+
+def test_url_missing_path_param_raises():
+    template = RequestTemplate(
+        method="GET", path="/pet/{petId}", base_url="https://api.example.com"
+    )
+
+    with pytest.raises(KeyError):
+        template.url({})
+
+
+def test_build_merges_headers_params_and_auth():
+    template = RequestTemplate(
+        method="POST",
+        path="/pet/{petId}",
+        base_url="https://api.example.com",
+        auth_names=("api_key", "missing"),
+        headers={"x-static": "1", "x-overridden": "static"},
+    )
+
+    cfg = template.build(
+        auths={"api_key": AuthKey(name="api_key", location="header", val="secret")},
+        opts={
+            "additional_headers": {"x-extra": "3"},
+            "additional_params": {"page": 2},
+            "timeout": 5,
+        },
+        path_params={"petId": 10},
+        query_params={"status": "sold"},
+        headers={"x-overridden": "call"},
+        json={"name": "doggie"},
+    )
+
+    assert cfg["method"] == "POST"
+    assert cfg["url"] == "https://api.example.com/pet/10"
+    assert cfg["headers"] == {
+        "api_key": "secret",
+        "x-static": "1",
+        "x-overridden": "call",
+        "x-extra": "3",
+        "content-type": "application/json",
+    }
+    assert cfg["params"] == {"status": "sold", "page": 2}
+    assert json.loads(cfg["content"]) == {"name": "doggie"}
+    assert cfg["timeout"] == 5
+    # the template is left untouched by the call
+    assert template.headers == {"x-static": "1", "x-overridden": "static"}
+
+
+def build_client(**kwargs: typing.Any) -> SyncBaseClient:
+    return SyncBaseClient(
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(),
+        **kwargs,
+    )
+
+
+def test_request_template_is_reused():
+    client = build_client()
+
+    first = client.request_template(method="GET", path="/pet/{petId}")
+    assert client.request_template(method="GET", path="/pet/{petId}") is first
+    assert first.headers == {"x-sideko-sdk-language": "Python"}
+
+
+def test_request_template_picks_up_default_headers():
+    class TracingClient(SyncBaseClient):
+        request_id = "1"
+
+        def default_headers(self) -> typing.Dict[str, str]:
+            return {**super().default_headers(), "x-request-id": self.request_id}
+
+    client = TracingClient(
+        base_url="https://api.example.com", httpx_client=httpx.Client()
+    )
+    first = client.build_request(
+        method="GET", path="/pet/{petId}", path_params={"petId": 1}
+    )
+    client.request_id = "2"
+    second = client.build_request(
+        method="GET", path="/pet/{petId}", path_params={"petId": 1}
+    )
+
+    assert first["headers"]["x-request-id"] == "1"
+    assert second["headers"]["x-request-id"] == "2"
+
+
+def test_request_template_picks_up_base_url_changes():
+    client = build_client()
+    first = client.build_request(
+        method="GET", path="/pet/{petId}", path_params={"petId": 1}
+    )
+
+    client._base_url[_DEFAULT_SERVICE_NAME] = "https://replica.example.com/"
+    second = client.build_request(
+        method="GET", path="/pet/{petId}", path_params={"petId": 1}
+    )
+
+    assert first["url"] == "https://api.example.com/pet/1"
+    assert second["url"] == "https://replica.example.com/pet/1"
@@ -0,0 +1,61 @@
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from local_api_16_py import Client
+from local_api_16_py.core.response import from_json
+from local_api_16_py.types import models
+
+PET = '{"name": "Zoë", "photoUrls": ["a.png"]}'
+
+
+def test_from_json_bytes_and_str():
+    for content in (PET, PET.encode("utf-8")):
+        pet = from_json(content=content, load_with=models.Pet)
+        assert pet.name == "Zoë"
+        assert pet.photo_urls == ["a.png"]
+
+
+def test_from_json_invalid_raises():
+    with pytest.raises(pydantic.ValidationError):
+        from_json(content=b'{"name": ', load_with=models.Pet)
+
+
+def build_client(content_type: str, content: bytes) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": content_type}, content=content
+        )
+
+    return Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.mark.parametrize(
+    "content_type,content",
+    [
+        ("application/json", PET.encode("utf-8")),
+        ("application/json; charset=utf-8", PET.encode("utf-8")),
+        ("application/json", b"\xef\xbb\xbf" + PET.encode("utf-8")),
+        ("application/json; charset=utf-8", b"\xef\xbb\xbf" + PET.encode("utf-8")),
+        ("application/json", PET.encode("utf-16")),
+        ("application/json; charset=utf-16", PET.encode("utf-16")),
+        ("application/json; charset=iso-8859-1", PET.encode("latin-1")),
+        ("application/json; charset=unknown", PET.encode("utf-8")),
+    ],
+)
+def test_process_response_decodes_charsets(content_type, content):
+    client = build_client(content_type, content)
+
+    pet = client.pet.get(pet_id=1)
+    assert isinstance(pet, models.Pet)
+    assert pet.name == "Zoë"
+
+    data = client._base_client.request(
+        method="GET", path="/pet/1", cast_to=type(typing.Any)
+    )
+    assert data == {"name": "Zoë", "photoUrls": ["a.png"]}
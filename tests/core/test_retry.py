@@ -0,0 +1,249 @@
+import datetime
+import email.utils
+import io
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py import AsyncClient, Client, ServerError
+from local_api_16_py.core import base_client
+from local_api_16_py.core.request import is_replayable
+from local_api_16_py.core.retry import parse_retry_after
+
+PET = {"id": 1, "name": "doggie", "photoUrls": []}
+NO_JITTER = {"jitter": False, "initial_delay": 0.5, "multiplier": 2.0}
+
+
+class Upstream:
+    """Replays a script of responses (or exceptions) and records each request"""
+
+    def __init__(self, *outcomes: typing.Union[int, httpx.Response, Exception]):
+        self.outcomes = list(outcomes)
+        self.requests: typing.List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        request.read()
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, int):
+            return httpx.Response(outcome, json=PET if outcome == 200 else {})
+        return outcome
+
+
+@pytest.fixture
+def delays(monkeypatch) -> typing.List[float]:
+    slept: typing.List[float] = []
+
+    async def asleep(delay: float) -> None:
+        slept.append(delay)
+
+    monkeypatch.setattr(base_client.time, "sleep", slept.append)
+    monkeypatch.setattr(base_client.asyncio, "sleep", asleep)
+    return slept
+
+
+def build_client(upstream: Upstream, **kwargs: typing.Any) -> Client:
+    return Client(
+        api_key="API_KEY",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(upstream)),
+        **kwargs,
+    )
+
+
+def test_retries_with_exponential_backoff(delays):
+    upstream = Upstream(503, 502, 200)
+    client = build_client(upstream, retry_policy=NO_JITTER)
+
+    assert client.pet.get(pet_id=1).name == "doggie"
+    assert len(upstream.requests) == 3
+    assert delays == [0.5, 1.0]
+    assert client._base_client.retry_stats() == {
+        "retries": 2,
+        "retried_requests": 1,
+        "recovered": 1,
+        "exhausted": 0,
+    }
+
+
+def test_backoff_is_capped_and_jittered(delays):
+    upstream = Upstream(503)
+    client = build_client(
+        upstream,
+        retry_policy={"max_attempts": 5, "initial_delay": 1.0, "max_delay": 2.0},
+    )
+
+    with pytest.raises(ServerError):
+        client.pet.get(pet_id=1)
+    assert len(upstream.requests) == 5
+    assert len(delays) == 4
+    assert all(0 <= delay <= cap for delay, cap in zip(delays, [1.0, 2.0, 2.0, 2.0]))
+    assert client._base_client.retry_stats()["exhausted"] == 1
+
+
+def test_retry_after_seconds(delays):
+    upstream = Upstream(httpx.Response(429, headers={"retry-after": "2"}), 200)
+    client = build_client(upstream, retry_policy=NO_JITTER)
+
+    client.pet.get(pet_id=1)
+    assert delays == [2.0]
+
+
+def test_retry_after_http_date(delays):
+    retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        seconds=4
+    )
+    header = email.utils.format_datetime(retry_at, usegmt=True)
+    upstream = Upstream(httpx.Response(503, headers={"retry-after": header}), 200)
+    client = build_client(upstream, retry_policy=NO_JITTER)
+
+    client.pet.get(pet_id=1)
+    assert len(delays) == 1
+    assert 2 < delays[0] <= 4
+
+
+def test_retry_after_beyond_max_delay_is_not_retried(delays):
+    upstream = Upstream(httpx.Response(503, headers={"retry-after": "60"}), 200)
+    client = build_client(upstream, retry_policy={"max_delay": 8.0})
+
+    with pytest.raises(ServerError):
+        client.pet.get(pet_id=1)
+    assert len(upstream.requests) == 1
+    assert delays == []
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after(" 7 ") == 7.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_retries_transport_exceptions(delays):
+    upstream = Upstream(httpx.ConnectError("refused"), httpx.ReadTimeout("slow"), 200)
+    client = build_client(upstream, retry_policy=NO_JITTER)
+
+    assert client.pet.get(pet_id=1).name == "doggie"
+    assert len(upstream.requests) == 3
+    assert delays == [0.5, 1.0]
+
+
+def test_other_exceptions_are_not_retried(delays):
+    upstream = Upstream(httpx.UnsupportedProtocol("ftp"), 200)
+    client = build_client(upstream)
+
+    with pytest.raises(httpx.UnsupportedProtocol):
+        client.pet.get(pet_id=1)
+    assert len(upstream.requests) == 1
+
+
+def test_request_options_override_policy(delays):
+    upstream = Upstream(503, 200)
+    client = build_client(upstream)
+
+    with pytest.raises(ServerError):
+        client.pet.get(pet_id=1, request_options={"retry": {"max_attempts": 1}})
+    assert len(upstream.requests) == 1
+    assert client._base_client.retry_stats()["retries"] == 0
+
+
+def test_non_idempotent_methods_are_not_retried(delays):
+    upstream = Upstream(503, 200)
+    client = build_client(upstream)
+
+    with pytest.raises(ServerError):
+        client.pet.create(name="doggie", photo_urls=[])
+    assert len(upstream.requests) == 1
+
+
+def test_replayable_bodies_are_retried_when_opted_in(delays):
+    upstream = Upstream(503, 200)
+    client = build_client(
+        upstream, retry_policy={**NO_JITTER, "retry_methods": {"POST"}}
+    )
+
+    client.pet.upload_image(pet_id=1, data=b"image")
+    assert [request.content for request in upstream.requests] == [b"image", b"image"]
+
+
+def test_consumed_iterator_bodies_are_not_retried(delays):
+    upstream = Upstream(503, 200)
+    client = build_client(
+        upstream, retry_policy={**NO_JITTER, "retry_methods": {"POST"}}
+    )
+
+    with pytest.raises(ServerError):
+        client.pet.upload_image(pet_id=1, data=iter([b"ima", b"ge"]))
+    assert len(upstream.requests) == 1
+    assert upstream.requests[0].content == b"image"
+
+
+def test_file_sequences_are_retried_when_seekable(delays):
+    upstream = Upstream(503, 200)
+    client = build_client(
+        upstream, retry_policy={**NO_JITTER, "retry_methods": {"POST"}}
+    )
+
+    client._base_client.request(
+        method="post",
+        path="/pet/1/uploadImage",
+        cast_to=dict,
+        files=[("file", b"first"), ("file", ("b.bin", io.BytesIO(b"second")))],
+    )
+    assert len(upstream.requests) == 2
+    for request in upstream.requests:
+        assert b"first" in request.content and b"second" in request.content
+
+
+def test_is_replayable_file_sequences():
+    url = "https://example.com/upload"
+    assert is_replayable(
+        {"method": "post", "url": url, "files": [("file", b"x"), ("file", "y")]}
+    )
+    assert not is_replayable(
+        {"method": "post", "url": url, "files": [("file", iter([b"x"]))]}
+    )
+
+
+def test_streams_are_retried_until_the_response_arrives(delays):
+    upstream = Upstream(
+        httpx.ConnectError("refused"), 503, httpx.Response(200, json=[PET])
+    )
+    client = build_client(upstream, retry_policy=NO_JITTER)
+
+    with client.pet.find_by_status_iter(status="available") as pets:
+        assert [pet.name for pet in pets] == ["doggie"]
+    assert len(upstream.requests) == 3
+    assert delays == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_async_retries(delays):
+    upstream = Upstream(httpx.ConnectError("refused"), 503, 200)
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+        retry_policy=NO_JITTER,
+    )
+
+    assert (await client.pet.get(pet_id=1)).name == "doggie"
+    assert len(upstream.requests) == 3
+    assert delays == [0.5, 1.0]
+    assert client._base_client.retry_stats()["recovered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_streams_are_retried_until_the_response_arrives(delays):
+    upstream = Upstream(503, httpx.Response(200, json=[PET]))
+    client = AsyncClient(
+        api_key="API_KEY",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+        retry_policy=NO_JITTER,
+    )
+
+    async with await client.pet.find_by_status_iter(status="available") as pets:
+        assert [pet.name async for pet in pets] == ["doggie"]
+    assert len(upstream.requests) == 2
+    assert delays == [0.5]
@@ -0,0 +1,112 @@
+import contextlib
+import typing
+
+import httpx
+import pydantic
+
+from local_api_16_py.core import SSEDecoder, StreamResponse
+
+
+def feed_all(decoder: SSEDecoder, chunks: typing.List[bytes]) -> typing.List[dict]:
+    events = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return events
+
+
+def test_crlf_split_across_chunks():
+    decoder = SSEDecoder()
+
+    assert decoder.feed(b"data: a\r") == []
+    assert decoder.feed(b"\ndata: b\r") == []
+    events = decoder.feed(b"\n\r") + decoder.feed(b"\n")
+
+    assert [event["data"] for event in events] == ["a\nb"]
+    assert decoder.flush() == []
+
+
+def test_every_line_ending_and_byte_by_byte():
+    stream = b"data: 1\r\n\r\ndata: 2\n\ndata: 3\r\rdata: 4\n"
+    chunked = feed_all(SSEDecoder(), [stream])
+    bytewise = feed_all(SSEDecoder(), [bytes([b]) for b in stream])
+
+    assert [event["data"] for event in chunked] == ["1", "2", "3", "4"]
+    assert bytewise == chunked
+
+
+def test_multi_line_data_and_comments():
+    events = feed_all(
+        SSEDecoder(),
+        [b": keep-alive\n", b"data: first\n:comment\ndata:second\ndata\n\n"],
+    )
+
+    assert events == [
+        {"event": None, "data": "first\nsecond\n", "id": None, "retry": None}
+    ]
+
+
+def test_event_type_is_reset_after_dispatch():
+    events = feed_all(
+        SSEDecoder(), [b"event: update\ndata: 1\n\nevent: ignored\n\ndata: 2\n\n"]
+    )
+
+    assert [(event["event"], event["data"]) for event in events] == [
+        ("update", "1"),
+        (None, "2"),
+    ]
+
+
+def test_id_persists_and_is_reset():
+    decoder = SSEDecoder()
+    events = feed_all(
+        decoder,
+        [b"id: 1\ndata: a\n\ndata: b\n\nid: bad\0id\ndata: c\n\nid\ndata: d\n\n"],
+    )
+
+    assert [event["id"] for event in events] == ["1", "1", "1", ""]
+    assert decoder.last_event_id == ""
+
+
+def test_retry_only_accepts_ascii_digits():
+    decoder = SSEDecoder()
+    events = feed_all(
+        decoder,
+        [b"retry: 3000\ndata: a\n\nretry: 10s\nretry: \xc2\xb2\ndata: b\n\n"],
+    )
+
+    assert [event["retry"] for event in events] == [3000, 3000]
+    assert decoder.retry == 3000
+
+
+class Message(pydantic.BaseModel):
+    id: int
+    text: str
+
+
+class Envelope(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+    data: Message
+
+
+def test_stream_response_keeps_metadata_out_of_payload():
+    body = (
+        b'id: evt-1\nevent: message\nretry: 500\ndata: {"id": 1, "text": "a"}\n\n'
+        b'data: {"id": 2, "text": "b"}\n\n'
+    )
+    response = httpx.Response(200, content=body)
+    stream = StreamResponse(response, contextlib.nullcontext(), Envelope)
+
+    first = next(stream)
+    assert first == Envelope(data=Message(id=1, text="a"))
+    assert stream.event is not None
+    assert stream.event["event"] == "message"
+    assert stream.event["id"] == "evt-1"
+    assert stream.event["retry"] == 500
+
+    second = next(stream)
+    assert second == Envelope(data=Message(id=2, text="b"))
+    assert stream.event["event"] is None
+    assert stream.last_event_id == "evt-1"
+    assert list(stream) == []
@@ -0,0 +1,85 @@
+import io
+import os
+import threading
+import typing
+
+import httpx
+import pytest
+
+from local_api_16_py.core import AsyncFileStream, FileStream
+
+PAYLOAD = os.urandom(300 * 1024)
+
+
+def open_pipe(payload: bytes) -> typing.BinaryIO:
+    """Returns the read end of a pipe a background thread writes `payload` to"""
+    pipe_r, pipe_w = os.pipe()
+
+    def write() -> None:
+        with os.fdopen(pipe_w, "wb") as writer:
+            writer.write(payload)
+
+    threading.Thread(target=write, daemon=True).start()
+    return os.fdopen(pipe_r, "rb")
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "length": len(request.read()),
+            "content_length": request.headers.get("content-length"),
+        },
+    )
+
+
+def test_pipe_is_streamed_without_content_length():
+    with open_pipe(PAYLOAD) as pipe:
+        stream = FileStream(pipe, chunk_size=16 * 1024)
+        assert stream.content_length is None
+        assert stream.headers() == {}
+        assert not stream.replayable
+
+        client = httpx.Client(transport=httpx.MockTransport(echo))
+        response = client.post("https://api.example.com/upload", content=stream)
+
+    assert response.json() == {"length": len(PAYLOAD), "content_length": None}
+
+
+@pytest.mark.asyncio
+async def test_async_pipe_is_streamed_without_content_length():
+    with open_pipe(PAYLOAD) as pipe:
+        stream = AsyncFileStream(pipe)
+        assert stream.content_length is None
+        assert b"".join([chunk async for chunk in stream]) == PAYLOAD
+
+
+def test_fifo_path_has_no_content_length(tmp_path):
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+
+    def write() -> None:
+        with open(fifo, "wb") as writer:
+            writer.write(PAYLOAD)
+
+    threading.Thread(target=write, daemon=True).start()
+    stream = FileStream(fifo)
+
+    assert stream.content_length is None
+    assert b"".join(stream) == PAYLOAD
+
+
+def test_regular_files_report_their_remaining_length(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(PAYLOAD)
+
+    with open(path, "rb") as file:
+        file.seek(1000)
+        stream = FileStream(file)
+        assert stream.content_length == len(PAYLOAD) - 1000
+        assert b"".join(stream) == PAYLOAD[1000:]
+        # rewound when sent again
+        assert b"".join(stream) == PAYLOAD[1000:]
+
+    assert FileStream(path).content_length == len(PAYLOAD)
+    assert FileStream(io.BytesIO(PAYLOAD)).content_length == len(PAYLOAD)
@@ -1,11 +1,18 @@
+import asyncio
 import httpx
 import io
 import pydantic
 import pytest
 import typing
 
-from local_api_16_py import AsyncClient, Client
-from local_api_16_py.core import BinaryResponse
+from local_api_16_py import (
+    AsyncClient,
+    CircuitOpenError,
+    Client,
+    NotFoundError,
+    ServerError,
+)
+from local_api_16_py.core import BinaryResponse, get_json_codec
 from local_api_16_py.environment import Environment
 from local_api_16_py.types import models
 
@@ -282,6 +289,75 @@ async def test_await_create_200_success_all_params():
     assert any([is_valid_response_json, is_valid_binary]), "failed response type check"
 
 
+def test_get_many_200_success_all_params():
+    """Tests concurrent GET requests to the /pet/{petId} endpoint.
+
+    Operation: get_many
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.List[BatchResult[int, typing.Union[models.Pet, BinaryResponse]]]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Results are returned in input order
+    - Each response matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with example data
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    response = client.pet.get_many(pet_ids=[1, 2, 3])
+    assert [res.key for res in response] == [1, 2, 3], "failed result order check"
+    for res in response:
+        try:
+            pydantic.TypeAdapter(models.Pet).validate_python(res.unwrap())
+            is_valid_response_json = True
+        except pydantic.ValidationError:
+            is_valid_response_json = False
+        is_valid_binary = isinstance(res.value, BinaryResponse)
+        assert any(
+            [is_valid_response_json, is_valid_binary]
+        ), "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_get_many_200_success_all_params():
+    """Tests concurrent GET requests to the /pet/{petId} endpoint.
+
+    Operation: get_many
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.List[BatchResult[int, typing.Union[models.Pet, BinaryResponse]]]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Results are returned in input order
+    - Each response matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling async method with example data
+    client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    response = await client.pet.get_many(pet_ids=[1, 2, 3])
+    assert [res.key for res in response] == [1, 2, 3], "failed result order check"
+    for res in response:
+        try:
+            pydantic.TypeAdapter(models.Pet).validate_python(res.unwrap())
+            is_valid_response_json = True
+        except pydantic.ValidationError:
+            is_valid_response_json = False
+        is_valid_binary = isinstance(res.value, BinaryResponse)
+        assert any(
+            [is_valid_response_json, is_valid_binary]
+        ), "failed response type check"
+
+
 def test_get_200_success_all_params():
     """Tests a GET request to the /pet/{petId} endpoint.
 
@@ -587,6 +663,128 @@ async def test_await_find_by_status_200_success_all_params():
     assert any([is_valid_response_json, is_valid_binary]), "failed response type check"
 
 
+def test_find_by_tags_iter_200_success_all_params():
+    """Tests a streamed GET request to the /pet/findByTags endpoint.
+
+    Operation: find_by_tags_iter
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : JsonArrayStreamResponse[models.Pet]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Response status code is correct
+    - Each streamed item matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with example data
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    with client.pet.find_by_tags_iter(tags=["string"]) as response:
+        items = list(response)
+    try:
+        pydantic.TypeAdapter(typing.List[models.Pet]).validate_python(items)
+        is_valid_response_schema = True
+    except pydantic.ValidationError:
+        is_valid_response_schema = False
+    assert is_valid_response_schema, "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_find_by_tags_iter_200_success_all_params():
+    """Tests a streamed GET request to the /pet/findByTags endpoint.
+
+    Operation: find_by_tags_iter
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : AsyncJsonArrayStreamResponse[models.Pet]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Response status code is correct
+    - Each streamed item matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling async method with example data
+    client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    async with await client.pet.find_by_tags_iter(tags=["string"]) as response:
+        items = [item async for item in response]
+    try:
+        pydantic.TypeAdapter(typing.List[models.Pet]).validate_python(items)
+        is_valid_response_schema = True
+    except pydantic.ValidationError:
+        is_valid_response_schema = False
+    assert is_valid_response_schema, "failed response type check"
+
+
+def test_find_by_status_iter_200_success_all_params():
+    """Tests a streamed GET request to the /pet/findByStatus endpoint.
+
+    Operation: find_by_status_iter
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : JsonArrayStreamResponse[models.Pet]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Response status code is correct
+    - Each streamed item matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with example data
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    with client.pet.find_by_status_iter(status="available") as response:
+        items = list(response)
+    try:
+        pydantic.TypeAdapter(typing.List[models.Pet]).validate_python(items)
+        is_valid_response_schema = True
+    except pydantic.ValidationError:
+        is_valid_response_schema = False
+    assert is_valid_response_schema, "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_find_by_status_iter_200_success_all_params():
+    """Tests a streamed GET request to the /pet/findByStatus endpoint.
+
+    Operation: find_by_status_iter
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : AsyncJsonArrayStreamResponse[models.Pet]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Response status code is correct
+    - Each streamed item matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling async method with example data
+    client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    async with await client.pet.find_by_status_iter(status="available") as response:
+        items = [item async for item in response]
+    try:
+        pydantic.TypeAdapter(typing.List[models.Pet]).validate_python(items)
+        is_valid_response_schema = True
+    except pydantic.ValidationError:
+        is_valid_response_schema = False
+    assert is_valid_response_schema, "failed response type check"
+
+
 def test_delete_200_success_all_params():
     """Tests a DELETE request to the /pet/{petId} endpoint.
 
@@ -634,3 +832,534 @@ async def test_await_delete_200_success_all_params():
     client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
     response = await client.pet.delete(pet_id=123)
     assert isinstance(response, httpx.Response)
+
+
+def test_delete_200_success_invalidates_cache():
+    """Tests that a DELETE request to the /pet/{petId} endpoint drops the
+    cached GET response of the same pet.
+
+    Operation: delete
+    Test Case ID: success_invalidates_cache
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : httpx.Response
+
+    Validates:
+    - The pet is served from the cache before it was deleted
+    - The cached pet is fetched again after it was deleted
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with the response cache enabled
+    sent = []
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(event_hooks={"request": [sent.append]}),
+        response_cache={"ttl": 60},
+    )
+    client.pet.get(pet_id=123)
+    client.pet.get(pet_id=123)
+    stats = client._base_client.cache_stats()
+    assert stats is not None
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    response = client.pet.delete(pet_id=123)
+    assert isinstance(response, httpx.Response)
+    client.pet.get(pet_id=123)
+    stats = client._base_client.cache_stats()
+    assert stats is not None
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert [request.method for request in sent] == ["GET", "DELETE", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_await_get_200_success_coalesced():
+    """Tests concurrent identical GET requests to the /pet/{petId} endpoint
+    with request coalescing enabled.
+
+    Operation: get
+    Test Case ID: success_coalesced
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.Union[models.Pet, BinaryResponse]
+
+    Validates:
+    - Every concurrent call receives the same response
+    - A single request is sent while the other calls wait for it
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling async method concurrently with example data
+    sent = []
+    all_waiting = asyncio.Event()
+
+    async def hold(request: httpx.Request) -> None:
+        # keep the request in flight until every call joined it
+        sent.append(request)
+        await all_waiting.wait()
+
+    client = AsyncClient(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.AsyncClient(event_hooks={"request": [hold]}),
+        coalesce_requests=True,
+    )
+
+    async def release() -> None:
+        while True:
+            stats = client._base_client.coalesce_stats()
+            assert stats is not None
+            if stats["executed"] + stats["coalesced"] == 5:
+                break
+            await asyncio.sleep(0)
+        all_waiting.set()
+
+    responses, _ = await asyncio.gather(
+        asyncio.gather(*(client.pet.get(pet_id=123) for _ in range(5))),
+        asyncio.wait_for(release(), timeout=5),
+    )
+    assert all(response == responses[0] for response in responses)
+    assert client._base_client.coalesce_stats() == {"executed": 1, "coalesced": 4}
+    assert len(sent) == 1
+
+
+def test_upload_image_200_success_streamed_path(tmp_path):
+    """Tests a POST request to the /pet/{petId}/uploadImage endpoint streaming
+    a file from its path.
+
+    Operation: upload_image
+    Test Case ID: success_streamed_path
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : models.ApiResponse
+
+    Validates:
+    - The file is sent in chunks with its progress reported
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with a file path
+    image = tmp_path / "image.png"
+    image.write_bytes(b"\x89PNG" * 50_000)
+    progress: typing.List[typing.Tuple[int, typing.Optional[int]]] = []
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    response = client.pet.upload_image(
+        pet_id=123,
+        data=image,
+        upload_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    pydantic.TypeAdapter(models.ApiResponse).validate_python(response)
+    assert len(progress) > 1
+    assert progress[-1] == (200_000, 200_000)
+
+
+@pytest.mark.asyncio
+async def test_await_upload_image_200_success_streamed_async_iterator():
+    """Tests a POST request to the /pet/{petId}/uploadImage endpoint streaming
+    an async iterator of bytes.
+
+    Operation: upload_image
+    Test Case ID: success_streamed_async_iterator
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : models.ApiResponse
+
+    Validates:
+    - Every chunk of the iterator is sent
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+
+    # tests calling async method with an async iterator
+    async def chunks() -> typing.AsyncIterator[bytes]:
+        for _ in range(4):
+            yield b"\x89PNG" * 1_000
+
+    progress: typing.List[typing.Tuple[int, typing.Optional[int]]] = []
+    client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    response = await client.pet.upload_image(
+        pet_id=123,
+        data=chunks(),
+        upload_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    pydantic.TypeAdapter(models.ApiResponse).validate_python(response)
+    assert progress[-1] == (16_000, None)
+
+
+def test_get_200_success_stream_binary():
+    """Tests a GET request to the /pet/{petId} endpoint with lazily streamed
+    binary responses enabled.
+
+    Operation: get
+    Test Case ID: success_stream_binary
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.Union[models.Pet, BinaryResponse]
+
+    Validates:
+    - JSON responses are still read and decoded as usual
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with example data
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    response = client.pet.get(pet_id=123, request_options={"stream_binary": True})
+    pydantic.TypeAdapter(models.Pet).validate_python(response)
+
+
+@pytest.mark.asyncio
+async def test_await_get_200_success_stream_binary_spilled(tmp_path):
+    """Tests a GET request to the /pet/{petId} endpoint returning a binary body
+    larger than the spill threshold.
+
+    Operation: get
+    Test Case ID: success_stream_binary_spilled
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.Union[models.Pet, BinaryResponse]
+
+    Validates:
+    - The body is not read until it is consumed
+    - The buffered body is spilled to a temporary file
+    - The body can be written out to a path
+
+    This test uses a mock transport serving a binary body.
+    """
+
+    # tests calling async method against a binary response
+    async def body() -> typing.AsyncIterator[bytes]:
+        for _ in range(16):
+            yield b"\x89PNG" * 1_000
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, headers={"content-type": "image/png"}, content=body()
+        )
+    )
+    client = AsyncClient(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.AsyncClient(transport=transport),
+    )
+    response = await client.pet.get(
+        pet_id=123, request_options={"stream_binary": True, "spill_threshold": 4_096}
+    )
+    assert isinstance(response, BinaryResponse)
+    assert not response.is_buffered
+    async with response:
+        await response.aread()
+        assert response.is_spilled
+        assert len(response.view()) == 64_000
+        assert await response.awrite_to(tmp_path / "image.png") == 64_000
+    assert (tmp_path / "image.png").read_bytes() == b"\x89PNG" * 16_000
+
+
+def test_get_404_not_found_error():
+    """Tests a GET request to the /pet/{petId} endpoint for a missing pet.
+
+    Operation: get
+    Test Case ID: not_found_error
+    Expected Status: 404
+    Mode: Synchronous execution
+
+    Response : NotFoundError
+
+    Validates:
+    - The error raised matches the response status
+    - Only the first `max_error_body_size` bytes of the body are kept
+    - The body is decoded on access
+
+    This test uses a mock transport serving error responses.
+    """
+    # tests calling sync method against an error response
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(404, json={"message": "Pet not found"})
+    )
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(transport=transport),
+        max_error_body_size=10,
+    )
+    with pytest.raises(NotFoundError) as exc_info:
+        client.pet.get(pet_id=123)
+    error = exc_info.value
+    assert error.status_code == 404
+    assert error.truncated
+    assert error.content == b'{"message"'
+    assert error.body is None
+
+
+def test_get_404_not_found_error_whole_body():
+    """Tests a GET request to the /pet/{petId} endpoint for a missing pet
+    with a large error body.
+
+    Operation: get
+    Test Case ID: not_found_error_whole_body
+    Expected Status: 404
+    Mode: Synchronous execution
+
+    Response : NotFoundError
+
+    Validates:
+    - The whole body is kept by default
+    - The body is decoded on access
+
+    This test uses a mock transport serving error responses.
+    """
+    # tests calling sync method against a large error response
+    details = ["Pet not found"] * 10_000
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(404, json={"details": details})
+    )
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(transport=transport),
+    )
+    with pytest.raises(NotFoundError) as exc_info:
+        client.pet.get(pet_id=123)
+    error = exc_info.value
+    assert len(error.content) > 64 * 1024
+    assert not error.truncated
+    assert error.body == {"details": details}
+
+
+def test_get_503_circuit_open_error():
+    """Tests GET requests to the /pet/{petId} endpoint while the upstream fails.
+
+    Operation: get
+    Test Case ID: circuit_open_error
+    Expected Status: 503
+    Mode: Synchronous execution
+
+    Response : CircuitOpenError
+
+    Validates:
+    - The circuit opens once enough requests failed
+    - Requests fail fast without being sent while the circuit is open
+    - The circuit's state can be inspected
+
+    This test uses a mock transport serving error responses.
+    """
+    # tests calling sync method against a failing upstream
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503, json={"message": "Service unavailable"})
+
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_policy={"max_attempts": 1},
+        circuit_breaker={"min_calls": 3, "failure_rate": 0.5},
+    )
+    for _ in range(3):
+        with pytest.raises(ServerError):
+            client.pet.get(pet_id=123)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.pet.get(pet_id=123)
+    assert exc_info.value.circuit == "default"
+    assert exc_info.value.retry_after > 0
+    assert len(requests) == 3
+    state = client._base_client.circuit_breaker_states()["default"]
+    assert state["state"] == "open"
+    assert state["rejected"] == 1
+
+
+def test_get_200_success_load_balanced():
+    """Tests GET requests to the /pet/{petId} endpoint spread across replicas.
+
+    Operation: get
+    Test Case ID: success_load_balanced
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.Union[models.Pet, BinaryResponse]
+
+    Validates:
+    - Requests are spread across the base URLs
+    - Requests failing on one replica are retried on another
+    - A replica failing repeatedly is ejected
+
+    This test uses a mock transport with one failing replica.
+    """
+    # tests calling sync method against several base URLs
+    hosts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if request.url.host == "replica-b":
+            return httpx.Response(503, json={"message": "Service unavailable"})
+        return httpx.Response(200, json={"id": 10, "name": "doggie", "photoUrls": []})
+
+    client = Client(
+        api_key="API_KEY",
+        base_url=["https://replica-a/api/v3", "https://replica-b/api/v3"],
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_policy={"initial_delay": 0},
+        load_balancing={"failure_threshold": 2},
+    )
+    for _ in range(6):
+        response = client.pet.get(pet_id=123)
+        pydantic.TypeAdapter(models.Pet).validate_python(response)
+    assert hosts.count("replica-b") == 2
+    assert hosts.count("replica-a") == 6
+    replica_a, replica_b = client._base_client.load_balancer_stats()["default"]
+    assert replica_a["healthy"] and replica_a["failures"] == 0
+    assert not replica_b["healthy"] and replica_b["ejections"] == 1
+
+
+def test_find_by_status_200_success_observed():
+    """Tests a GET request to the /pet/findByStatus endpoint with an observer.
+
+    Operation: find_by_status
+    Test Case ID: success_observed
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.List[models.Pet]
+
+    Validates:
+    - Observers receive the timing of each request
+    - The timing is tagged with the operation name, status and sizes
+    - Observers can be removed
+
+    This test uses a mock transport.
+    """
+    # tests calling sync method with a request observer
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, json=[{"id": 10, "name": "doggie", "photoUrls": []}]
+        )
+    )
+    timings = []
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(transport=transport),
+        observers=[timings.append],
+    )
+    response = client.pet.find_by_status(status="available")
+    pydantic.TypeAdapter(typing.List[models.Pet]).validate_python(response)
+    assert len(timings) == 1
+    timing = timings[0]
+    assert timing["operation"] == "pet.find_by_status"
+    assert timing["method"] == "GET"
+    assert timing["path"] == "/pet/findByStatus"
+    assert timing["status_code"] == 200
+    assert timing["response_size"] == len(
+        b'[{"id":10,"name":"doggie","photoUrls":[]}]'
+    )
+    assert timing["attempts"] == 1
+    assert timing["error"] is None
+    assert {"auth", "build", "transport", "decode"} <= set(timing["phases"])
+    assert timing["duration"] >= sum(
+        timing["phases"][phase] for phase in ("auth", "build", "transport", "decode")
+    )
+
+    client._base_client.remove_observer(timings.append)
+    client.pet.find_by_status(status="available")
+    assert len(timings) == 1
+
+
+def test_create_200_success_json_codec():
+    """Tests a POST request to the /pet endpoint with each JSON backend.
+
+    Operation: create
+    Test Case ID: success_json_codec
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.Union[models.Pet, BinaryResponse]
+
+    Validates:
+    - The request body is the same whichever backend encodes it
+    - The request is sent as application/json
+    - The standard library backend is used by default
+
+    This test uses a mock transport recording the request bodies.
+    """
+    # tests calling sync method with the stdlib and fastest installed JSON backends
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"name": "doggie", "photoUrls": []})
+
+    for json_codec in ("stdlib", "auto"):
+        client = Client(
+            api_key="API_KEY",
+            environment=Environment.MOCK_SERVER,
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            json_codec=json_codec,
+        )
+        response = client.pet.create(
+            name="Zoë", photo_urls=["string"], id=10, tags=[{"id": 1}]
+        )
+        pydantic.TypeAdapter(models.Pet).validate_python(response)
+    assert requests[0].content == requests[1].content
+    assert requests[1].headers["content-type"] == "application/json"
+    # faster backends are opt-in
+    default = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    assert default._base_client._json_codec is get_json_codec("stdlib")
+
+
+@pytest.mark.asyncio
+async def test_await_get_200_success_hedged():
+    """Tests a GET request to the /pet/{petId} endpoint hedged after a slow
+    first attempt.
+
+    Operation: get
+    Test Case ID: success_hedged
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.Union[models.Pet, BinaryResponse]
+
+    Validates:
+    - A hedge is sent once the hedge delay has elapsed
+    - The hedge's response is returned and the slow request cancelled
+    - Response data matches expected schema
+
+    This test uses a mock transport whose first response is delayed.
+    """
+
+    # tests calling async method with a slow first attempt
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"id": 10, "name": "doggie", "photoUrls": []})
+
+    client = AsyncClient(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedging={"initial_delay": 0.05},
+    )
+    response = await asyncio.wait_for(client.pet.get(pet_id=123), timeout=2)
+    pydantic.TypeAdapter(models.Pet).validate_python(response)
+    assert len(calls) == 2
+    assert client._base_client.hedge_stats() == {
+        "requests": 1,
+        "hedged": 1,
+        "hedge_wins": 1,
+        "budget_exhausted": 0,
+    }
+
+    await client.pet.get(pet_id=123, request_options={"hedge": False})
+    assert client._base_client.hedge_stats()["requests"] == 1
@@ -1,3 +1,5 @@
+import asyncio
+import httpx
 import pydantic
 import pytest
 
@@ -67,3 +69,119 @@ async def test_await_list_200_success_all_params():
     except pydantic.ValidationError:
         is_valid_response_schema = False
     assert is_valid_response_schema, "failed response type check"
+
+
+def test_list_200_success_cached():
+    """Tests repeated GET requests to the /store/inventory endpoint with the
+    response cache enabled.
+
+    Operation: list
+    Test Case ID: success_cached
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : models.StoreInventoryListResponse
+
+    Validates:
+    - Cached and fetched responses are equal
+    - The second call is served from the cache without a request
+    - Callers get their own copy of the cached response
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method twice through the response cache
+    sent = []
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(event_hooks={"request": [sent.append]}),
+        response_cache={"ttl": 60},
+    )
+    first = client.store.inventory.list()
+    second = client.store.inventory.list()
+    pydantic.TypeAdapter(models.StoreInventoryListResponse).validate_python(second)
+    assert first == second
+    assert first is not second
+    stats = client._base_client.cache_stats()
+    assert stats is not None
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_await_list_200_success_cached():
+    """Tests repeated GET requests to the /store/inventory endpoint with the
+    response cache enabled.
+
+    Operation: list
+    Test Case ID: success_cached
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : models.StoreInventoryListResponse
+
+    Validates:
+    - Cached and fetched responses are equal
+    - The second call is served from the cache without a request
+    - Callers get their own copy of the cached response
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling async method twice through the response cache
+    sent = []
+
+    async def record(request: httpx.Request) -> None:
+        sent.append(request)
+
+    client = AsyncClient(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.AsyncClient(event_hooks={"request": [record]}),
+        response_cache={"ttl": 60},
+    )
+    first = await client.store.inventory.list()
+    second = await client.store.inventory.list()
+    pydantic.TypeAdapter(models.StoreInventoryListResponse).validate_python(second)
+    assert first == second
+    assert first is not second
+    stats = client._base_client.cache_stats()
+    assert stats is not None
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_await_list_200_success_rate_limited():
+    """Tests repeated GET requests to the /store/inventory endpoint with a
+    client-side rate limit.
+
+    Operation: list
+    Test Case ID: success_rate_limited
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : models.StoreInventoryListResponse
+
+    Validates:
+    - Requests beyond the burst wait for their slot
+    - Every request is accounted for in the rate limit stats
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling async method concurrently through the rate limiter
+    client = AsyncClient(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        rate_limit={"rate": 50, "burst": 2, "adaptive": False},
+    )
+    responses = await asyncio.gather(*(client.store.inventory.list() for _ in range(4)))
+    for response in responses:
+        pydantic.TypeAdapter(models.StoreInventoryListResponse).validate_python(
+            response
+        )
+    stats = client._base_client.rate_limit_stats()
+    assert stats is not None
+    assert stats["requests"] == 4
+    assert stats["delayed"] == 2
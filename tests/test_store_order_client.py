@@ -85,6 +85,7 @@ async def test_await_create_200_success_all_params():
     assert is_valid_response_schema, "failed response type check"
 
 
+
 def test_get_200_success_all_params():
     """Tests a GET request to the /store/order/{orderId} endpoint.
 
@@ -193,3 +194,74 @@ async def test_await_delete_200_success_all_params():
     client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
     response = await client.store.order.delete(order_id=123)
     assert isinstance(response, httpx.Response)
+
+
+def test_create_200_success_telemetry():
+    """Tests a POST request to the /store/order endpoint with OpenTelemetry.
+
+    Operation: create
+    Test Case ID: success_telemetry
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : models.Order
+
+    Validates:
+    - A client span is recorded with HTTP semantic attributes
+    - The span's trace context is propagated in the request headers
+    - Duration and size histograms are recorded per operation
+
+    This test uses a mock transport and in-memory exporters.
+    """
+    # tests calling sync method with telemetry enabled
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = sdk_trace.TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"id": 10, "petId": 198772, "quantity": 7, "complete": True}
+        )
+
+    client = Client(
+        api_key="API_KEY",
+        environment=Environment.MOCK_SERVER,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        telemetry={
+            "tracer_provider": tracer_provider,
+            "meter_provider": MeterProvider(metric_readers=[reader]),
+        },
+    )
+    response = client.store.order.create(data={"id": 10, "quantity": 7})
+    pydantic.TypeAdapter(models.Order).validate_python(response)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "POST /store/order"
+    assert span.attributes["code.function.name"] == "store.order.create"
+    assert span.attributes["http.request.method"] == "POST"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["server.address"] == "127.0.0.1"
+    trace_id = format(span.context.trace_id, "032x")
+    assert requests[0].headers["traceparent"].split("-")[1] == trace_id
+
+    metrics = {
+        metric.name: metric.data.data_points[0]
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    duration = metrics["http.client.request.duration"]
+    assert duration.count == 1
+    assert duration.attributes["code.function.name"] == "store.order.create"
+    assert metrics["http.client.request.body.size"].sum == len(requests[0].content)
@@ -251,6 +251,7 @@ async def test_await_create_200_success_all_params():
     assert any([is_valid_response_json, is_valid_binary]), "failed response type check"
 
 
+
 def test_get_200_success_all_params():
     """Tests a GET request to the /user/{username} endpoint.
 
@@ -530,3 +531,81 @@ async def test_await_delete_200_success_all_params():
     client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
     response = await client.user.delete(username="string")
     assert isinstance(response, httpx.Response)
+
+
+def test_create_with_list_chunked_200_success_all_params():
+    """Tests chunked POST requests to the /user/createWithList endpoint.
+
+    Operation: create_with_list_chunked
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.Iterator[BatchResult[ChunkInfo, typing.Union[models.User, BinaryResponse]]]
+
+    Validates:
+    - Every chunk is sent and reported
+    - The checkpoint covers every chunk
+    - Resuming from a complete checkpoint sends nothing
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests calling sync method with example data
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    users = [{"id": i, "username": f"user{i}"} for i in range(5)]
+    checkpoints = []
+    response = list(
+        client.user.create_with_list_chunked(
+            data=users, chunk_size=2, on_checkpoint=checkpoints.append
+        )
+    )
+    assert sorted(res.key["size"] for res in response) == [1, 2, 2]
+    assert all(res.ok for res in response)
+    assert checkpoints[-1] == {"chunk_size": 2, "completed": [0, 1, 2]}
+    resumed = client.user.create_with_list_chunked(
+        data=users, chunk_size=2, checkpoint=checkpoints[-1]
+    )
+    assert list(resumed) == []
+
+
+@pytest.mark.asyncio
+async def test_await_create_with_list_chunked_200_success_all_params():
+    """Tests chunked POST requests to the /user/createWithList endpoint.
+
+    Operation: create_with_list_chunked
+    Test Case ID: success_all_params
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.AsyncIterator[BatchResult[ChunkInfo, typing.Union[models.User, BinaryResponse]]]
+
+    Validates:
+    - Users from an async iterable are sent in chunks
+    - Each response matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+
+    # tests calling async method with example data
+    async def users():
+        for i in range(5):
+            yield {"id": i, "username": f"user{i}"}
+
+    client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    response = [
+        res
+        async for res in client.user.create_with_list_chunked(
+            data=users(), chunk_size=2, concurrency=2
+        )
+    ]
+    assert sorted(res.key["index"] for res in response) == [0, 1, 2]
+    for res in response:
+        try:
+            pydantic.TypeAdapter(models.User).validate_python(res.unwrap())
+            is_valid_response_json = True
+        except pydantic.ValidationError:
+            is_valid_response_json = False
+        is_valid_binary = isinstance(res.value, BinaryResponse)
+        assert any(
+            [is_valid_response_json, is_valid_binary]
+        ), "failed response type check"